@@ -0,0 +1,94 @@
+"""Application-wide exception handlers.
+
+Maps exceptions raised by service layers onto HTTP responses in one place so
+endpoint handlers don't need to wrap their bodies in try/except.
+"""
+
+import httpx
+import structlog
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
+
+from ae_api.services.errors import (
+    DeploymentError,
+    DeploymentResponseError,
+    SourcePathNotFoundError,
+)
+
+logger = structlog.get_logger()
+
+
+async def source_path_not_found_handler(
+    request: Request, exc: SourcePathNotFoundError
+) -> ORJSONResponse:
+    """Map missing source paths to 404."""
+    logger.warning("Source path not found", path=request.url.path, error=str(exc))
+    return ORJSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={"detail": "Source path not found"},
+    )
+
+
+async def upstream_http_error_handler(request: Request, exc: httpx.HTTPError) -> ORJSONResponse:
+    """Map failed calls to external platform APIs to 404, 422 or 502.
+
+    An upstream 404 is passed through and an upstream 400 (the platform
+    rejected the request we built from the client's input) becomes 422. Any
+    other status, including 401/403 from our own platform credentials, or a
+    transport failure is reported as a bad gateway.
+    """
+    upstream_status = (
+        exc.response.status_code if isinstance(exc, httpx.HTTPStatusError) else None
+    )
+    logger.error(
+        "Upstream request failed",
+        path=request.url.path,
+        upstream_status=upstream_status,
+        error=str(exc),
+    )
+    if upstream_status == status.HTTP_404_NOT_FOUND:
+        return ORJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": "Upstream resource not found"},
+        )
+    if upstream_status == status.HTTP_400_BAD_REQUEST:
+        return ORJSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content={"detail": "Upstream request rejected"},
+        )
+    return ORJSONResponse(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        content={"detail": "Upstream request failed"},
+    )
+
+
+async def deployment_error_handler(request: Request, exc: DeploymentError) -> ORJSONResponse:
+    """Map deployments that failed or timed out on the platform to 400."""
+    logger.error("Deployment failed", path=request.url.path, error=str(exc))
+    return ORJSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": f"Deployment failed: {exc}"},
+    )
+
+
+async def deployment_response_error_handler(
+    request: Request, exc: DeploymentResponseError
+) -> ORJSONResponse:
+    """Map platform responses the services could not parse to 502."""
+    logger.error("Unexpected platform response", path=request.url.path, error=str(exc))
+    return ORJSONResponse(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        content={"detail": "Unexpected response from deployment platform"},
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Register the application-wide exception handlers.
+
+    Args:
+        app: FastAPI application
+    """
+    app.add_exception_handler(SourcePathNotFoundError, source_path_not_found_handler)
+    app.add_exception_handler(httpx.HTTPError, upstream_http_error_handler)
+    app.add_exception_handler(DeploymentError, deployment_error_handler)
+    app.add_exception_handler(DeploymentResponseError, deployment_response_error_handler)
@@ -1,9 +1,13 @@
 """Human-in-the-loop approval API endpoints."""
 
+from functools import lru_cache
+
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from redis.asyncio import Redis
 
+from ae_api.db.redis import get_redis_pool
 from ae_api.safety.approvals import (
     ApprovalDecision,
     ApprovalQueue,
@@ -12,33 +16,19 @@ from ae_api.safety.approvals import (
 )
 
 logger = structlog.get_logger()
-router = APIRouter()
-
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# Dependency injection for Redis client
-async def get_redis() -> Redis:
-    """Get Redis client for approval queue."""
-    from ae_api.config import get_settings
 
-    settings = get_settings()
-
-    redis = Redis(
-        host=settings.redis_host,
-        port=settings.redis_port,
-        db=settings.redis_db,
-        password=settings.redis_password.get_secret_value() if settings.redis_password else None,
-        decode_responses=True,
-        socket_connect_timeout=5,
-    )
-    try:
-        yield redis
-    finally:
-        await redis.aclose()
+# Dependency injection
+@lru_cache(maxsize=1)
+def _queue_singleton() -> ApprovalQueue:
+    """Build the process-wide ApprovalQueue bound to the shared pool."""
+    return ApprovalQueue(Redis(connection_pool=get_redis_pool()))
 
 
-async def get_approval_queue(redis: Redis = Depends(get_redis)) -> ApprovalQueue:
-    """Get or create ApprovalQueue instance."""
-    return ApprovalQueue(redis)
+async def get_approval_queue() -> ApprovalQueue:
+    """Get the shared ApprovalQueue instance."""
+    return _queue_singleton()
 
 
 # Endpoints
@@ -60,7 +50,7 @@ async def create_approval(
         HTTPException: If approval already exists or creation fails
     """
     try:
-        logger.info(
+        logger.debug(
             "Creating approval via API",
             action_id=request.action_id,
             action_type=request.action_type,
@@ -78,7 +68,7 @@ async def create_approval(
         logger.error("Error creating approval", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error creating approval: {str(e)}",
+            detail="Error creating approval",
         ) from e
 
 
@@ -100,7 +90,7 @@ async def get_approval(
         HTTPException: If approval doesn't exist
     """
     try:
-        logger.info("Getting approval via API", action_id=action_id)
+        logger.debug("Getting approval via API", action_id=action_id)
         approval = await queue.get_approval(action_id)
         return approval
 
@@ -114,7 +104,7 @@ async def get_approval(
         logger.error("Error getting approval", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error getting approval: {str(e)}",
+            detail="Error getting approval",
         ) from e
 
 
@@ -135,7 +125,7 @@ async def list_pending_approvals(
         List of pending approval requests
     """
     try:
-        logger.info("Listing pending approvals via API", run_id=run_id, limit=limit)
+        logger.debug("Listing pending approvals via API", run_id=run_id, limit=limit)
         approvals = await queue.list_pending_approvals(run_id=run_id, limit=limit)
         return approvals
 
@@ -143,7 +133,7 @@ async def list_pending_approvals(
         logger.error("Error listing approvals", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error listing approvals: {str(e)}",
+            detail="Error listing approvals",
         ) from e
 
 
@@ -167,7 +157,7 @@ async def decide_approval(
         HTTPException: If approval doesn't exist or is not pending
     """
     try:
-        logger.info(
+        logger.debug(
             "Deciding approval via API",
             action_id=action_id,
             approved=decision.approved,
@@ -186,7 +176,7 @@ async def decide_approval(
         logger.error("Error deciding approval", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error deciding approval: {str(e)}",
+            detail="Error deciding approval",
         ) from e
 
 
@@ -210,7 +200,7 @@ async def cancel_approval(
         HTTPException: If approval doesn't exist or is not pending
     """
     try:
-        logger.info("Cancelling approval via API", action_id=action_id, reason=reason)
+        logger.debug("Cancelling approval via API", action_id=action_id, reason=reason)
         approval = await queue.cancel_approval(action_id, reason)
         return approval
 
@@ -224,14 +214,14 @@ async def cancel_approval(
         logger.error("Error cancelling approval", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error cancelling approval: {str(e)}",
+            detail="Error cancelling approval",
         ) from e
 
 
-@router.post("/cleanup", status_code=status.HTTP_200_OK)
+@router.post("/cleanup", status_code=status.HTTP_200_OK, response_model=None)
 async def cleanup_expired_approvals(
     queue: ApprovalQueue = Depends(get_approval_queue),
-) -> dict[str, int]:
+) -> ORJSONResponse:
     """
     Clean up expired approval requests from the pending set.
 
@@ -244,11 +234,11 @@ async def cleanup_expired_approvals(
     try:
         logger.info("Cleaning up expired approvals via API")
         count = await queue.cleanup_expired_approvals()
-        return {"cleaned_up": count}
+        return ORJSONResponse({"cleaned_up": count})
 
     except Exception as e:
         logger.error("Error cleaning up approvals", error=str(e), exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error cleaning up approvals: {str(e)}",
+            detail="Error cleaning up approvals",
         ) from e
@@ -1,12 +1,25 @@
 """Billing API endpoints for Stripe integration."""
 
-from typing import Annotated
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Annotated, Literal
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Header, Request, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    status,
+)
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, EmailStr
+from redis.asyncio import Redis
 
-from ae_api.config import get_settings, Settings
+from ae_api.config import get_settings
+from ae_api.db.redis import get_redis
 from ae_api.services.stripe_service import (
     StripeService,
     StripeProduct,
@@ -14,19 +27,31 @@ from ae_api.services.stripe_service import (
     PaymentLink,
     Subscription,
     WebhookEvent,
+    WebhookEventType,
 )
 
 logger = structlog.get_logger()
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Stripe events are far smaller than this; anything larger is rejected with 413
+MAX_WEBHOOK_PAYLOAD_BYTES = 1024 * 1024
+
+# Processed webhook event ids are remembered for longer than Stripe's retry window
+WEBHOOK_EVENT_KEY_PREFIX = "stripe:webhook:event:"
+WEBHOOK_EVENT_TTL = 60 * 60 * 24 * 7
+
+
+@lru_cache(maxsize=1)
+def _get_cached_stripe_service(api_key: str) -> StripeService:
+    """Get the shared StripeService instance for an API key."""
+    return StripeService(api_key=api_key)
 
 
-def get_stripe_service(
-    settings: Annotated[Settings, Depends(get_settings)]
-) -> StripeService:
+async def get_stripe_service() -> StripeService:
     """Get Stripe service dependency.
 
-    Args:
-        settings: Application settings
+    Declared async and reads the cached settings directly so FastAPI resolves
+    it on the event loop instead of dispatching to the threadpool.
 
     Returns:
         StripeService instance
@@ -34,12 +59,13 @@ def get_stripe_service(
     Raises:
         HTTPException: If Stripe API key is not configured
     """
+    settings = get_settings()
     if not settings.stripe_api_key:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Stripe API key not configured",
         )
-    return StripeService(api_key=settings.stripe_api_key.get_secret_value())
+    return _get_cached_stripe_service(settings.stripe_api_key.get_secret_value())
 
 
 class CreateProductRequest(BaseModel):
@@ -93,7 +119,7 @@ class RecordUsageRequest(BaseModel):
 
     subscription_item_id: str
     quantity: int = Field(gt=0)
-    action: str = Field(default="increment", pattern="^(increment|set)$")
+    action: Literal["increment", "set"] = "increment"
 
 
 @router.post("/products", response_model=StripeProduct)
@@ -122,11 +148,11 @@ async def create_product(
         logger.info("Product created via API", product_id=product.id)
         return product
     except Exception as e:
-        logger.error("Failed to create product", error=str(e))
+        logger.exception("Failed to create product")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to create product: {str(e)}",
-        )
+            detail="Failed to create product",
+        ) from e
 
 
 @router.post("/prices", response_model=StripePrice)
@@ -157,11 +183,11 @@ async def create_price(
         logger.info("Price created via API", price_id=price.id)
         return price
     except Exception as e:
-        logger.error("Failed to create price", error=str(e))
+        logger.exception("Failed to create price")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to create price: {str(e)}",
-        )
+            detail="Failed to create price",
+        ) from e
 
 
 @router.post("/payment-links", response_model=PaymentLink)
@@ -191,18 +217,22 @@ async def create_payment_link(
         logger.info("Payment link created via API", link_id=payment_link.id)
         return payment_link
     except Exception as e:
-        logger.error("Failed to create payment link", error=str(e))
+        logger.exception("Failed to create payment link")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to create payment link: {str(e)}",
-        )
+            detail="Failed to create payment link",
+        ) from e
 
 
-@router.post("/checkout", response_model=CheckoutSessionResponse)
+@router.post(
+    "/checkout",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": CheckoutSessionResponse}},
+)
 async def create_checkout_session(
     request: CreateCheckoutSessionRequest,
     stripe_service: Annotated[StripeService, Depends(get_stripe_service)],
-) -> CheckoutSessionResponse:
+) -> ORJSONResponse:
     """Create a checkout session.
 
     Args:
@@ -224,27 +254,67 @@ async def create_checkout_session(
             metadata=request.metadata,
         )
         logger.info("Checkout session created via API", customer_email=request.customer_email)
-        return CheckoutSessionResponse(session_url=session_url)
+        return ORJSONResponse({"session_url": session_url})
     except Exception as e:
-        logger.error("Failed to create checkout session", error=str(e))
+        logger.exception("Failed to create checkout session")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to create checkout session: {str(e)}",
-        )
+            detail="Failed to create checkout session",
+        ) from e
+
+
+async def _handle_checkout_completed(event: WebhookEvent) -> None:
+    """Handle successful checkout."""
+    logger.info("Checkout completed", event_data=event.data)
+
+
+async def _handle_subscription_changed(event: WebhookEvent) -> None:
+    """Handle subscription creation or update."""
+    logger.info("Subscription event", event_data=event.data)
+
+
+async def _handle_subscription_deleted(event: WebhookEvent) -> None:
+    """Handle subscription cancellation."""
+    logger.info("Subscription deleted", event_data=event.data)
+
 
+async def _handle_invoice_paid(event: WebhookEvent) -> None:
+    """Handle successful payment."""
+    logger.info("Invoice paid", event_data=event.data)
 
-@router.post("/webhooks/stripe", response_model=dict[str, str])
+
+async def _handle_invoice_payment_failed(event: WebhookEvent) -> None:
+    """Handle failed payment."""
+    logger.warning("Invoice payment failed", event_data=event.data)
+
+
+_WEBHOOK_HANDLERS: dict[str, Callable[[WebhookEvent], Awaitable[None]]] = {
+    WebhookEventType.CHECKOUT_COMPLETED: _handle_checkout_completed,
+    WebhookEventType.SUBSCRIPTION_CREATED: _handle_subscription_changed,
+    WebhookEventType.SUBSCRIPTION_UPDATED: _handle_subscription_changed,
+    WebhookEventType.SUBSCRIPTION_DELETED: _handle_subscription_deleted,
+    WebhookEventType.INVOICE_PAID: _handle_invoice_paid,
+    WebhookEventType.INVOICE_PAYMENT_FAILED: _handle_invoice_payment_failed,
+}
+
+
+@router.post("/webhooks/stripe", response_model=None)
 async def handle_stripe_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
+    redis: Annotated[Redis, Depends(get_redis)],
     stripe_signature: Annotated[str | None, Header(alias="stripe-signature")] = None,
-    settings: Settings = Depends(get_settings),
-) -> dict[str, str]:
+) -> ORJSONResponse:
     """Handle Stripe webhook events.
 
+    Stripe delivers events at least once, so each event id is claimed in Redis
+    before its handler is scheduled and redeliveries are acknowledged as duplicates.
+
     Args:
         request: FastAPI request object
+        background_tasks: Background task queue for event processing
+        redis: Redis client used to deduplicate event ids
         stripe_signature: Stripe signature header
-        settings: Application settings
 
     Returns:
         Success response
@@ -252,6 +322,7 @@ async def handle_stripe_webhook(
     Raises:
         HTTPException: If webhook validation fails or processing fails
     """
+    settings = get_settings()
     if not settings.stripe_webhook_secret:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -264,15 +335,29 @@ async def handle_stripe_webhook(
             detail="Missing stripe-signature header",
         )
 
+    # Reject oversized payloads before reading them
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > MAX_WEBHOOK_PAYLOAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Webhook payload too large",
+        )
+
+    # Read raw body incrementally, bounded by the payload limit
+    buffer = bytearray()
+    async for chunk in request.stream():
+        buffer += chunk
+        if len(buffer) > MAX_WEBHOOK_PAYLOAD_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Webhook payload too large",
+            )
+    payload = bytes(buffer)
+
     try:
-        # Get raw body
-        payload = await request.body()
-
-        # Initialize Stripe service
-        stripe_service = StripeService(
-            api_key=settings.stripe_api_key.get_secret_value()
-            if settings.stripe_api_key
-            else ""
+        # Get shared Stripe service
+        stripe_service = _get_cached_stripe_service(
+            settings.stripe_api_key.get_secret_value() if settings.stripe_api_key else ""
         )
 
         # Verify and parse webhook
@@ -282,36 +367,31 @@ async def handle_stripe_webhook(
             webhook_secret=settings.stripe_webhook_secret.get_secret_value(),
         )
 
+        # Skip events that have already been claimed by an earlier delivery
+        claimed = await redis.set(
+            f"{WEBHOOK_EVENT_KEY_PREFIX}{event.id}", "1", nx=True, ex=WEBHOOK_EVENT_TTL
+        )
+        if not claimed:
+            logger.info(
+                "Skipping duplicate webhook event", event_type=event.type, event_id=event.id
+            )
+            return ORJSONResponse({"status": "duplicate", "event_id": event.id})
+
         # Process webhook event
         logger.info("Processing webhook event", event_type=event.type, event_id=event.id)
 
-        # Handle different event types
-        if event.type == "checkout.session.completed":
-            # Handle successful checkout
-            logger.info("Checkout completed", event_data=event.data)
-        elif event.type in [
-            "customer.subscription.created",
-            "customer.subscription.updated",
-        ]:
-            # Handle subscription changes
-            logger.info("Subscription event", event_data=event.data)
-        elif event.type == "customer.subscription.deleted":
-            # Handle subscription cancellation
-            logger.info("Subscription deleted", event_data=event.data)
-        elif event.type == "invoice.paid":
-            # Handle successful payment
-            logger.info("Invoice paid", event_data=event.data)
-        elif event.type == "invoice.payment_failed":
-            # Handle failed payment
-            logger.warning("Invoice payment failed", event_data=event.data)
-
-        return {"status": "success", "event_id": event.id}
+        # Acknowledge immediately; the registered handler runs after the response is sent
+        handler = _WEBHOOK_HANDLERS.get(event.type)
+        if handler is not None:
+            background_tasks.add_task(handler, event)
+
+        return ORJSONResponse({"status": "success", "event_id": event.id})
     except Exception as e:
-        logger.error("Webhook processing failed", error=str(e))
+        logger.exception("Webhook processing failed")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Webhook processing failed: {str(e)}",
-        )
+            detail="Webhook processing failed",
+        ) from e
 
 
 @router.get("/subscriptions/{subscription_id}", response_model=Subscription)
@@ -336,18 +416,18 @@ async def get_subscription(
         logger.info("Subscription retrieved via API", subscription_id=subscription_id)
         return subscription
     except Exception as e:
-        logger.error("Failed to get subscription", error=str(e))
+        logger.exception("Failed to get subscription")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Failed to get subscription: {str(e)}",
-        )
+            detail="Failed to get subscription",
+        ) from e
 
 
-@router.post("/usage", response_model=dict[str, str])
+@router.post("/usage", response_model=None)
 async def record_usage(
     request: RecordUsageRequest,
     stripe_service: Annotated[StripeService, Depends(get_stripe_service)],
-) -> dict[str, str]:
+) -> ORJSONResponse:
     """Record metered usage for a subscription.
 
     Args:
@@ -371,13 +451,12 @@ async def record_usage(
             subscription_item_id=request.subscription_item_id,
             quantity=request.quantity,
         )
-        return {
-            "status": "success",
-            "subscription_item_id": request.subscription_item_id,
-        }
+        return ORJSONResponse(
+            {"status": "success", "subscription_item_id": request.subscription_item_id}
+        )
     except Exception as e:
-        logger.error("Failed to record usage", error=str(e))
+        logger.exception("Failed to record usage")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to record usage: {str(e)}",
-        )
+            detail="Failed to record usage",
+        ) from e
@@ -1,26 +1,48 @@
 """Deployment API endpoints for Vercel and Netlify."""
 
+from functools import lru_cache
 from typing import Annotated
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from ae_api.config import get_settings, Settings
+from ae_api.config import get_settings
 from ae_api.services.vercel_service import VercelService, VercelDeployment
 from ae_api.services.netlify_service import NetlifyService, NetlifyDeployment
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+VALID_PLATFORMS = frozenset({"vercel", "netlify"})
 
-def get_vercel_service(
-    settings: Annotated[Settings, Depends(get_settings)]
-) -> VercelService:
-    """Get Vercel service dependency.
 
-    Args:
-        settings: Application settings
+@lru_cache(maxsize=1)
+def _get_cached_vercel_service() -> VercelService | None:
+    """Get the shared VercelService, or None if Vercel token is not configured.
+
+    The token is unwrapped from its SecretStr once, when the service is built.
+    """
+    settings = get_settings()
+    if not settings.vercel_token:
+        return None
+    return VercelService(token=settings.vercel_token.get_secret_value())
+
+
+@lru_cache(maxsize=1)
+def _get_cached_netlify_service() -> NetlifyService | None:
+    """Get the shared NetlifyService, or None if Netlify token is not configured.
+
+    The token is unwrapped from its SecretStr once, when the service is built.
+    """
+    settings = get_settings()
+    if not settings.netlify_token:
+        return None
+    return NetlifyService(token=settings.netlify_token.get_secret_value())
+
+
+async def get_vercel_service() -> VercelService:
+    """Get Vercel service dependency.
 
     Returns:
         VercelService instance
@@ -28,34 +50,41 @@ def get_vercel_service(
     Raises:
         HTTPException: If Vercel token is not configured
     """
-    if not settings.vercel_token:
+    vercel_service = _get_cached_vercel_service()
+    if vercel_service is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Vercel token not configured",
         )
-    return VercelService(token=settings.vercel_token.get_secret_value())
+    return vercel_service
 
 
-def get_netlify_service(
-    settings: Annotated[Settings, Depends(get_settings)]
-) -> NetlifyService:
+async def get_netlify_service() -> NetlifyService:
     """Get Netlify service dependency.
 
-    Args:
-        settings: Application settings
-
     Returns:
         NetlifyService instance
 
     Raises:
         HTTPException: If Netlify token is not configured
     """
-    if not settings.netlify_token:
+    netlify_service = _get_cached_netlify_service()
+    if netlify_service is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Netlify token not configured",
         )
-    return NetlifyService(token=settings.netlify_token.get_secret_value())
+    return netlify_service
+
+
+async def get_vercel_service_optional() -> VercelService | None:
+    """Get Vercel service dependency, or None if Vercel token is not configured."""
+    return _get_cached_vercel_service()
+
+
+async def get_netlify_service_optional() -> NetlifyService | None:
+    """Get Netlify service dependency, or None if Netlify token is not configured."""
+    return _get_cached_netlify_service()
 
 
 class DeployToVercelRequest(BaseModel):
@@ -91,6 +120,8 @@ class SetEnvVarsRequest(BaseModel):
 class DeploymentStatusResponse(BaseModel):
     """Unified deployment status response."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     url: str
     state: str
@@ -113,34 +144,23 @@ async def deploy_to_vercel(
         Vercel deployment details
 
     Raises:
-        HTTPException: If deployment fails
+        SourcePathNotFoundError: If the source path does not exist
+        DeploymentResponseError: If the platform response cannot be parsed
+        httpx.HTTPError: If the platform API call fails
     """
-    try:
-        deployment = await vercel_service.deploy(
-            project_name=request.project_name,
-            source_path=request.source_path,
-            env_vars=request.env_vars,
-            build_command=request.build_command,
-            output_directory=request.output_directory,
-        )
-        logger.info(
-            "Vercel deployment created via API",
-            deployment_id=deployment.id,
-            project_name=request.project_name,
-        )
-        return deployment
-    except FileNotFoundError as e:
-        logger.error("Source path not found", error=str(e), path=request.source_path)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Source path not found: {str(e)}",
-        )
-    except Exception as e:
-        logger.error("Failed to deploy to Vercel", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to deploy to Vercel: {str(e)}",
-        )
+    deployment = await vercel_service.deploy(
+        project_name=request.project_name,
+        source_path=request.source_path,
+        env_vars=request.env_vars,
+        build_command=request.build_command,
+        output_directory=request.output_directory,
+    )
+    logger.info(
+        "Vercel deployment created via API",
+        deployment_id=deployment.id,
+        project_name=request.project_name,
+    )
+    return deployment
 
 
 @router.post("/netlify", response_model=NetlifyDeployment)
@@ -158,103 +178,71 @@ async def deploy_to_netlify(
         Netlify deployment details
 
     Raises:
-        HTTPException: If deployment fails
+        SourcePathNotFoundError: If the source path does not exist
+        DeploymentResponseError: If the platform response cannot be parsed
+        httpx.HTTPError: If the platform API call fails
     """
-    try:
-        deployment = await netlify_service.deploy(
-            site_name=request.site_name,
-            source_path=request.source_path,
-            env_vars=request.env_vars,
-            build_command=request.build_command,
-            publish_directory=request.publish_directory,
-        )
-        logger.info(
-            "Netlify deployment created via API",
-            deployment_id=deployment.id,
-            site_name=request.site_name,
-        )
-        return deployment
-    except FileNotFoundError as e:
-        logger.error("Source path not found", error=str(e), path=request.source_path)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Source path not found: {str(e)}",
-        )
-    except Exception as e:
-        logger.error("Failed to deploy to Netlify", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to deploy to Netlify: {str(e)}",
-        )
+    deployment = await netlify_service.deploy(
+        site_name=request.site_name,
+        source_path=request.source_path,
+        env_vars=request.env_vars,
+        build_command=request.build_command,
+        publish_directory=request.publish_directory,
+    )
+    logger.info(
+        "Netlify deployment created via API",
+        deployment_id=deployment.id,
+        site_name=request.site_name,
+    )
+    return deployment
 
 
 @router.get("/{deployment_id}", response_model=DeploymentStatusResponse)
 async def get_deployment_status(
     deployment_id: str,
     platform: str,
-    settings: Annotated[Settings, Depends(get_settings)],
+    vercel_service: Annotated[VercelService | None, Depends(get_vercel_service_optional)],
+    netlify_service: Annotated[NetlifyService | None, Depends(get_netlify_service_optional)],
 ) -> DeploymentStatusResponse:
     """Get deployment status (platform-agnostic).
 
     Args:
         deployment_id: Deployment ID
         platform: Platform name (vercel or netlify)
-        settings: Application settings
+        vercel_service: Vercel service instance, if configured
+        netlify_service: Netlify service instance, if configured
 
     Returns:
         Deployment status
 
     Raises:
-        HTTPException: If retrieval fails or platform is invalid
+        HTTPException: If platform is invalid or not configured
+        httpx.HTTPError: If the platform API call fails
     """
-    try:
-        if platform.lower() == "vercel":
-            if not settings.vercel_token:
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="Vercel token not configured",
-                )
-            vercel_service = VercelService(
-                token=settings.vercel_token.get_secret_value()
-            )
-            deployment = await vercel_service.get_deployment(deployment_id)
-            return DeploymentStatusResponse(
-                id=deployment.id,
-                url=deployment.url,
-                state=deployment.state.value,
-                platform="vercel",
-                created_at=deployment.created_at.isoformat(),
-            )
-        elif platform.lower() == "netlify":
-            if not settings.netlify_token:
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="Netlify token not configured",
-                )
-            netlify_service = NetlifyService(
-                token=settings.netlify_token.get_secret_value()
-            )
-            deployment = await netlify_service.get_deployment(deployment_id)
-            return DeploymentStatusResponse(
-                id=deployment.id,
-                url=deployment.url,
-                state=deployment.state.value,
-                platform="netlify",
-                created_at=deployment.created_at.isoformat(),
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid platform: {platform}. Must be 'vercel' or 'netlify'",
-            )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to get deployment status", error=str(e))
+    platform = platform.lower()
+    if platform not in VALID_PLATFORMS:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Failed to get deployment status: {str(e)}",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid platform: {platform}. Must be 'vercel' or 'netlify'",
         )
+    service: VercelService | NetlifyService | None = (
+        vercel_service if platform == "vercel" else netlify_service
+    )
+
+    if service is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"{platform.capitalize()} token not configured",
+        )
+
+    deployment = await service.get_deployment(deployment_id)
+    return DeploymentStatusResponse(
+        id=deployment.id,
+        url=deployment.url,
+        state=deployment.state.value,
+        platform=platform,
+        created_at=deployment.created_at.isoformat(),
+    )
 
 
 @router.post("/vercel/{project_id}/env", response_model=dict[str, str])
@@ -274,30 +262,23 @@ async def set_vercel_env_vars(
         Success response
 
     Raises:
-        HTTPException: If setting env vars fails
+        httpx.HTTPError: If the platform API call fails
     """
-    try:
-        await vercel_service.set_env_vars(
-            project_id=project_id,
-            env_vars=request.env_vars,
-            target=request.target,
-        )
-        logger.info(
-            "Vercel env vars set via API",
-            project_id=project_id,
-            count=len(request.env_vars),
-        )
-        return {
-            "status": "success",
-            "project_id": project_id,
-            "count": len(request.env_vars),
-        }
-    except Exception as e:
-        logger.error("Failed to set Vercel env vars", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to set environment variables: {str(e)}",
-        )
+    await vercel_service.set_env_vars(
+        project_id=project_id,
+        env_vars=request.env_vars,
+        target=request.target,
+    )
+    logger.info(
+        "Vercel env vars set via API",
+        project_id=project_id,
+        count=len(request.env_vars),
+    )
+    return {
+        "status": "success",
+        "project_id": project_id,
+        "count": len(request.env_vars),
+    }
 
 
 @router.post("/netlify/{site_id}/env", response_model=dict[str, str])
@@ -317,29 +298,22 @@ async def set_netlify_env_vars(
         Success response
 
     Raises:
-        HTTPException: If setting env vars fails
+        httpx.HTTPError: If the platform API call fails
     """
-    try:
-        await netlify_service.set_env_vars(
-            site_id=site_id,
-            env_vars=request.env_vars,
-        )
-        logger.info(
-            "Netlify env vars set via API",
-            site_id=site_id,
-            count=len(request.env_vars),
-        )
-        return {
-            "status": "success",
-            "site_id": site_id,
-            "count": len(request.env_vars),
-        }
-    except Exception as e:
-        logger.error("Failed to set Netlify env vars", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to set environment variables: {str(e)}",
-        )
+    await netlify_service.set_env_vars(
+        site_id=site_id,
+        env_vars=request.env_vars,
+    )
+    logger.info(
+        "Netlify env vars set via API",
+        site_id=site_id,
+        count=len(request.env_vars),
+    )
+    return {
+        "status": "success",
+        "site_id": site_id,
+        "count": len(request.env_vars),
+    }
 
 
 @router.get("/vercel/{project_id}/domains", response_model=list[str])
@@ -357,19 +331,12 @@ async def get_vercel_domains(
         List of domain names
 
     Raises:
-        HTTPException: If retrieval fails
+        httpx.HTTPError: If the platform API call fails
     """
-    try:
-        domains = await vercel_service.get_domains(project_id)
-        logger.info(
-            "Vercel domains retrieved via API",
-            project_id=project_id,
-            count=len(domains),
-        )
-        return domains
-    except Exception as e:
-        logger.error("Failed to get Vercel domains", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Failed to get domains: {str(e)}",
-        )
+    domains = await vercel_service.get_domains(project_id)
+    logger.info(
+        "Vercel domains retrieved via API",
+        project_id=project_id,
+        count=len(domains),
+    )
+    return domains
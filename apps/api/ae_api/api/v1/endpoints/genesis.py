@@ -7,14 +7,35 @@ This module provides endpoints for the Genesis workflow:
 - MetaGPT-powered specification generation
 """
 
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Annotated
 
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from pydantic import BaseModel, Field
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Header
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ae_api.db.models import NicheCandidate as NicheCandidateRecord, Project, ProjectStatus
 from ae_api.db.session import get_session, engine
+from ae_api.genesis.metapm.metagpt_runner import MetaGPTRunner
+from ae_api.genesis.metapm.roles import ProductSpec, TaskGraph, TechnicalSpec
+from ae_api.genesis.niche_identification import (
+    NicheCandidate,
+    NicheIdentificationEngine,
+    TrendDocument,
+)
+from ae_api.genesis.sources.hackernews import HackerNewsSource
+from ae_api.genesis.sources.reddit import RedditSource, SAAS_SUBREDDITS
+from ae_api.genesis.validator_agent import ValidationReport, ValidatorAgent
+from ae_api.orchestration.ids import genesis_workflow_id
+from ae_api.orchestration.temporal_client import TemporalClient, get_temporal_client
 from ae_api.rag.schemas import (
     NicheCandidate as RagNicheCandidate,
     ValidationReport as RagValidationReport,
@@ -24,7 +45,43 @@ from ae_api.rag.schemas import (
 )
 
 logger = structlog.get_logger()
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Replays of /start (client retries, double submits) within this window return
+# the original response instead of creating another project and workflow
+GENESIS_IDEMPOTENCY_TTL = 600
+_genesis_responses: TTLCache = TTLCache(maxsize=10_000, ttl=GENESIS_IDEMPOTENCY_TTL)
+_genesis_locks: dict[str, asyncio.Lock] = {}
+# Requests holding or waiting on each lock; the lock is dropped when none remain
+_genesis_lock_users: dict[str, int] = {}
+
+
+# Built once at import; only the bound project_id varies per request
+_SELECT_NICHES = (
+    select(NicheCandidateRecord)
+    .where(NicheCandidateRecord.project_id == bindparam("project_id"))
+    .order_by(NicheCandidateRecord.composite_score.desc())
+)
+
+
+@lru_cache(maxsize=1)
+def _get_cached_metagpt_runner() -> MetaGPTRunner:
+    """Build the process-wide MetaGPTRunner and its role LLM clients."""
+    return MetaGPTRunner()
+
+
+async def get_metagpt_runner() -> MetaGPTRunner:
+    """Get the shared MetaGPTRunner.
+
+    The runner keeps no per-run state, so concurrent requests can share it.
+    """
+    return _get_cached_metagpt_runner()
+
+
+@lru_cache(maxsize=4096)
+def _intent_slug(intent: str) -> str:
+    """Derive the 12-hex-character project slug for an intent."""
+    return hashlib.blake2b(intent.encode("utf-8"), digest_size=6).hexdigest()
 
 
 class GenesisRequest(BaseModel):
@@ -51,6 +108,8 @@ class GenesisRequest(BaseModel):
 class GenesisResponse(BaseModel):
     """Response from starting a Genesis workflow."""
 
+    model_config = ConfigDict(frozen=True)
+
     workflow_id: str
     project_id: str
     status: str
@@ -60,23 +119,29 @@ class GenesisResponse(BaseModel):
 class NicheListResponse(BaseModel):
     """Response containing niche candidates."""
 
-    niches: list[NicheCandidate]
+    model_config = ConfigDict(frozen=True)
+
+    niches: list[RagNicheCandidate]
     total: int
 
 
 class ValidationResponse(BaseModel):
     """Response containing validation report."""
 
-    report: ValidationReport
+    model_config = ConfigDict(frozen=True)
+
+    report: RagValidationReport
     recommendation: str
 
 
 class ProductSpecResponse(BaseModel):
     """Response containing full product specification."""
 
-    product_spec: ProductSpec
-    technical_spec: TechnicalSpec
-    task_graph: TaskGraph
+    model_config = ConfigDict(frozen=True)
+
+    product_spec: RagProductSpec
+    technical_spec: RagTechnicalSpec
+    task_graph: RagTaskGraph
 
 
 @router.post("/start", response_model=GenesisResponse)
@@ -84,6 +149,8 @@ async def start_genesis(
     request: GenesisRequest,
     background_tasks: BackgroundTasks,
     session: Annotated[AsyncSession, Depends(get_session)],
+    temporal: Annotated[TemporalClient, Depends(get_temporal_client)],
+    idempotency_key: Annotated[str | None, Header(max_length=255)] = None,
 ) -> GenesisResponse:
     """
     Start a new Genesis workflow to identify and validate a niche.
@@ -92,15 +159,46 @@ async def start_genesis(
     1. Niche identification via RAG-powered trend analysis
     2. Validation via SEO/keyword metrics
     3. Product specification via Meta-PM architecture
+
+    Requests are deduplicated for GENESIS_IDEMPOTENCY_TTL seconds by the
+    `Idempotency-Key` header, or by the request body when no key is sent;
+    a duplicate gets the original response.
     """
-    # Import here to avoid circular imports
-    from ae_api.orchestration.temporal_client import TemporalClient
-    from ae_api.orchestration.ids import genesis_workflow_id
-    from ae_api.db.models import Project, ProjectStatus
-    import hashlib
+    key = idempotency_key or hashlib.blake2b(
+        request.model_dump_json().encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+    response = _genesis_responses.get(key)
+    if response is not None:
+        logger.debug("genesis_start_replayed", project_id=response.project_id)
+        return response
 
+    lock = _genesis_locks.setdefault(key, asyncio.Lock())
+    _genesis_lock_users[key] = _genesis_lock_users.get(key, 0) + 1
+    try:
+        async with lock:
+            response = _genesis_responses.get(key)
+            if response is None:
+                response = await _start_genesis(request, session, temporal)
+                _genesis_responses[key] = response
+            return response
+    finally:
+        # lock.locked() is already False before a queued waiter re-acquires,
+        # so only the last user may drop the lock
+        _genesis_lock_users[key] -= 1
+        if not _genesis_lock_users[key]:
+            del _genesis_lock_users[key]
+            del _genesis_locks[key]
+
+
+async def _start_genesis(
+    request: GenesisRequest,
+    session: AsyncSession,
+    temporal: TemporalClient,
+) -> GenesisResponse:
+    """Create the project and start its Genesis workflow."""
     # Create project
-    intent_hash = hashlib.sha256(request.intent.encode()).hexdigest()[:12]
+    intent_hash = _intent_slug(request.intent)
     workflow_id = genesis_workflow_id(intent_hash)
 
     project = Project(
@@ -110,14 +208,12 @@ async def start_genesis(
         budget_limit=request.budget,
     )
     session.add(project)
+    # The primary key is generated client-side, so no refresh round-trip is needed
     await session.commit()
-    await session.refresh(project)
 
     # Start Temporal workflow
     try:
-        client = TemporalClient()
-        await client.connect()
-        await client.start_genesis_workflow(
+        await temporal.start_genesis_workflow(
             intent=request.intent,
             budget=request.budget,
             project_id=project.id,
@@ -140,9 +236,27 @@ async def get_niches(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> NicheListResponse:
     """Get generated niche candidates for a project."""
-    # This would query the database for stored niche candidates
-    # For now, return placeholder
-    return NicheListResponse(niches=[], total=0)
+    result = await session.execute(_SELECT_NICHES, {"project_id": project_id})
+    niches = [
+        RagNicheCandidate(
+            id=record.id,
+            name=record.name,
+            description=record.description,
+            pain_points=record.pain_points,
+            target_audience=record.target_audience,
+            evidence_urls=record.evidence_urls,
+            evidence_quotes=record.evidence_quotes,
+            pain_intensity=record.pain_intensity,
+            market_size_estimate=record.market_size_estimate or "unknown",
+            competition_level=record.competition_level or "unknown",
+            search_volume=record.search_volume,
+            keyword_difficulty=record.keyword_difficulty,
+            estimated_arpu=record.estimated_arpu,
+            composite_score=record.composite_score,
+        )
+        for record in result.scalars()
+    ]
+    return NicheListResponse(niches=niches, total=len(niches))
 
 
 @router.post("/validate/{niche_id}", response_model=ValidationResponse)
@@ -169,14 +283,11 @@ async def get_product_spec(
 async def approve_and_proceed(
     project_id: str,
     session: Annotated[AsyncSession, Depends(get_session)],
+    temporal: Annotated[TemporalClient, Depends(get_temporal_client)],
 ) -> dict:
     """Approve the Genesis output and proceed to Build phase."""
-    from ae_api.orchestration.temporal_client import TemporalClient
-
     try:
-        client = TemporalClient()
-        await client.connect()
-        await client.signal_workflow(
+        await temporal.signal_workflow(
             workflow_id=f"genesis-{project_id}",
             signal="approve",
             data={"approved": True},
@@ -210,11 +321,43 @@ class IngestTrendsRequest(BaseModel):
 class IngestTrendsResponse(BaseModel):
     """Response from trend ingestion."""
 
+    model_config = ConfigDict(frozen=True)
+
     total_ingested: int
     sources_used: list[str]
     message: str
 
 
+async def _fetch_reddit_trends(request: IngestTrendsRequest) -> list[TrendDocument]:
+    """Fetch trends from Reddit for an ingestion request."""
+    async with RedditSource() as reddit:
+        trends = await reddit.fetch_trends(
+            query=request.intent,
+            limit=request.limit,
+            subreddits=request.subreddits or SAAS_SUBREDDITS[:5],
+        )
+    logger.info("reddit_trends_fetched", count=len(trends))
+    return trends
+
+
+async def _fetch_hackernews_trends(request: IngestTrendsRequest) -> list[TrendDocument]:
+    """Fetch trends from HackerNews for an ingestion request."""
+    async with HackerNewsSource() as hn:
+        trends = await hn.fetch_trends(
+            query=request.intent,
+            limit=request.limit,
+        )
+    logger.info("hackernews_trends_fetched", count=len(trends))
+    return trends
+
+
+# Trend fetchers keyed by source name, in fetch/report order
+TREND_FETCHERS = {
+    "reddit": _fetch_reddit_trends,
+    "hackernews": _fetch_hackernews_trends,
+}
+
+
 @router.post("/ingest-trends", response_model=IngestTrendsResponse)
 async def ingest_trends(request: IngestTrendsRequest) -> IngestTrendsResponse:
     """
@@ -223,47 +366,36 @@ async def ingest_trends(request: IngestTrendsRequest) -> IngestTrendsResponse:
     This endpoint fetches data from Reddit and HackerNews, processes it,
     and stores embeddings in PGVector for RAG-based niche identification.
     """
-    from ae_api.genesis.niche_identification import NicheIdentificationEngine, TrendDocument
-    from ae_api.genesis.sources.reddit import RedditSource, SAAS_SUBREDDITS
-    from ae_api.genesis.sources.hackernews import HackerNewsSource
-
     logger.info("ingesting_trends", intent=request.intent, sources=request.sources)
 
     try:
-        all_trends: list[TrendDocument] = []
-        sources_used = []
-
-        # Fetch from Reddit
-        if "reddit" in request.sources:
-            async with RedditSource() as reddit:
-                subreddits = request.subreddits or SAAS_SUBREDDITS[:5]
-                trends = await reddit.fetch_trends(
-                    query=request.intent,
-                    limit=request.limit,
-                    subreddits=subreddits,
-                )
-                all_trends.extend(trends)
-                sources_used.append("reddit")
-                logger.info("reddit_trends_fetched", count=len(trends))
-
-        # Fetch from HackerNews
-        if "hackernews" in request.sources:
-            async with HackerNewsSource() as hn:
-                trends = await hn.fetch_trends(
-                    query=request.intent,
-                    limit=request.limit,
-                )
-                all_trends.extend(trends)
-                sources_used.append("hackernews")
-                logger.info("hackernews_trends_fetched", count=len(trends))
-
-        # Ingest into vector store
-        if all_trends:
-            niche_engine = NicheIdentificationEngine(db_engine=engine)
-            chunks_ingested = await niche_engine.ingest_trends(all_trends)
-            logger.info("trends_ingested", chunks=chunks_ingested)
-        else:
-            chunks_ingested = 0
+        # Fetch from all requested sources concurrently and stream each source's
+        # trends into the vector store as soon as that source completes
+        sources = frozenset(source.lower() for source in request.sources)
+        requested = [name for name in TREND_FETCHERS if name in sources]
+        succeeded: set[str] = set()
+
+        async def _fetch(name: str) -> tuple[str, list[TrendDocument] | Exception]:
+            try:
+                return name, await TREND_FETCHERS[name](request)
+            except Exception as e:
+                return name, e
+
+        async def _stream_trends() -> AsyncIterator[TrendDocument]:
+            for next_done in asyncio.as_completed([_fetch(name) for name in requested]):
+                name, result = await next_done
+                if isinstance(result, Exception):
+                    logger.error("trend_source_failed", source=name, error=str(result))
+                    continue
+                succeeded.add(name)
+                for trend in result:
+                    yield trend
+
+        niche_engine = NicheIdentificationEngine(db_engine=engine)
+        chunks_ingested = await niche_engine.ingest_trends(_stream_trends())
+        logger.info("trends_ingested", chunks=chunks_ingested)
+
+        sources_used = [name for name in requested if name in succeeded]
 
         return IngestTrendsResponse(
             total_ingested=chunks_ingested,
@@ -287,7 +419,9 @@ class IdentifyNichesRequest(BaseModel):
 class IdentifyNichesResponse(BaseModel):
     """Response containing identified niches."""
 
-    niches: list[dict]
+    model_config = ConfigDict(frozen=True)
+
+    niches: list[NicheCandidate]
     total: int
     message: str
 
@@ -300,8 +434,6 @@ async def identify_niches(request: IdentifyNichesRequest) -> IdentifyNichesRespo
     This endpoint uses the NicheIdentificationEngine to search the vector store
     and generate scored niche candidates based on the user's intent.
     """
-    from ae_api.genesis.niche_identification import NicheIdentificationEngine
-
     logger.info("identifying_niches", intent=request.intent, count=request.count)
 
     try:
@@ -311,15 +443,12 @@ async def identify_niches(request: IdentifyNichesRequest) -> IdentifyNichesRespo
             count=request.count,
         )
 
-        # Convert to dicts for JSON response
-        niche_dicts = [niche.model_dump() for niche in niches]
-
-        logger.info("niches_identified", count=len(niche_dicts))
+        logger.info("niches_identified", count=len(niches))
 
         return IdentifyNichesResponse(
-            niches=niche_dicts,
-            total=len(niche_dicts),
-            message=f"Identified {len(niche_dicts)} niche opportunities",
+            niches=niches,
+            total=len(niches),
+            message=f"Identified {len(niches)} niche opportunities",
         )
 
     except Exception as e:
@@ -330,13 +459,15 @@ async def identify_niches(request: IdentifyNichesRequest) -> IdentifyNichesRespo
 class ValidateNicheRequest(BaseModel):
     """Request to validate a niche candidate."""
 
-    niche: dict = Field(description="Niche candidate to validate")
+    niche: NicheCandidate = Field(description="Niche candidate to validate")
 
 
 class ValidateNicheResponse(BaseModel):
     """Response containing validation report."""
 
-    validation_report: dict
+    model_config = ConfigDict(frozen=True)
+
+    validation_report: ValidationReport
     should_pursue: bool
     validation_score: float
     message: str
@@ -350,15 +481,10 @@ async def validate_niche_endpoint(request: ValidateNicheRequest) -> ValidateNich
     This endpoint uses the ValidatorAgent to analyze search volume,
     competition, ARPU, and other metrics to determine viability.
     """
-    from ae_api.genesis.niche_identification import NicheCandidate
-    from ae_api.genesis.validator_agent import ValidatorAgent
-
-    logger.info("validating_niche", niche_name=request.niche.get("name"))
+    niche = request.niche
+    logger.info("validating_niche", niche_name=niche.name)
 
     try:
-        # Convert dict to NicheCandidate
-        niche = NicheCandidate(**request.niche)
-
         async with ValidatorAgent() as validator:
             report = await validator.validate_niche(niche)
 
@@ -370,7 +496,7 @@ async def validate_niche_endpoint(request: ValidateNicheRequest) -> ValidateNich
         )
 
         return ValidateNicheResponse(
-            validation_report=report.model_dump(),
+            validation_report=report,
             should_pursue=report.should_pursue,
             validation_score=report.validation_score,
             message=f"Validation complete: {'Recommended' if report.should_pursue else 'Not recommended'}",
@@ -381,24 +507,109 @@ async def validate_niche_endpoint(request: ValidateNicheRequest) -> ValidateNich
         raise HTTPException(status_code=500, detail=f"Niche validation failed: {e}")
 
 
+class ValidateNichesRequest(BaseModel):
+    """Request to validate several niche candidates at once."""
+
+    niches: list[NicheCandidate] = Field(
+        min_length=1,
+        max_length=20,
+        description="Niche candidates to validate",
+    )
+
+
+class ValidateNichesResponse(BaseModel):
+    """Response containing one validation result per requested niche."""
+
+    model_config = ConfigDict(frozen=True)
+
+    results: list[ValidateNicheResponse]
+    total: int
+    recommended: int
+
+
+@router.post("/validate-niches", response_model=ValidateNichesResponse)
+async def validate_niches_endpoint(request: ValidateNichesRequest) -> ValidateNichesResponse:
+    """
+    Validate multiple niche candidates concurrently.
+
+    Batched counterpart of /validate-niche: one ValidatorAgent (and its HTTP
+    client) is shared across all niches, which are validated in parallel.
+    """
+    logger.info("validating_niches", count=len(request.niches))
+
+    try:
+        async with ValidatorAgent() as validator:
+            reports = await validator.validate_niches(request.niches)
+
+        results = [
+            ValidateNicheResponse(
+                validation_report=report,
+                should_pursue=report.should_pursue,
+                validation_score=report.validation_score,
+                message="Validation complete: "
+                + ("Recommended" if report.should_pursue else "Not recommended"),
+            )
+            for report in reports
+        ]
+        recommended = sum(1 for report in reports if report.should_pursue)
+
+        logger.info("niches_validated", count=len(results), recommended=recommended)
+
+        return ValidateNichesResponse(
+            results=results,
+            total=len(results),
+            recommended=recommended,
+        )
+
+    except Exception as e:
+        logger.error("niche_batch_validation_failed", error=str(e))
+        raise HTTPException(status_code=500, detail=f"Niche validation failed: {e}")
+
+
 class GenerateSpecRequest(BaseModel):
     """Request to generate product specification."""
 
-    niche: dict = Field(description="Validated niche candidate")
+    niche: NicheCandidate = Field(description="Validated niche candidate")
     validation_report: dict = Field(description="Validation report from previous step")
 
 
 class GenerateSpecResponse(BaseModel):
     """Response containing generated specifications."""
 
-    product_spec: dict
-    technical_spec: dict
-    task_graph: dict
+    model_config = ConfigDict(frozen=True)
+
+    product_spec: ProductSpec
+    technical_spec: TechnicalSpec
+    task_graph: TaskGraph
     message: str
 
 
+def _validation_report_for(request: GenerateSpecRequest) -> ValidationReport:
+    """Reconstruct the ValidationReport around the already-validated niche.
+
+    Raises:
+        HTTPException: 422 if the supplied validation report is malformed
+    """
+    try:
+        return ValidationReport.model_validate(
+            {
+                **request.validation_report,
+                "niche": request.niche,
+                "metrics": request.validation_report.get("metrics", {}),
+            }
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=e.errors(include_url=False, include_context=False, include_input=False),
+        ) from e
+
+
 @router.post("/generate-spec", response_model=GenerateSpecResponse)
-async def generate_spec(request: GenerateSpecRequest) -> GenerateSpecResponse:
+async def generate_spec(
+    request: GenerateSpecRequest,
+    runner: Annotated[MetaGPTRunner, Depends(get_metagpt_runner)],
+) -> GenerateSpecResponse:
     """
     Generate complete product specification using MetaGPT.
 
@@ -407,33 +618,13 @@ async def generate_spec(request: GenerateSpecRequest) -> GenerateSpecResponse:
     2. Architect Role -> TechnicalSpec (stack, architecture)
     3. ProjectManager Role -> TaskGraph (implementation tasks)
     """
-    from ae_api.genesis.niche_identification import NicheCandidate
-    from ae_api.genesis.validator_agent import ValidationReport, ValidationMetrics
-    from ae_api.genesis.metapm.metagpt_runner import MetaGPTRunner
+    niche = request.niche
+    logger.info("generating_spec", niche_name=niche.name)
 
-    logger.info("generating_spec", niche_name=request.niche.get("name"))
+    validation_report = _validation_report_for(request)
 
     try:
-        # Convert dicts to domain objects
-        niche = NicheCandidate(**request.niche)
-
-        # Reconstruct ValidationReport
-        report_data = request.validation_report
-        metrics_data = report_data.get("metrics", {})
-        metrics = ValidationMetrics(**metrics_data)
-
-        validation_report = ValidationReport(
-            niche=niche,
-            metrics=metrics,
-            validation_score=report_data.get("validation_score", 0),
-            strengths=report_data.get("strengths", []),
-            weaknesses=report_data.get("weaknesses", []),
-            recommendations=report_data.get("recommendations", []),
-            should_pursue=report_data.get("should_pursue", False),
-        )
-
         # Run MetaGPT workflow
-        runner = MetaGPTRunner()
         product_spec, technical_spec, task_graph = await runner.run(
             niche=niche,
             validation_report=validation_report,
@@ -447,12 +638,42 @@ async def generate_spec(request: GenerateSpecRequest) -> GenerateSpecResponse:
         )
 
         return GenerateSpecResponse(
-            product_spec=product_spec.model_dump(),
-            technical_spec=technical_spec.model_dump(),
-            task_graph=task_graph.model_dump(),
+            product_spec=product_spec,
+            technical_spec=technical_spec,
+            task_graph=task_graph,
             message=f"Generated specification for {product_spec.product_name}",
         )
 
     except Exception as e:
         logger.error("spec_generation_failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Spec generation failed: {e}")
+
+
+@router.post("/generate-spec/stream")
+async def generate_spec_stream(
+    request: GenerateSpecRequest,
+    runner: Annotated[MetaGPTRunner, Depends(get_metagpt_runner)],
+) -> StreamingResponse:
+    """
+    Generate a product specification, streaming each stage as NDJSON.
+
+    Emits one line per MetaGPT stage as soon as that role finishes:
+    {"stage": "product_spec" | "technical_spec" | "task_graph", "data": {...}}.
+    If a role fails, a final {"stage": "error", "detail": ...} line is emitted.
+    """
+    niche = request.niche
+    logger.info("generating_spec_stream", niche_name=niche.name)
+
+    validation_report = _validation_report_for(request)
+
+    async def _frames() -> AsyncIterator[bytes]:
+        try:
+            async for stage, artifact in runner.run_stages(niche, validation_report):
+                yield orjson.dumps({"stage": stage, "data": artifact.model_dump(mode="json")})
+                yield b"\n"
+        except Exception as e:
+            logger.error("spec_stream_failed", error=str(e))
+            yield orjson.dumps({"stage": "error", "detail": "Spec generation failed"})
+            yield b"\n"
+
+    return StreamingResponse(_frames(), media_type="application/x-ndjson")
@@ -1,11 +1,15 @@
 """Model Router API endpoints."""
 
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
+from redis.asyncio import Redis
 
-from ae_api.config import Settings, get_settings
+from ae_api.config import get_settings
+from ae_api.db.redis import get_redis_pool
 from ae_api.economy.classifier import SemanticClassifier
 from ae_api.economy.providers import AnthropicProvider, GoogleProvider, OpenAIProvider
 from ae_api.economy.router import ModelRouter, ModelTier, RoutingDecision
@@ -109,39 +113,82 @@ class BudgetInfo(BaseModel):
 
 
 # Dependency injection
-def get_classifier(
-    settings: Annotated[Settings, Depends(get_settings)]
-) -> SemanticClassifier:
-    """Get classifier instance."""
-    return SemanticClassifier(settings)
-
-
-def get_router(
-    settings: Annotated[Settings, Depends(get_settings)],
-    classifier: Annotated[SemanticClassifier, Depends(get_classifier)]
-) -> ModelRouter:
-    """Get router instance."""
-    return ModelRouter(settings, classifier)
+@lru_cache(maxsize=1)
+def _get_cached_classifier() -> SemanticClassifier:
+    """Build the process-wide classifier (its LLM client is created lazily once)."""
+    return SemanticClassifier(get_settings())
+
+
+@lru_cache(maxsize=1)
+def _get_cached_router() -> ModelRouter:
+    """Build the process-wide router; per-run usage lives in Redis, shared by workers."""
+    return ModelRouter(
+        get_settings(),
+        _get_cached_classifier(),
+        Redis(connection_pool=get_redis_pool()),
+    )
 
 
-def get_providers(
-    settings: Annotated[Settings, Depends(get_settings)]
-) -> dict[str, AnthropicProvider | GoogleProvider | OpenAIProvider]:
-    """Get provider instances."""
+@lru_cache(maxsize=1)
+def _get_cached_providers() -> dict[str, AnthropicProvider | GoogleProvider | OpenAIProvider]:
+    """Build the configured providers once per process."""
+    settings = get_settings()
+    response_cache = Redis(connection_pool=get_redis_pool())
     providers = {}
 
     if settings.openai_api_key:
-        providers["openai"] = OpenAIProvider(settings)
+        providers["openai"] = OpenAIProvider(settings, response_cache)
 
     if settings.anthropic_api_key:
-        providers["anthropic"] = AnthropicProvider(settings)
+        providers["anthropic"] = AnthropicProvider(settings, response_cache)
 
     if settings.google_api_key:
-        providers["google"] = GoogleProvider(settings)
+        providers["google"] = GoogleProvider(settings, response_cache)
 
     return providers
 
 
+async def get_classifier() -> SemanticClassifier:
+    """Get the shared classifier instance."""
+    return _get_cached_classifier()
+
+
+async def get_router() -> ModelRouter:
+    """Get the shared router instance."""
+    return _get_cached_router()
+
+
+async def get_providers() -> dict[str, AnthropicProvider | GoogleProvider | OpenAIProvider]:
+    """Get the shared provider instances."""
+    return _get_cached_providers()
+
+
+# (router tier info, serialized /tiers payload built from it)
+_tier_payload: tuple[dict[str, dict], dict[str, dict]] | None = None
+
+
+def _build_tier_infos(model_router: ModelRouter) -> dict[str, dict]:
+    """Build the serializable /tiers payload once per router tier info.
+
+    The payload is rebuilt only when the router's memoized tier info changes
+    (after invalidate_tier_cache()), so a config reload shows up here too.
+    """
+    global _tier_payload
+    tier_info = model_router.get_tier_info()
+    if _tier_payload is None or _tier_payload[0] is not tier_info:
+        payload = {
+            tier_name: TierInfo(
+                tier=tier_name,
+                models=info["models"],
+                use_cases=info["use_cases"],
+                default_model=info["default_model"],
+            ).model_dump(mode="json")
+            for tier_name, info in tier_info.items()
+        }
+        _tier_payload = (tier_info, payload)
+    return _tier_payload[1]
+
+
 # Endpoints
 @router.post("/route", response_model=RoutingDecision)
 async def route_prompt(
@@ -160,7 +207,7 @@ async def route_prompt(
             override_tier=request.override_tier,
             run_id=request.run_id,
         )
-        return decision
+        return decision.to_api()
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -168,26 +215,20 @@ async def route_prompt(
         )
 
 
-@router.get("/tiers", response_model=dict[str, TierInfo])
+@router.get(
+    "/tiers",
+    response_model=None,
+    responses={200: {"model": dict[str, TierInfo]}},
+)
 async def get_tiers(
     model_router: Annotated[ModelRouter, Depends(get_router)],
-) -> dict[str, TierInfo]:
+) -> ORJSONResponse:
     """Get information about all available model tiers.
 
     Returns configuration, models, and use cases for each tier.
     """
-    tier_info = model_router.get_tier_info()
-
-    result = {}
-    for tier_name, info in tier_info.items():
-        result[tier_name] = TierInfo(
-            tier=tier_name,
-            models=info["models"],
-            use_cases=info["use_cases"],
-            default_model=info["default_model"],
-        )
-
-    return result
+    # Validated once when cached; skip re-validating the static payload per request
+    return ORJSONResponse(_build_tier_infos(model_router))
 
 
 @router.post("/complete", response_model=CompleteResponse)
@@ -200,9 +241,20 @@ async def complete_prompt(
 
     This endpoint combines routing and completion:
     1. Routes the prompt to appropriate model tier
-    2. Generates completion using selected model
-    3. Records cost and usage
+    2. Reserves the estimated cost against the run budget
+    3. Generates completion using selected model
+    4. Records the actual cost in place of the reservation
+
+    With `override_tier` set, routing skips classification and only resolves
+    the tier's model, so the provider call starts without an LLM round trip.
     """
+    # Fail before paying for a classification call whose result can't be used
+    if not providers:
+        raise HTTPException(
+            status_code=400,
+            detail="No LLM providers configured. Please set at least one API key."
+        )
+
     try:
         # Route the prompt
         decision = await model_router.route(
@@ -221,21 +273,38 @@ async def complete_prompt(
                        f"Please set the appropriate API key."
             )
 
+        # Reserve the estimate atomically so concurrent requests for one run
+        # cannot all pass the budget check before any of them is recorded
+        run_id = request.run_id
+        reserved = 0.0
+        if run_id:
+            if not await model_router.reserve_budget(run_id, decision.estimated_cost):
+                raise HTTPException(
+                    status_code=402,
+                    detail=f"Run {run_id} has no budget left for this completion",
+                )
+            reserved = decision.estimated_cost
+
         # Generate completion
-        completion = await provider.complete(
-            prompt=request.prompt,
-            model=decision.model_id,
-            temperature=request.temperature,
-            max_tokens=request.max_tokens,
-        )
+        try:
+            completion = await provider.complete(
+                prompt=request.prompt,
+                model=decision.model_id,
+                temperature=request.temperature,
+                max_tokens=request.max_tokens,
+            )
+        except Exception:
+            if run_id:
+                await model_router.record_usage(run_id, -reserved)
+            raise
 
-        # Record usage if run_id provided
-        if request.run_id:
-            model_router.record_usage(request.run_id, completion.cost)
+        # Replace the reserved estimate with the actual cost
+        if run_id:
+            await model_router.record_usage(run_id, completion.cost - reserved)
 
         return CompleteResponse(
             content=completion.content,
-            routing_decision=decision,
+            routing_decision=decision.to_api(),
             actual_cost=completion.cost,
             usage=completion.usage,
         )
@@ -253,14 +322,13 @@ async def complete_prompt(
 async def get_budget_info(
     run_id: str,
     model_router: Annotated[ModelRouter, Depends(get_router)],
-    settings: Annotated[Settings, Depends(get_settings)],
 ) -> BudgetInfo:
     """Get budget information for a run.
 
     Returns current usage, total budget, and remaining budget.
     """
-    usage = model_router.get_run_usage(run_id)
-    budget = settings.default_run_budget
+    usage = await model_router.get_run_usage(run_id)
+    budget = model_router.settings.default_run_budget
     remaining = max(0, budget - usage)
     utilization = (usage / budget * 100) if budget > 0 else 0
 
@@ -282,5 +350,5 @@ async def reset_budget(
 
     Clears all recorded usage for the specified run ID.
     """
-    model_router.reset_run_budget(run_id)
+    await model_router.reset_run_budget(run_id)
     return {"message": f"Budget reset for run {run_id}"}
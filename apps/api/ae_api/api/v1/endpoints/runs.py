@@ -1,17 +1,31 @@
 """Run management API endpoints."""
 
+import base64
+from datetime import datetime, timedelta
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import structlog
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select, tuple_
+from sqlalchemy import update as sa_update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ae_api.db.session import get_session
+from ae_api.db.session import async_session_maker, get_session
 from ae_api.db.models import Run, RunStatus, RunType
+from ae_api.orchestration.temporal_client import TemporalClient, get_temporal_client
 
+logger = structlog.get_logger()
 router = APIRouter()
 
+_CANCELLABLE_STATUSES = (RunStatus.PENDING, RunStatus.RUNNING, RunStatus.CANCEL_FAILED)
+
+# A run still `cancelling` after this long lost its background cancellation
+# (worker restart or failed DB write) and may be claimed again
+_CANCELLING_RECLAIM_AFTER = timedelta(minutes=5)
+
 
 class RunResponse(BaseModel):
     """Response model for a run."""
@@ -26,6 +40,7 @@ class RunResponse(BaseModel):
     error_message: str | None
     created_at: str
     updated_at: str
+    version: int
 
     class Config:
         from_attributes = True
@@ -35,9 +50,14 @@ class RunListResponse(BaseModel):
     """Response model for listing runs."""
 
     runs: list[RunResponse]
-    total: int
+    total: int = Field(
+        description="Matching runs; with a cursor, the number remaining from this page onward"
+    )
     page: int
     page_size: int
+    next_cursor: str | None = Field(
+        default=None, description="Pass as `after` to fetch the next page"
+    )
 
 
 class RunStatusUpdate(BaseModel):
@@ -45,57 +65,132 @@ class RunStatusUpdate(BaseModel):
 
     status: RunStatus
     error_message: str | None = None
+    expected_version: int | None = Field(
+        default=None,
+        description="Apply only if the run is still at this version; 409 otherwise",
+    )
+
+
+# Only the columns RunResponse exposes; skips the JSON payload columns and the
+# ORM identity map on the listing hot path.
+_RUN_LIST_COLUMNS = (
+    Run.id,
+    Run.project_id,
+    Run.workflow_id,
+    Run.run_type,
+    Run.status,
+    Run.tokens_used,
+    Run.cost_incurred,
+    Run.error_message,
+    Run.created_at,
+    Run.updated_at,
+    Run.version,
+)
 
 
-@router.get("/", response_model=RunListResponse)
+def _encode_cursor(created_at: datetime, run_id: str) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{run_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by _encode_cursor.
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        created_at, run_id = base64.urlsafe_b64decode(cursor).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), run_id
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+@router.get(
+    "/",
+    response_model=None,
+    responses={200: {"model": RunListResponse}},
+)
 async def list_runs(
     session: Annotated[AsyncSession, Depends(get_session)],
     project_id: str | None = Query(None, description="Filter by project ID"),
     run_type: RunType | None = Query(None, description="Filter by run type"),
     status: RunStatus | None = Query(None, description="Filter by status"),
-    page: int = Query(1, ge=1, description="Page number"),
+    after: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    page: int = Query(
+        1, ge=1, description="Page number (ignored when `after` is given)", deprecated=True
+    ),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-) -> RunListResponse:
-    """List runs with optional filtering."""
-    query = select(Run)
-
+) -> ORJSONResponse:
+    """List runs with optional filtering.
+
+    Prefer cursor pagination via `after`: it seeks on (created_at, id) so deep
+    pages cost the same as the first. OFFSET-based `page` is kept for existing
+    clients.
+    """
+    filters = []
     if project_id:
-        query = query.where(Run.project_id == project_id)
+        filters.append(Run.project_id == project_id)
     if run_type:
-        query = query.where(Run.run_type == run_type)
+        filters.append(Run.run_type == run_type)
     if status:
-        query = query.where(Run.status == status)
+        filters.append(Run.status == status)
 
-    # Get total count
-    count_result = await session.execute(query)
-    total = len(count_result.scalars().all())
+    query = select(*_RUN_LIST_COLUMNS, func.count().over().label("total")).where(*filters)
 
-    # Apply pagination
-    query = query.offset((page - 1) * page_size).limit(page_size)
-    query = query.order_by(Run.created_at.desc())
+    if after:
+        query = query.where(tuple_(Run.created_at, Run.id) < _decode_cursor(after))
+        offset = 0
+    else:
+        offset = (page - 1) * page_size
+
+    # Page rows and the filtered total come back in a single round trip
+    query = query.order_by(Run.created_at.desc(), Run.id.desc())
+    query = query.offset(offset).limit(page_size)
 
     result = await session.execute(query)
-    runs = result.scalars().all()
-
-    return RunListResponse(
-        runs=[
-            RunResponse(
-                id=run.id,
-                project_id=run.project_id,
-                workflow_id=run.workflow_id,
-                run_type=run.run_type.value,
-                status=run.status.value,
-                tokens_used=run.tokens_used,
-                cost_incurred=run.cost_incurred,
-                error_message=run.error_message,
-                created_at=run.created_at.isoformat(),
-                updated_at=run.updated_at.isoformat(),
-            )
-            for run in runs
-        ],
-        total=total,
-        page=page,
-        page_size=page_size,
+
+    # Rows come straight from typed columns, so serialize them without a
+    # RunResponse validation pass per row. Built in a single pass over the
+    # result, with no intermediate list of row mappings.
+    runs = []
+    total = 0
+    last = None
+    for row in result.mappings():
+        runs.append(
+            {
+                "id": row["id"],
+                "project_id": row["project_id"],
+                "workflow_id": row["workflow_id"],
+                "run_type": row["run_type"],
+                "status": row["status"],
+                "tokens_used": row["tokens_used"],
+                "cost_incurred": row["cost_incurred"],
+                "error_message": row["error_message"],
+                "created_at": row["created_at"].isoformat(),
+                "updated_at": row["updated_at"].isoformat(),
+                "version": row["version"],
+            }
+        )
+        total = row["total"]
+        last = row
+
+    # A page past the end has no rows to carry the window count
+    if not runs and offset > 0:
+        total = await session.scalar(select(func.count()).select_from(Run).where(*filters))
+
+    has_more = offset + len(runs) < total
+    next_cursor = _encode_cursor(last["created_at"], last["id"]) if has_more else None
+
+    return ORJSONResponse(
+        {
+            "runs": runs,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        }
     )
 
 
@@ -122,6 +217,7 @@ async def get_run(
         error_message=run.error_message,
         created_at=run.created_at.isoformat(),
         updated_at=run.updated_at.isoformat(),
+        version=run.version,
     )
 
 
@@ -131,59 +227,115 @@ async def update_run_status(
     update: RunStatusUpdate,
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> RunResponse:
-    """Update a run's status."""
-    result = await session.execute(select(Run).where(Run.id == run_id))
-    run = result.scalar_one_or_none()
+    """Update a run's status.
 
-    if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
-
-    run.status = update.status
+    Pass `expected_version` (from a previous read) to reject the update with
+    409 if another writer changed the run in the meantime.
+    """
+    values: dict = {"status": update.status, "version": Run.version + 1}
     if update.error_message:
-        run.error_message = update.error_message
+        values["error_message"] = update.error_message
+
+    conditions = [Run.id == run_id]
+    if update.expected_version is not None:
+        conditions.append(Run.version == update.expected_version)
+
+    # One round trip: RETURNING hands back the post-update row, so there is
+    # no SELECT beforehand or refresh afterwards
+    result = await session.execute(
+        sa_update(Run).where(*conditions).values(**values).returning(*_RUN_LIST_COLUMNS)
+    )
+    row = result.mappings().one_or_none()
+
+    if row is None:
+        exists = await session.scalar(select(Run.id).where(Run.id == run_id))
+        if exists is None:
+            raise HTTPException(status_code=404, detail="Run not found")
+        raise HTTPException(status_code=409, detail="Run was modified concurrently")
 
     await session.commit()
-    await session.refresh(run)
 
     return RunResponse(
-        id=run.id,
-        project_id=run.project_id,
-        workflow_id=run.workflow_id,
-        run_type=run.run_type.value,
-        status=run.status.value,
-        tokens_used=run.tokens_used,
-        cost_incurred=run.cost_incurred,
-        error_message=run.error_message,
-        created_at=run.created_at.isoformat(),
-        updated_at=run.updated_at.isoformat(),
+        id=row["id"],
+        project_id=row["project_id"],
+        workflow_id=row["workflow_id"],
+        run_type=row["run_type"],
+        status=row["status"],
+        tokens_used=row["tokens_used"],
+        cost_incurred=row["cost_incurred"],
+        error_message=row["error_message"],
+        created_at=row["created_at"].isoformat(),
+        updated_at=row["updated_at"].isoformat(),
+        version=row["version"],
     )
 
 
-@router.delete("/{run_id}")
+async def _cancel_workflow(run_id: str, workflow_id: str, temporal: TemporalClient) -> None:
+    """Cancel a run's workflow and record the outcome (runs after the response)."""
+    try:
+        await temporal.cancel_workflow(workflow_id)
+        values: dict = {"status": RunStatus.CANCELLED}
+    except Exception as e:
+        logger.exception("Workflow cancellation failed", run_id=run_id, workflow_id=workflow_id)
+        values = {"status": RunStatus.CANCEL_FAILED, "error_message": f"Failed to cancel: {e}"}
+
+    try:
+        async with async_session_maker() as session:
+            await session.execute(
+                sa_update(Run)
+                .where(Run.id == run_id, Run.status == RunStatus.CANCELLING)
+                .values(**values, version=Run.version + 1)
+            )
+            await session.commit()
+    except SQLAlchemyError:
+        logger.exception(
+            "Failed to record cancellation outcome",
+            run_id=run_id,
+            workflow_id=workflow_id,
+            status=values["status"],
+        )
+
+
+@router.delete("/{run_id}", status_code=202)
 async def cancel_run(
     run_id: str,
+    background_tasks: BackgroundTasks,
     session: Annotated[AsyncSession, Depends(get_session)],
+    temporal: Annotated[TemporalClient, Depends(get_temporal_client)],
 ) -> dict:
-    """Cancel a running workflow."""
-    from ae_api.orchestration.temporal_client import TemporalClient
-
-    result = await session.execute(select(Run).where(Run.id == run_id))
-    run = result.scalar_one_or_none()
-
-    if not run:
-        raise HTTPException(status_code=404, detail="Run not found")
+    """Request cancellation of a running workflow.
+
+    The run moves to `cancelling` immediately and the Temporal cancellation
+    happens after the response is sent; the run then settles on `cancelled`
+    or `cancel_failed` (which may be retried). A run left in `cancelling`
+    for longer than _CANCELLING_RECLAIM_AFTER can be cancelled again.
+    """
+    # Claim the run in the same statement that checks it is still cancellable,
+    # so concurrent cancels can't both pass the check
+    result = await session.execute(
+        sa_update(Run)
+        .where(
+            Run.id == run_id,
+            or_(
+                Run.status.in_(_CANCELLABLE_STATUSES),
+                and_(
+                    Run.status == RunStatus.CANCELLING,
+                    Run.updated_at < func.now() - _CANCELLING_RECLAIM_AFTER,
+                ),
+            ),
+        )
+        .values(status=RunStatus.CANCELLING, version=Run.version + 1)
+        .returning(Run.workflow_id)
+    )
+    workflow_id = result.scalar_one_or_none()
 
-    if run.status not in [RunStatus.PENDING, RunStatus.RUNNING]:
+    if workflow_id is None:
+        exists = await session.scalar(select(Run.id).where(Run.id == run_id))
+        if exists is None:
+            raise HTTPException(status_code=404, detail="Run not found")
         raise HTTPException(status_code=400, detail="Run is not active")
 
-    try:
-        client = TemporalClient()
-        await client.connect()
-        await client.cancel_workflow(run.workflow_id)
-
-        run.status = RunStatus.CANCELLED
-        await session.commit()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to cancel: {e}")
+    await session.commit()
+    background_tasks.add_task(_cancel_workflow, run_id, workflow_id, temporal)
 
-    return {"status": "cancelled", "run_id": run_id}
+    return {"status": "cancellation_pending", "run_id": run_id}
@@ -1,5 +1,6 @@
 """Safety and governance API endpoints."""
 
+from functools import lru_cache
 from typing import Any
 
 import structlog
@@ -7,15 +8,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 from redis.asyncio import Redis
 
+from ae_api.db.redis import get_redis_pool
 from ae_api.safety import ActionType, BudgetStatus, BudgetTracker, PolicyDecision, PolicyGate
 
 logger = structlog.get_logger()
 router = APIRouter()
 
-# Global instances (will be initialized with dependency injection)
-_policy_gate: PolicyGate | None = None
-_budget_tracker: BudgetTracker | None = None
-
 
 # Request/Response Models
 class CheckActionRequest(BaseModel):
@@ -55,45 +53,33 @@ class CanSpendResponse(BaseModel):
     current_status: BudgetStatus = Field(description="Current budget status")
 
 
-# Dependency injection for Redis client
-async def get_redis() -> Redis:
-    """Get Redis client for budget tracking."""
-    from ae_api.config import get_settings
+# Dependency injection
+@lru_cache(maxsize=1)
+def _policy_gate_singleton() -> PolicyGate:
+    """Build the process-wide PolicyGate."""
+    # TODO: Load from config
+    return PolicyGate(
+        enable_code_execution=True,
+        enable_network_access=True,
+        enable_deployments=True,
+        enable_billing=True,
+    )
 
-    settings = get_settings()
 
-    redis = Redis(
-        host=settings.redis_host,
-        port=settings.redis_port,
-        db=settings.redis_db,
-        password=settings.redis_password.get_secret_value() if settings.redis_password else None,
-        decode_responses=True,
-        socket_connect_timeout=5,
-    )
-    try:
-        yield redis
-    finally:
-        await redis.aclose()
-
-
-def get_policy_gate() -> PolicyGate:
-    """Get or create PolicyGate instance."""
-    global _policy_gate
-    if _policy_gate is None:
-        # Initialize with default settings
-        # TODO: Load from config
-        _policy_gate = PolicyGate(
-            enable_code_execution=True,
-            enable_network_access=True,
-            enable_deployments=True,
-            enable_billing=True,
-        )
-    return _policy_gate
+async def get_policy_gate() -> PolicyGate:
+    """Get the shared PolicyGate instance."""
+    return _policy_gate_singleton()
+
 
+@lru_cache(maxsize=1)
+def _budget_tracker_singleton() -> BudgetTracker:
+    """Build the process-wide BudgetTracker bound to the shared pool."""
+    return BudgetTracker(Redis(connection_pool=get_redis_pool()))
 
-async def get_budget_tracker(redis: Redis = Depends(get_redis)) -> BudgetTracker:
-    """Get or create BudgetTracker instance."""
-    return BudgetTracker(redis)
+
+async def get_budget_tracker() -> BudgetTracker:
+    """Get the shared BudgetTracker instance."""
+    return _budget_tracker_singleton()
 
 
 # Endpoints
@@ -112,7 +98,7 @@ async def check_action(
         Policy decision with allowed status and reasoning
     """
     try:
-        logger.info("Checking action policy", action=request.action, context=request.context)
+        logger.debug("Checking action policy", action=request.action, context=request.context)
         decision = policy_gate.check_action(request.action, request.context)
         return decision
 
@@ -139,7 +125,7 @@ async def create_budget(
         Initial budget status
     """
     try:
-        logger.info("Creating budget", run_id=request.run_id, limit=request.limit)
+        logger.debug("Creating budget", run_id=request.run_id, limit=request.limit)
         budget_status = await tracker.create_budget(request.run_id, request.limit)
         return budget_status
 
@@ -172,7 +158,7 @@ async def spend_budget(
         Updated budget status
     """
     try:
-        logger.info("Recording spend", run_id=request.run_id, amount=request.amount)
+        logger.debug("Recording spend", run_id=request.run_id, amount=request.amount)
         budget_status = await tracker.spend(request.run_id, request.amount)
         return budget_status
 
@@ -205,7 +191,7 @@ async def get_budget_status(
         Current budget status
     """
     try:
-        logger.info("Getting budget status", run_id=run_id)
+        logger.debug("Getting budget status", run_id=run_id)
         budget_status = await tracker.get_status(run_id)
         return budget_status
 
@@ -238,9 +224,10 @@ async def can_spend(
         Response indicating if spending is allowed and current status
     """
     try:
-        logger.info("Checking can spend", run_id=request.run_id, amount=request.amount)
-        can_spend_result = await tracker.check_can_spend(request.run_id, request.amount)
-        current_status = await tracker.get_status(request.run_id)
+        logger.debug("Checking can spend", run_id=request.run_id, amount=request.amount)
+        can_spend_result, current_status = await tracker.check_and_status(
+            request.run_id, request.amount
+        )
 
         return CanSpendResponse(
             can_spend=can_spend_result,
@@ -273,7 +260,7 @@ async def delete_budget(
         run_id: Unique identifier for the run
     """
     try:
-        logger.info("Deleting budget", run_id=run_id)
+        logger.debug("Deleting budget", run_id=run_id)
         await tracker.delete_budget(run_id)
 
     except Exception as e:
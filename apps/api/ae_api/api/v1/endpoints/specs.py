@@ -89,28 +89,28 @@ async def get_spec(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> LivingSpec:
     """Get the living specification for a project."""
+    # Only the columns the spec renders; skips intent, architecture, etc.
     result = await session.execute(
-        select(Project).where(Project.id == project_id)
+        select(Project.status, Project.tech_stack).where(Project.id == project_id)
     )
-    project = result.scalar_one_or_none()
+    project = result.one_or_none()
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Get latest spec artifact
-    spec_result = await session.execute(
-        select(Artifact)
+    # Latest spec version only, never the artifact content; index-only scan
+    spec_version = await session.scalar(
+        select(Artifact.version)
         .where(Artifact.project_id == project_id)
         .where(Artifact.artifact_type == ArtifactType.SPEC)
         .order_by(Artifact.version.desc())
         .limit(1)
     )
-    spec_artifact = spec_result.scalar_one_or_none()
 
     # Build spec from project and artifact
     return LivingSpec(
-        project_id=project.id,
-        version=spec_artifact.version if spec_artifact else 1,
+        project_id=project_id,
+        version=spec_version or 1,
         status=project.status.value,
         directives=[
             SpecDirective(id="1", content="Use TypeScript for all code"),
@@ -132,10 +132,7 @@ async def update_spec(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> LivingSpec:
     """Update the living specification."""
-    result = await session.execute(
-        select(Project).where(Project.id == project_id)
-    )
-    project = result.scalar_one_or_none()
+    project = await session.scalar(select(Project.id).where(Project.id == project_id))
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -1,9 +1,9 @@
 """Configuration management for the Autonomous Enterprise API."""
 
-from functools import lru_cache
+from functools import cached_property
 from typing import Literal
 
-from pydantic import Field, PostgresDsn, SecretStr
+from pydantic import Field, PostgresDsn, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +15,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        defer_build=True,
     )
 
     # Application
@@ -22,12 +23,31 @@ class Settings(BaseSettings):
     app_version: str = "0.1.0"
     debug: bool = False
     environment: Literal["development", "staging", "production"] = "development"
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
 
     # Database
     database_url: PostgresDsn = Field(
         default="postgresql+asyncpg://ae:ae@localhost:5432/ae"
     )
 
+    @field_validator("database_url", mode="before")
+    @classmethod
+    def _use_asyncpg_driver(cls, value: object) -> object:
+        """Pin driverless Postgres URLs to asyncpg so queries never run on a sync driver."""
+        if isinstance(value, str):
+            for scheme in ("postgres://", "postgresql://", "postgresql+psycopg2://"):
+                if value.startswith(scheme):
+                    return "postgresql+asyncpg://" + value[len(scheme):]
+        return value
+
+    @cached_property
+    def database_url_str(self) -> str:
+        """Database URL as a plain string, stringified once per settings instance."""
+        return str(self.database_url)
+
+    # Connections opened at startup, before the first request (0 disables)
+    db_pool_warmup: int = Field(default=5, ge=0, le=20)
+
     # Temporal
     temporal_host: str = "localhost:7233"
     temporal_namespace: str = "default"
@@ -43,10 +63,18 @@ class Settings(BaseSettings):
     tier2_model: str = "gpt-5.2"  # GPT-5.2
     tier3_model: str = "gemini-3-pro-preview"  # Gemini 3 Pro Preview
 
+    # Seconds to cache low-temperature LLM completions in Redis (0 disables)
+    llm_cache_ttl: int = Field(default=86400, ge=0)
+
     # Cost Budgets (per run, in USD)
     default_run_budget: float = 10.0
     max_run_budget: float = 100.0
 
+    # In-process run usage tracking (without Redis): runs kept, and seconds
+    # a run's usage survives after its last update
+    budget_cache_size: int = Field(default=100_000, ge=1)
+    budget_cache_ttl: int = Field(default=86400, ge=1)
+
     # Stripe
     stripe_api_key: SecretStr | None = None
     stripe_webhook_secret: SecretStr | None = None
@@ -75,7 +103,12 @@ class Settings(BaseSettings):
     vector_dimensions: int = 1536
 
 
-@lru_cache
+_SETTINGS: Settings | None = None
+
+
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = Settings()
+    return _SETTINGS
@@ -2,8 +2,12 @@
 
 from ae_api.db.models.base import Base
 from ae_api.db.models.project import Project, ProjectStatus
-from ae_api.db.models.run import Run, RunStatus
+from ae_api.db.models.run import Run, RunStatus, RunType
 from ae_api.db.models.artifact import Artifact, ArtifactType
+
+# Imported eagerly on purpose: Project's relationships resolve these classes by
+# name when mappers configure, and alembic/env.py relies on this import to
+# register the genesis tables on Base.metadata.
 from ae_api.db.models.genesis import (
     NicheCandidate,
     NicheStatus,
@@ -19,6 +23,7 @@ __all__ = [
     "ProjectStatus",
     "Run",
     "RunStatus",
+    "RunType",
     "Artifact",
     "ArtifactType",
     # Genesis models
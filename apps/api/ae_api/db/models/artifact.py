@@ -3,10 +3,10 @@
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from ae_api.db.models.base import Base
+from ae_api.db.models.base import Base, pg_enum
 
 if TYPE_CHECKING:
     from ae_api.db.models.project import Project
@@ -29,14 +29,21 @@ class Artifact(Base):
     """Artifact model for storing generated project outputs."""
 
     __tablename__ = "artifacts"
+    __table_args__ = (
+        # Latest version of a given artifact type per project; btree scans
+        # backward for ORDER BY version DESC, so no DESC column is needed
+        Index("ix_artifacts_project_type_version", "project_id", "artifact_type", "version"),
+    )
 
     project_id: Mapped[str] = mapped_column(
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
     )
-    artifact_type: Mapped[ArtifactType] = mapped_column(String(50), nullable=False)
+    artifact_type: Mapped[ArtifactType] = mapped_column(
+        pg_enum(ArtifactType, "artifact_type"), nullable=False
+    )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, default=1, server_default="1", nullable=False)
 
     # Storage
     storage_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
@@ -44,8 +51,12 @@ class Artifact(Base):
     content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)  # SHA256
 
     # Metadata
-    mime_type: Mapped[str] = mapped_column(String(100), default="text/plain")
-    size_bytes: Mapped[int] = mapped_column(Integer, default=0)
+    mime_type: Mapped[str] = mapped_column(
+        String(100), default="text/plain", server_default="text/plain"
+    )
+    size_bytes: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     # Relationships
-    project: Mapped["Project"] = relationship("Project", back_populates="artifacts")
+    project: Mapped["Project"] = relationship(
+        "Project", back_populates="artifacts", lazy="raise_on_sql"
+    )
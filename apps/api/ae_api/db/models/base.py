@@ -1,13 +1,25 @@
 """Base model for SQLAlchemy."""
 
 from datetime import datetime
+from enum import Enum
 from uuid import uuid4
 
 from sqlalchemy import DateTime, func
+from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+def pg_enum(enum_cls: type[Enum], name: str) -> SAEnum:
+    """Native Postgres ENUM type that stores each member's value rather than its name."""
+    return SAEnum(
+        enum_cls,
+        name=name,
+        native_enum=True,
+        values_callable=lambda members: [member.value for member in members],
+    )
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
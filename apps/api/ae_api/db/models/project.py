@@ -3,10 +3,11 @@
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, String, Text, Float
+from sqlalchemy import String, Text, Float
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from ae_api.db.models.base import Base
+from ae_api.db.models.base import Base, pg_enum
 
 if TYPE_CHECKING:
     from ae_api.db.models.run import Run
@@ -40,8 +41,9 @@ class Project(Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     intent: Mapped[str] = mapped_column(Text, nullable=False)  # Original user intent
     status: Mapped[ProjectStatus] = mapped_column(
-        String(50),
+        pg_enum(ProjectStatus, "project_status"),
         default=ProjectStatus.IDEATION,
+        server_default=ProjectStatus.IDEATION.value,
         nullable=False,
     )
 
@@ -51,8 +53,8 @@ class Project(Base):
     estimated_mrr: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     # Technical spec
-    tech_stack: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    architecture: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    tech_stack: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    architecture: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     # Deployment
     repository_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
@@ -65,23 +67,49 @@ class Project(Base):
     payment_link_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
 
     # Budget
-    budget_limit: Mapped[float] = mapped_column(Float, default=10.0, nullable=False)
-    budget_spent: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    budget_limit: Mapped[float] = mapped_column(
+        Float, default=10.0, server_default="10.0", nullable=False
+    )
+    budget_spent: Mapped[float] = mapped_column(
+        Float, default=0.0, server_default="0", nullable=False
+    )
 
-    # Relationships
-    runs: Mapped[list["Run"]] = relationship("Run", back_populates="project")
-    artifacts: Mapped[list["Artifact"]] = relationship("Artifact", back_populates="project")
+    # Relationships never lazy-load: async callers must selectinload() them at
+    # the query site. passive_deletes leaves child cleanup to ON DELETE CASCADE
+    # instead of loading every child row before a delete.
+    runs: Mapped[list["Run"]] = relationship(
+        "Run", back_populates="project", lazy="raise_on_sql", passive_deletes=True
+    )
+    artifacts: Mapped[list["Artifact"]] = relationship(
+        "Artifact", back_populates="project", lazy="raise_on_sql", passive_deletes=True
+    )
 
     # Genesis relationships
     niche_candidates: Mapped[list["NicheCandidate"]] = relationship(
-        "NicheCandidate", back_populates="project", cascade="all, delete-orphan"
+        "NicheCandidate",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     product_specs: Mapped[list["ProductSpec"]] = relationship(
-        "ProductSpec", back_populates="project", cascade="all, delete-orphan"
+        "ProductSpec",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     technical_specs: Mapped[list["TechnicalSpec"]] = relationship(
-        "TechnicalSpec", back_populates="project", cascade="all, delete-orphan"
+        "TechnicalSpec",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     task_graphs: Mapped[list["TaskGraph"]] = relationship(
-        "TaskGraph", back_populates="project", cascade="all, delete-orphan"
+        "TaskGraph",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
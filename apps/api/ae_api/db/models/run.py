@@ -3,10 +3,11 @@
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, ForeignKey, String, Text, Float
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from ae_api.db.models.base import Base
+from ae_api.db.models.base import Base, pg_enum
 
 if TYPE_CHECKING:
     from ae_api.db.models.project import Project
@@ -19,7 +20,9 @@ class RunStatus(str, Enum):
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLING = "cancelling"
     CANCELLED = "cancelled"
+    CANCEL_FAILED = "cancel_failed"
     PAUSED = "paused"
 
 
@@ -37,30 +40,56 @@ class Run(Base):
     """Run model tracking individual workflow executions."""
 
     __tablename__ = "runs"
+    __table_args__ = (
+        # Serves GET /runs/ filtered by project without a separate sort step
+        Index("ix_runs_project_id_created_at", "project_id", "created_at"),
+        # Covers the full set of list_runs filters plus the keyset order; the
+        # windowed count is index-only. error_message is left out so long
+        # messages can't exceed the btree tuple size limit.
+        Index(
+            "ix_runs_filter",
+            "project_id",
+            "status",
+            "run_type",
+            "created_at",
+            "id",
+            postgresql_include=["workflow_id", "tokens_used", "cost_incurred", "updated_at"],
+        ),
+    )
 
     project_id: Mapped[str] = mapped_column(
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
     )
     workflow_id: Mapped[str] = mapped_column(String(255), nullable=False)
-    run_type: Mapped[RunType] = mapped_column(String(50), nullable=False)
+    run_type: Mapped[RunType] = mapped_column(pg_enum(RunType, "run_type"), nullable=False)
     status: Mapped[RunStatus] = mapped_column(
-        String(50),
+        pg_enum(RunStatus, "run_status"),
         default=RunStatus.PENDING,
+        server_default=RunStatus.PENDING.value,
         nullable=False,
     )
 
+    # Optimistic concurrency: bumped on every write so stale updates are detected
+    version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
     # Input/Output
-    input_data: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    output_data: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    input_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    output_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Cost tracking
-    tokens_used: Mapped[int] = mapped_column(default=0, nullable=False)
-    cost_incurred: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    tokens_used: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    cost_incurred: Mapped[float] = mapped_column(
+        Float, default=0.0, server_default="0", nullable=False
+    )
+
+    __mapper_args__ = {"version_id_col": version}
 
     # Model routing stats
-    model_routing: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    model_routing: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
     # Relationships
-    project: Mapped["Project"] = relationship("Project", back_populates="runs")
+    project: Mapped["Project"] = relationship(
+        "Project", back_populates="runs", lazy="raise_on_sql"
+    )
@@ -0,0 +1,34 @@
+"""Redis connection management."""
+
+from functools import lru_cache
+
+from redis.asyncio import ConnectionPool, Redis
+
+from ae_api.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_redis_pool() -> ConnectionPool:
+    """Get the shared Redis connection pool."""
+    settings = get_settings()
+
+    return ConnectionPool(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_db,
+        password=settings.redis_password.get_secret_value() if settings.redis_password else None,
+        decode_responses=True,
+        socket_connect_timeout=5,
+    )
+
+
+async def close_redis_pool() -> None:
+    """Disconnect the shared Redis connection pool (called on app shutdown)."""
+    if get_redis_pool.cache_info().currsize:
+        await get_redis_pool().disconnect()
+        get_redis_pool.cache_clear()
+
+
+async def get_redis() -> Redis:
+    """Get Redis client backed by the shared connection pool."""
+    return Redis(connection_pool=get_redis_pool())
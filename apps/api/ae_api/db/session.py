@@ -1,6 +1,7 @@
 """Database session management."""
 
 from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
@@ -9,11 +10,13 @@ from ae_api.config import get_settings
 settings = get_settings()
 
 engine = create_async_engine(
-    str(settings.database_url),
+    settings.database_url_str,
     echo=settings.debug,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_recycle=1800,
 )
 
 async_session_maker = async_sessionmaker(
@@ -25,6 +28,20 @@ async_session_maker = async_sessionmaker(
 )
 
 
+async def warm_up_pool(connections: int) -> None:
+    """Open pooled connections ahead of traffic so early requests skip connect latency.
+
+    The connections are held open together so the pool establishes distinct
+    ones, then returned to it ready for reuse.
+
+    Args:
+        connections: Number of connections to establish
+    """
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            await stack.enter_async_context(engine.connect())
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Get async database session."""
     async with async_session_maker() as session:
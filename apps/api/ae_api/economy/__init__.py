@@ -10,6 +10,7 @@ from ae_api.economy.router import (
     ModelRouter,
     ModelTier,
     RoutingDecision,
+    RoutingResult,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "ModelRouter",
     "ModelTier",
     "RoutingDecision",
+    "RoutingResult",
 ]
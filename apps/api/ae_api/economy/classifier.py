@@ -1,13 +1,61 @@
 """Task classification for intelligent model routing."""
 
+import hashlib
+import json
 import re
 from enum import Enum
+from typing import TYPE_CHECKING
 
-from langchain_anthropic import ChatAnthropic
-from pydantic import BaseModel, Field
+from cachetools import TTLCache
+from pydantic import BaseModel, ConfigDict, Field
 
 from ae_api.config import Settings
 
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+
+# Agentic pipelines re-route the same prompts repeatedly; a short TTL keeps
+# classifications fresh if the classification prompt or model changes.
+CLASSIFICATION_CACHE_SIZE = 10_000
+CLASSIFICATION_CACHE_TTL = 300
+
+# Fallback for replies that wrap the JSON object in prose or code fences
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Words for keyword lookup; prompts are lowercased before tokenizing
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+# Prompts longer than this never take the low-complexity shortcut
+HEURISTIC_LOW_MAX_WORDS = 12
+HEURISTIC_REASONING = "Matched a decisive complexity keyword; LLM classification skipped"
+
+
+def _keyword_words(keywords: list[str]) -> frozenset[str]:
+    """Single-word keywords plus their plural forms, for whole-token lookup."""
+    return frozenset(
+        form for keyword in keywords if " " not in keyword for form in (keyword, keyword + "s")
+    )
+
+
+def _keyword_phrases(keywords: list[str]) -> re.Pattern[str] | None:
+    """Word-bounded regex for multi-word keywords, which tokenizing splits apart."""
+    phrases = [re.escape(keyword) for keyword in keywords if " " in keyword]
+    if not phrases:
+        return None
+    return re.compile(r"\b(?:" + "|".join(phrases) + r")\b")
+
+
+def _has_keyword(
+    tokens: set[str],
+    prompt_lower: str,
+    words: frozenset[str],
+    phrases: re.Pattern[str] | None,
+) -> bool:
+    """Check a tokenized, lowercased prompt against one keyword group."""
+    if not tokens.isdisjoint(words):
+        return True
+    return phrases is not None and phrases.search(prompt_lower) is not None
+
 
 class TaskComplexity(str, Enum):
     """Task complexity levels."""
@@ -28,6 +76,9 @@ class TaskRisk(str, Enum):
 class ClassificationResult(BaseModel):
     """Result of task classification."""
 
+    # Built via model_construct on the hot path; defer schema build past import
+    model_config = ConfigDict(defer_build=True)
+
     complexity: TaskComplexity = Field(
         ..., description="Complexity level of the task"
     )
@@ -65,20 +116,44 @@ class SemanticClassifier:
         ],
     }
 
-    CLASSIFICATION_PROMPT = """You are a task complexity classifier. Analyze the following task and rate its complexity on a scale of 1-10.
+    # Complexity keywords decisive enough to skip the LLM call
+    COMPLEXITY_KEYWORDS = {
+        TaskComplexity.HIGH: [
+            "architecture", "redesign", "distributed", "consensus", "migration strategy",
+        ],
+        TaskComplexity.LOW: [
+            "typo", "lint", "format", "formatting", "rename", "comment", "docstring",
+        ],
+    }
+
+    # Matched as whole words so "api" no longer fires inside "capital"
+    _RISK_WORDS = {risk: _keyword_words(kws) for risk, kws in RISK_KEYWORDS.items()}
+    _RISK_PHRASES = {risk: _keyword_phrases(kws) for risk, kws in RISK_KEYWORDS.items()}
+    _COMPLEXITY_WORDS = {
+        level: _keyword_words(kws) for level, kws in COMPLEXITY_KEYWORDS.items()
+    }
+    _COMPLEXITY_PHRASES = {
+        level: _keyword_phrases(kws) for level, kws in COMPLEXITY_KEYWORDS.items()
+    }
+
+    # Task text goes between prefix and suffix by concatenation, so the JSON
+    # braces need no format escaping
+    CLASSIFICATION_PROMPT_PREFIX = """You are a task complexity classifier. Analyze the following task and rate its complexity on a scale of 1-10.
 
 Consider these factors:
 - 1-3 (LOW): Simple, routine tasks like formatting, linting, basic CRUD, simple queries
 - 4-7 (MEDIUM): Standard implementation tasks like building features, writing tests, documentation, integrations
 - 8-10 (HIGH): Complex tasks requiring deep reasoning like architecture design, debugging complex issues, security reviews, performance optimization
 
-Task: {prompt}
+Task: """
+
+    CLASSIFICATION_PROMPT_SUFFIX = """
 
 Respond with ONLY a JSON object in this format:
-{{
+{
   "score": <1-10>,
   "reasoning": "<brief explanation of why this score>"
-}}"""
+}"""
 
     def __init__(self, settings: Settings):
         """Initialize the classifier.
@@ -88,14 +163,19 @@ Respond with ONLY a JSON object in this format:
         """
         self.settings = settings
         self._llm = None
+        self._cache: TTLCache = TTLCache(
+            maxsize=CLASSIFICATION_CACHE_SIZE, ttl=CLASSIFICATION_CACHE_TTL
+        )
 
     @property
-    def llm(self) -> ChatAnthropic:
+    def llm(self) -> "ChatAnthropic":
         """Lazy-load the LLM for classification."""
         if self._llm is None:
             if not self.settings.anthropic_api_key:
                 raise ValueError("Anthropic API key not configured")
 
+            from langchain_anthropic import ChatAnthropic
+
             self._llm = ChatAnthropic(
                 model="claude-opus-4-5-20251101",  # Premium model for accurate classification
                 api_key=self.settings.anthropic_api_key.get_secret_value(),
@@ -114,19 +194,50 @@ Respond with ONLY a JSON object in this format:
             TaskRisk level
         """
         prompt_lower = prompt.lower()
+        tokens = set(_TOKEN_RE.findall(prompt_lower))
 
-        # Check sensitive keywords first
-        for keyword in self.RISK_KEYWORDS[TaskRisk.SENSITIVE]:
-            if keyword in prompt_lower:
-                return TaskRisk.SENSITIVE
-
-        # Check moderate keywords
-        for keyword in self.RISK_KEYWORDS[TaskRisk.MODERATE]:
-            if keyword in prompt_lower:
-                return TaskRisk.MODERATE
+        # Check sensitive keywords first, then moderate
+        for risk in (TaskRisk.SENSITIVE, TaskRisk.MODERATE):
+            if _has_keyword(
+                tokens, prompt_lower, self._RISK_WORDS[risk], self._RISK_PHRASES[risk]
+            ):
+                return risk
 
         return TaskRisk.SAFE
 
+    def _heuristic_score(self, prompt: str) -> int | None:
+        """Score obviously simple or obviously complex tasks without the LLM.
+
+        Args:
+            prompt: Task prompt to classify
+
+        Returns:
+            Complexity score, or None when the LLM should decide
+        """
+        prompt_lower = prompt.lower()
+        words = _TOKEN_RE.findall(prompt_lower)
+        tokens = set(words)
+
+        high = _has_keyword(
+            tokens,
+            prompt_lower,
+            self._COMPLEXITY_WORDS[TaskComplexity.HIGH],
+            self._COMPLEXITY_PHRASES[TaskComplexity.HIGH],
+        )
+        low = len(words) <= HEURISTIC_LOW_MAX_WORDS and _has_keyword(
+            tokens,
+            prompt_lower,
+            self._COMPLEXITY_WORDS[TaskComplexity.LOW],
+            self._COMPLEXITY_PHRASES[TaskComplexity.LOW],
+        )
+
+        # Mixed signals ("fix typo in architecture doc") go to the LLM
+        if high and not low:
+            return 9
+        if low and not high:
+            return 2
+        return None
+
     def _score_to_complexity(self, score: int) -> TaskComplexity:
         """Map complexity score to complexity level.
 
@@ -159,44 +270,66 @@ Respond with ONLY a JSON object in this format:
         else:
             return "TIER1"  # Architect - complex tasks
 
-    async def classify(self, prompt: str, context: dict | None = None) -> ClassificationResult:
-        """Classify a task based on its prompt.
+    def _parse_llm_score(self, response: object) -> tuple[int, str]:
+        """Extract the complexity score and reasoning from a classifier reply.
 
         Args:
-            prompt: Task prompt to classify
-            context: Optional additional context for classification
+            response: Message returned by the classification LLM
 
         Returns:
-            ClassificationResult with complexity, risk, and tier suggestion
+            Tuple of (score, reasoning)
         """
-        # Risk classification (keyword-based, no LLM needed)
-        risk = self._classify_risk(prompt)
+        response_text = response.content if hasattr(response, 'content') else str(response)
 
-        # Complexity classification using LLM
-        classification_prompt = self.CLASSIFICATION_PROMPT.format(prompt=prompt)
+        # The prompt asks for JSON only, so parse the reply directly first
+        try:
+            result = json.loads(response_text.strip())
+        except ValueError:
+            json_match = _JSON_RE.search(response_text)
+            result = json.loads(json_match.group()) if json_match else None
+
+        if isinstance(result, dict):
+            return int(result.get("score", 5)), result.get("reasoning", "No reasoning provided")
+
+        # Fallback to medium complexity
+        return 5, "Could not parse LLM response, defaulting to medium complexity"
+
+    def _error_score(self, error: Exception) -> tuple[int, str, bool]:
+        """Medium-complexity fallback for a failed LLM call; never cached so it is retried."""
+        reasoning = f"Error during classification: {str(error)}. Defaulting to medium complexity"
+        return 5, reasoning, False
+
+    async def _score_with_llm(self, prompt: str) -> tuple[int, str, bool]:
+        """Score task complexity with the classification LLM.
+
+        Args:
+            prompt: Task prompt to classify
+
+        Returns:
+            Tuple of (score, reasoning, cacheable); error fallbacks are not cacheable
+        """
+        classification_prompt = (
+            self.CLASSIFICATION_PROMPT_PREFIX + prompt + self.CLASSIFICATION_PROMPT_SUFFIX
+        )
 
         try:
             response = await self.llm.ainvoke(classification_prompt)
-            response_text = response.content if hasattr(response, 'content') else str(response)
-
-            # Extract JSON from response
-            import json
-            # Try to find JSON in response
-            json_match = re.search(r'\{[^}]+\}', response_text)
-            if json_match:
-                result = json.loads(json_match.group())
-                score = int(result.get("score", 5))
-                reasoning = result.get("reasoning", "No reasoning provided")
-            else:
-                # Fallback to medium complexity
-                score = 5
-                reasoning = "Could not parse LLM response, defaulting to medium complexity"
-
+            score, reasoning = self._parse_llm_score(response)
+            return score, reasoning, True
         except Exception as e:
-            # Fallback on error
-            score = 5
-            reasoning = f"Error during classification: {str(e)}. Defaulting to medium complexity"
+            return self._error_score(e)
+
+    def _build_result(self, risk: TaskRisk, score: int, reasoning: str) -> ClassificationResult:
+        """Assemble a classification from a risk level and complexity score.
 
+        Args:
+            risk: Keyword-based risk level
+            score: Complexity score, clamped to 1-10 here
+            reasoning: Explanation of the score
+
+        Returns:
+            ClassificationResult with complexity, risk, and tier suggestion
+        """
         # Ensure score is in valid range
         score = max(1, min(10, score))
 
@@ -208,10 +341,109 @@ Respond with ONLY a JSON object in this format:
             reasoning += " [Upgraded to TIER1 due to sensitive operations]"
             suggested_tier = "TIER1"
 
-        return ClassificationResult(
+        # Every field was computed above and is already typed; skip re-validation
+        return ClassificationResult.model_construct(
             complexity=complexity,
             risk=risk,
             complexity_score=score,
             reasoning=reasoning,
             suggested_tier=suggested_tier,
         )
+
+    async def classify(self, prompt: str, context: dict | None = None) -> ClassificationResult:
+        """Classify a task based on its prompt.
+
+        Args:
+            prompt: Task prompt to classify
+            context: Optional additional context for classification
+
+        Returns:
+            ClassificationResult with complexity, risk, and tier suggestion
+        """
+        # Only the prompt feeds the classification, so it alone is the cache key
+        key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Risk classification (keyword-based, no LLM needed)
+        risk = self._classify_risk(prompt)
+
+        # Complexity classification: keyword shortcut first, LLM for the rest
+        score = self._heuristic_score(prompt)
+        if score is not None:
+            reasoning = HEURISTIC_REASONING
+            cacheable = True
+        else:
+            score, reasoning, cacheable = await self._score_with_llm(prompt)
+
+        result = self._build_result(risk, score, reasoning)
+        if cacheable:
+            self._cache[key] = result
+        return result
+
+    async def classify_many(self, prompts: list[str]) -> list[ClassificationResult]:
+        """Classify several tasks, sending every LLM-bound prompt in one batch.
+
+        Cached and keyword-decided prompts never reach the LLM, and duplicate
+        prompts within the batch are classified once.
+
+        Args:
+            prompts: Task prompts to classify
+
+        Returns:
+            ClassificationResults in the same order as prompts
+        """
+        results: list[ClassificationResult | None] = [None] * len(prompts)
+        pending: dict[bytes, list[int]] = {}
+
+        for index, prompt in enumerate(prompts):
+            key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+            cached = self._cache.get(key)
+            if cached is not None:
+                results[index] = cached
+                continue
+
+            if key in pending:
+                pending[key].append(index)
+                continue
+
+            score = self._heuristic_score(prompt)
+            if score is None:
+                pending[key] = [index]
+                continue
+
+            result = self._build_result(self._classify_risk(prompt), score, HEURISTIC_REASONING)
+            self._cache[key] = result
+            results[index] = result
+
+        if pending:
+            batch = [prompts[indices[0]] for indices in pending.values()]
+            prefix, suffix = self.CLASSIFICATION_PROMPT_PREFIX, self.CLASSIFICATION_PROMPT_SUFFIX
+            try:
+                responses = await self.llm.abatch(
+                    [prefix + prompt + suffix for prompt in batch],
+                    return_exceptions=True,
+                )
+            except Exception as e:
+                responses = [e] * len(batch)
+
+            for (key, indices), prompt, response in zip(
+                pending.items(), batch, responses, strict=True
+            ):
+                if isinstance(response, Exception):
+                    score, reasoning, cacheable = self._error_score(response)
+                else:
+                    try:
+                        score, reasoning = self._parse_llm_score(response)
+                        cacheable = True
+                    except Exception as e:
+                        score, reasoning, cacheable = self._error_score(e)
+
+                result = self._build_result(self._classify_risk(prompt), score, reasoning)
+                if cacheable:
+                    self._cache[key] = result
+                for index in indices:
+                    results[index] = result
+
+        return results
@@ -1,13 +1,35 @@
 """LLM provider implementations for model router."""
 
-from ae_api.economy.providers.anthropic import AnthropicProvider
-from ae_api.economy.providers.base import BaseProvider, CompletionResponse
-from ae_api.economy.providers.google import GoogleProvider
-from ae_api.economy.providers.openai import OpenAIProvider
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from ae_api.economy.providers.base import BaseProvider, CompletionResponse, StreamChunk
+
+if TYPE_CHECKING:
+    from ae_api.economy.providers.anthropic import AnthropicProvider
+    from ae_api.economy.providers.google import GoogleProvider
+    from ae_api.economy.providers.openai import OpenAIProvider
+
+# Provider modules are imported on first attribute access (PEP 562)
+_LAZY_PROVIDERS = {
+    "AnthropicProvider": "ae_api.economy.providers.anthropic",
+    "GoogleProvider": "ae_api.economy.providers.google",
+    "OpenAIProvider": "ae_api.economy.providers.openai",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import provider classes on demand."""
+    module = _LAZY_PROVIDERS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
+
 
 __all__ = [
     "BaseProvider",
     "CompletionResponse",
+    "StreamChunk",
     "AnthropicProvider",
     "GoogleProvider",
     "OpenAIProvider",
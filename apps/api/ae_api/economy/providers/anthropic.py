@@ -1,9 +1,22 @@
 """Anthropic provider implementation."""
 
-from langchain_anthropic import ChatAnthropic
+from typing import TYPE_CHECKING, Any
 
 from ae_api.config import Settings
-from ae_api.economy.providers.base import BaseProvider, CompletionResponse
+from ae_api.economy.providers.base import (
+    EMPTY_METADATA,
+    BaseProvider,
+    CompletionResponse,
+    cache_llm,
+)
+
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+    from redis.asyncio import Redis
+
+
+# Sonnet pricing (input, output) per 1M tokens for unlisted models
+_FALLBACK_PRICING = (3.0, 15.0)
 
 
 class AnthropicProvider(BaseProvider):
@@ -15,12 +28,14 @@ class AnthropicProvider(BaseProvider):
         "claude-opus-4-5-20251101": (15.0, 75.0),  # Claude Opus 4.5
     }
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, response_cache: "Redis | None" = None):
         """Initialize Anthropic provider.
 
         Args:
             settings: Application settings
+            response_cache: Redis client for caching low-temperature completions
         """
+        super().__init__(response_cache, settings.llm_cache_ttl)
         self.settings = settings
 
         if not settings.anthropic_api_key:
@@ -28,6 +43,25 @@ class AnthropicProvider(BaseProvider):
 
         self._api_key = settings.anthropic_api_key.get_secret_value()
 
+    def _build_llm(
+        self,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any
+    ) -> "ChatAnthropic":
+        """Construct a Anthropic chat model for the given parameters."""
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(
+            model=model,
+            api_key=self._api_key,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+
+    @cache_llm
     async def complete(
         self,
         prompt: str,
@@ -48,28 +82,24 @@ class AnthropicProvider(BaseProvider):
         Returns:
             CompletionResponse with generated content
         """
-        llm = ChatAnthropic(
-            model=model,
-            api_key=self._api_key,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs
-        )
+        llm = self._get_llm(model, temperature, max_tokens, **kwargs)
 
         response = await llm.ainvoke(prompt)
 
-        # Extract content and metadata
-        content = response.content if hasattr(response, 'content') else str(response)
+        # Extract content and metadata (chat models always return an AIMessage)
+        try:
+            content = response.content
+            metadata = response.response_metadata
+        except AttributeError:
+            content, metadata = str(response), EMPTY_METADATA
 
         # Get usage information
-        usage = {}
-        if hasattr(response, 'response_metadata'):
-            usage_data = response.response_metadata.get('usage', {})
-            usage = {
-                'input_tokens': usage_data.get('input_tokens', 0),
-                'output_tokens': usage_data.get('output_tokens', 0),
-                'total_tokens': usage_data.get('input_tokens', 0) + usage_data.get('output_tokens', 0),
-            }
+        usage_data = metadata.get('usage') or EMPTY_METADATA
+        usage = {
+            'input_tokens': usage_data.get('input_tokens', 0),
+            'output_tokens': usage_data.get('output_tokens', 0),
+            'total_tokens': usage_data.get('input_tokens', 0) + usage_data.get('output_tokens', 0),
+        }
 
         # Calculate cost
         cost = self.calculate_cost(
@@ -99,4 +129,4 @@ class AnthropicProvider(BaseProvider):
         Returns:
             Tuple of (input_price, output_price) per 1M tokens in USD
         """
-        return self.PRICING.get(model, (3.0, 15.0))  # Default to Sonnet pricing
+        return self.PRICING.get(model, _FALLBACK_PRICING)
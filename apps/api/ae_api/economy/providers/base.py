@@ -1,39 +1,252 @@
 """Base provider interface for LLM providers."""
 
+import contextlib
+import hashlib
+import inspect
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Coroutine
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypeVar
 
-from pydantic import BaseModel, Field
+import httpx
+import orjson
+import structlog
+from cachetools import LRUCache
+from redis.exceptions import RedisError
 
+from ae_api.economy.tokens import count_tokens
 
-class CompletionResponse(BaseModel):
-    """Response from LLM completion."""
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from redis.asyncio import Redis
 
-    content: str = Field(
-        ..., description="Generated text content"
-    )
-    model: str = Field(
-        ..., description="Model used for generation"
-    )
-    provider: str = Field(
-        ..., description="Provider name"
-    )
-    usage: dict[str, int] = Field(
-        default_factory=dict,
-        description="Token usage statistics"
-    )
-    cost: float = Field(
-        default=0.0,
-        description="Actual cost in USD"
-    )
-    metadata: dict = Field(
-        default_factory=dict,
-        description="Additional metadata from provider"
+logger = structlog.get_logger()
+
+# Distinct (model, temperature, max_tokens) combinations kept per provider
+LLM_CACHE_SIZE = 32
+
+# Batch API requests are billed at half the synchronous per-token price
+BATCH_PRICE_MULTIPLIER = 0.5
+
+# Read-only stand-in for missing response metadata, shared by all providers
+EMPTY_METADATA: MappingProxyType = MappingProxyType({})
+
+# Completions are cached only when sampling is close to deterministic
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.2
+RESPONSE_CACHE_KEY_PREFIX = "llm_cache:"
+
+# Connection pool for the HTTP client shared by chat models that accept one.
+# Sized above httpx's default of 100 so router and genesis fan-out is bounded
+# by provider rate limits rather than by waiting for a pooled connection.
+HTTP_MAX_CONNECTIONS = 1024
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 256
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+HTTP_CONNECT_TIMEOUT_SECONDS = 10.0
+HTTP_TIMEOUT_SECONDS = 120.0
+
+
+@lru_cache(maxsize=1)
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client for LLM API calls."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
     )
 
 
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client (called on app shutdown)."""
+    if get_shared_http_client.cache_info().currsize:
+        await get_shared_http_client().aclose()
+        get_shared_http_client.cache_clear()
+
+
+@dataclass(slots=True)
+class CompletionResponse:
+    """Response from LLM completion.
+
+    Internal to the providers and only serialized to the response cache
+    (orjson handles dataclasses), so it is a slotted dataclass rather than a
+    validated pydantic model.
+    """
+
+    content: str  # Generated text content
+    model: str  # Model used for generation
+    provider: str  # Provider name
+    usage: dict[str, int] = field(default_factory=dict)  # Token usage statistics
+    cost: float = 0.0  # Actual cost in USD
+    metadata: dict = field(default_factory=dict)  # Additional metadata from provider
+
+
+@dataclass(slots=True)
+class StreamChunk:
+    """Incremental piece of a streamed completion."""
+
+    content: str  # Newly generated text
+    output_tokens: int  # Tokens in this chunk
+    cost: float  # Running cost of the completion so far in USD
+
+
+P = ParamSpec("P")
+ProviderT = TypeVar("ProviderT", bound="BaseProvider")
+
+
+def cache_llm(
+    complete: Callable[Concatenate[ProviderT, P], Coroutine[Any, Any, CompletionResponse]],
+) -> Callable[Concatenate[ProviderT, P], Coroutine[Any, Any, CompletionResponse]]:
+    """Cache a provider's low-temperature completions in Redis.
+
+    The key is a hash of the model, sampling parameters, extra kwargs and the
+    stripped prompt. Hits are returned with cost 0 and metadata["cache_hit"]
+    set, so replayed prompts are not charged to a run budget again. Redis
+    errors never fail the completion; the call simply goes to the provider.
+    The decorated method keeps its signature, so it still overrides
+    BaseProvider.complete cleanly.
+    """
+    signature = inspect.signature(complete)
+
+    @wraps(complete)
+    async def wrapper(self: ProviderT, /, *args: P.args, **kwargs: P.kwargs) -> CompletionResponse:
+        cache = self._response_cache
+        if cache is None:
+            return await complete(self, *args, **kwargs)
+
+        call = signature.bind(self, *args, **kwargs)
+        call.apply_defaults()
+        model = call.arguments["model"]
+        key = self._response_cache_key(
+            call.arguments["prompt"],
+            model,
+            call.arguments["temperature"],
+            call.arguments["max_tokens"],
+            call.arguments.get("kwargs", {}),
+        )
+        if key is None:
+            return await complete(self, *args, **kwargs)
+
+        cached = None
+        with contextlib.suppress(RedisError):
+            cached = await cache.get(key)
+
+        if cached is not None:
+            response = CompletionResponse(**orjson.loads(cached))
+            response.cost = 0.0
+            response.metadata["cache_hit"] = True
+            return response
+
+        response = await complete(self, *args, **kwargs)
+        response.metadata["cache_hit"] = False
+        try:
+            await cache.set(key, orjson.dumps(response), ex=self._response_cache_ttl)
+        except RedisError as e:
+            logger.debug("Failed to cache LLM completion", model=model, error=str(e))
+        return response
+
+    return wrapper
+
+
 class BaseProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    def __init__(self, response_cache: "Redis | None" = None, response_cache_ttl: int = 0):
+        """Initialize the chat model, per-token price and response caches.
+
+        Args:
+            response_cache: Redis client for cached completions (None disables)
+            response_cache_ttl: Seconds to keep cached completions (0 disables)
+        """
+        self._llms: LRUCache = LRUCache(maxsize=LLM_CACHE_SIZE)
+        self._token_prices: dict[str, tuple[float, float]] = {}
+        self._response_cache = response_cache if response_cache_ttl > 0 else None
+        self._response_cache_ttl = response_cache_ttl
+
+    def _response_cache_key(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        kwargs: dict[str, Any],
+    ) -> str | None:
+        """Build the response cache key, or None if the call must not be cached."""
+        if (
+            self._response_cache is None
+            or temperature > RESPONSE_CACHE_MAX_TEMPERATURE
+            or kwargs.get("stream")
+        ):
+            return None
+
+        try:
+            extra = orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS) if kwargs else b""
+        except TypeError:
+            return None
+
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{model}|{temperature}|{max_tokens}|".encode())
+        digest.update(extra)
+        digest.update(b"|")
+        digest.update(prompt.strip().encode())
+        return f"{RESPONSE_CACHE_KEY_PREFIX}{digest.hexdigest()}"
+
+    @abstractmethod
+    def _build_llm(
+        self,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any
+    ) -> "BaseChatModel":
+        """Construct a LangChain chat model for the given parameters.
+
+        Args:
+            model: Model identifier
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Configured chat model
+        """
+        pass
+
+    def _get_llm(
+        self,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any
+    ) -> "BaseChatModel":
+        """Get a chat model, reusing it (and its pooled HTTP client) across calls.
+
+        Provider-specific kwargs are part of the cache key; calls whose kwargs
+        are not hashable get a fresh model.
+
+        Args:
+            model: Model identifier
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Configured chat model
+        """
+        try:
+            key = (model, temperature, max_tokens, frozenset(kwargs.items()))
+            llm = self._llms.get(key)
+        except TypeError:
+            return self._build_llm(model, temperature, max_tokens, **kwargs)
+
+        if llm is None:
+            llm = self._build_llm(model, temperature, max_tokens, **kwargs)
+            self._llms[key] = llm
+        return llm
+
     @abstractmethod
     async def complete(
         self,
@@ -57,6 +270,45 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def complete_stream(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        **kwargs
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a completion, tracking output tokens and cost as chunks arrive.
+
+        Output tokens are counted locally with tiktoken, since providers only
+        report usage once the stream ends (if at all).
+
+        Args:
+            prompt: Input prompt
+            model: Model identifier
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            StreamChunk for each non-empty piece of generated text
+        """
+        llm = self._get_llm(model, temperature, max_tokens, **kwargs)
+        input_tokens = count_tokens(prompt, model)
+        output_tokens = 0
+
+        async for chunk in llm.astream(prompt):
+            content = chunk.content if isinstance(chunk.content, str) else ""
+            if not content:
+                continue
+            tokens = count_tokens(content, model)
+            output_tokens += tokens
+            yield StreamChunk(
+                content=content,
+                output_tokens=tokens,
+                cost=self.calculate_cost(input_tokens, output_tokens, model),
+            )
+
     @abstractmethod
     def get_pricing(self, model: str) -> tuple[float, float]:
         """Get pricing for a model.
@@ -85,9 +337,11 @@ class BaseProvider(ABC):
         Returns:
             Cost in USD
         """
-        input_price, output_price = self.get_pricing(model)
-
-        input_cost = (input_tokens / 1_000_000) * input_price
-        output_cost = (output_tokens / 1_000_000) * output_price
+        # Per-1M prices are converted to per-token once per model
+        prices = self._token_prices.get(model)
+        if prices is None:
+            input_price, output_price = self.get_pricing(model)
+            prices = (input_price / 1_000_000, output_price / 1_000_000)
+            self._token_prices[model] = prices
 
-        return input_cost + output_cost
+        return input_tokens * prices[0] + output_tokens * prices[1]
@@ -1,9 +1,22 @@
 """Google provider implementation."""
 
-from langchain_google_genai import ChatGoogleGenerativeAI
+from typing import TYPE_CHECKING, Any
 
 from ae_api.config import Settings
-from ae_api.economy.providers.base import BaseProvider, CompletionResponse
+from ae_api.economy.providers.base import (
+    EMPTY_METADATA,
+    BaseProvider,
+    CompletionResponse,
+    cache_llm,
+)
+
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from redis.asyncio import Redis
+
+
+# Pricing (input, output) per 1M tokens for unlisted models
+_FALLBACK_PRICING = (0.5, 2.0)
 
 
 class GoogleProvider(BaseProvider):
@@ -15,12 +28,14 @@ class GoogleProvider(BaseProvider):
         "gemini-3-pro-preview": (10.0, 40.0),  # Gemini 3 Pro Preview
     }
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, response_cache: "Redis | None" = None):
         """Initialize Google provider.
 
         Args:
             settings: Application settings
+            response_cache: Redis client for caching low-temperature completions
         """
+        super().__init__(response_cache, settings.llm_cache_ttl)
         self.settings = settings
 
         if not settings.google_api_key:
@@ -28,6 +43,25 @@ class GoogleProvider(BaseProvider):
 
         self._api_key = settings.google_api_key.get_secret_value()
 
+    def _build_llm(
+        self,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any
+    ) -> "ChatGoogleGenerativeAI":
+        """Construct a Google chat model for the given parameters."""
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(
+            model=model,
+            google_api_key=self._api_key,
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+            **kwargs
+        )
+
+    @cache_llm
     async def complete(
         self,
         prompt: str,
@@ -48,28 +82,24 @@ class GoogleProvider(BaseProvider):
         Returns:
             CompletionResponse with generated content
         """
-        llm = ChatGoogleGenerativeAI(
-            model=model,
-            google_api_key=self._api_key,
-            temperature=temperature,
-            max_output_tokens=max_tokens,
-            **kwargs
-        )
+        llm = self._get_llm(model, temperature, max_tokens, **kwargs)
 
         response = await llm.ainvoke(prompt)
 
-        # Extract content and metadata
-        content = response.content if hasattr(response, 'content') else str(response)
+        # Extract content and metadata (chat models always return an AIMessage)
+        try:
+            content = response.content
+            metadata = response.response_metadata
+        except AttributeError:
+            content, metadata = str(response), EMPTY_METADATA
 
         # Get usage information
-        usage = {}
-        if hasattr(response, 'response_metadata'):
-            usage_metadata = response.response_metadata.get('usage_metadata', {})
-            usage = {
-                'input_tokens': usage_metadata.get('prompt_token_count', 0),
-                'output_tokens': usage_metadata.get('candidates_token_count', 0),
-                'total_tokens': usage_metadata.get('total_token_count', 0),
-            }
+        usage_metadata = metadata.get('usage_metadata') or EMPTY_METADATA
+        usage = {
+            'input_tokens': usage_metadata.get('prompt_token_count', 0),
+            'output_tokens': usage_metadata.get('candidates_token_count', 0),
+            'total_tokens': usage_metadata.get('total_token_count', 0),
+        }
 
         # Calculate cost
         cost = self.calculate_cost(
@@ -99,4 +129,4 @@ class GoogleProvider(BaseProvider):
         Returns:
             Tuple of (input_price, output_price) per 1M tokens in USD
         """
-        return self.PRICING.get(model, (0.5, 2.0))  # Default fallback pricing
+        return self.PRICING.get(model, _FALLBACK_PRICING)
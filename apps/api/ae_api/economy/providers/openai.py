@@ -1,9 +1,33 @@
 """OpenAI provider implementation."""
 
-from langchain_openai import ChatOpenAI
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+import orjson
 
 from ae_api.config import Settings
-from ae_api.economy.providers.base import BaseProvider, CompletionResponse
+from ae_api.economy.providers.base import (
+    BATCH_PRICE_MULTIPLIER,
+    EMPTY_METADATA,
+    BaseProvider,
+    CompletionResponse,
+    cache_llm,
+    get_shared_http_client,
+)
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+    from openai import AsyncOpenAI
+    from redis.asyncio import Redis
+
+
+# Pricing (input, output) per 1M tokens for unlisted models
+_FALLBACK_PRICING = (1.0, 3.0)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+_BATCH_FAILED_STATUSES = frozenset({"failed", "expired", "cancelled"})
 
 
 class OpenAIProvider(BaseProvider):
@@ -15,19 +39,153 @@ class OpenAIProvider(BaseProvider):
         "gpt-5.2": (15.0, 60.0),  # GPT-5.2
     }
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, response_cache: "Redis | None" = None):
         """Initialize OpenAI provider.
 
         Args:
             settings: Application settings
+            response_cache: Redis client for caching low-temperature completions
         """
+        super().__init__(response_cache, settings.llm_cache_ttl)
         self.settings = settings
 
         if not settings.openai_api_key:
             raise ValueError("OpenAI API key not configured")
 
         self._api_key = settings.openai_api_key.get_secret_value()
+        self._client: AsyncOpenAI | None = None
+
+    def _build_llm(
+        self,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any
+    ) -> "ChatOpenAI":
+        """Construct an OpenAI chat model for the given parameters."""
+        from langchain_openai import ChatOpenAI
+
+        return ChatOpenAI(
+            model=model,
+            api_key=self._api_key,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            http_async_client=get_shared_http_client(),
+            **kwargs
+        )
+
+    def _get_client(self) -> "AsyncOpenAI":
+        """Get the raw OpenAI SDK client used for the Batch API."""
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(
+                api_key=self._api_key,
+                http_client=get_shared_http_client(),
+            )
+        return self._client
+
+    async def submit_batch(self, requests: list[dict[str, Any]]) -> str:
+        """Submit chat completion requests to the OpenAI Batch API.
+
+        Batch requests complete within 24 hours at half the synchronous price,
+        so this suits offline workloads that do not need an immediate answer.
+
+        Args:
+            requests: Items with a unique "custom_id" and a chat completions
+                request "body" (model, messages, ...)
+
+        Returns:
+            Batch identifier to pass to poll_batch()
+        """
+        client = self._get_client()
+        jsonl = b"\n".join(
+            orjson.dumps({
+                "custom_id": request["custom_id"],
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": request["body"],
+            })
+            for request in requests
+        )
+
+        batch_file = await client.files.create(file=("batch.jsonl", jsonl), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW,
+        )
+        return batch.id
+
+    async def poll_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 30.0,
+        timeout: float | None = None,
+    ) -> dict[str, CompletionResponse]:
+        """Wait for a batch to finish and collect its completions.
 
+        Args:
+            batch_id: Identifier returned by submit_batch()
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to wait (None waits for the batch window)
+
+        Returns:
+            Completions keyed by custom_id; requests that errored are omitted
+
+        Raises:
+            RuntimeError: If the batch failed, expired, or was cancelled
+            TimeoutError: If the batch is still running after timeout seconds
+        """
+        client = self._get_client()
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            batch = await client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in _BATCH_FAILED_STATUSES:
+                raise RuntimeError(f"OpenAI batch {batch_id} {batch.status}")
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"OpenAI batch {batch_id} still {batch.status}")
+            await asyncio.sleep(poll_interval)
+
+        if not batch.output_file_id:
+            return {}
+
+        output = await client.files.content(batch.output_file_id)
+        results = {}
+        for line in output.content.splitlines():
+            if not line:
+                continue
+            record = orjson.loads(line)
+            response = record.get("response")
+            if not response or response.get("status_code") != 200:
+                continue
+
+            body = response["body"]
+            token_usage = body.get("usage") or {}
+            usage = {
+                'input_tokens': token_usage.get('prompt_tokens', 0),
+                'output_tokens': token_usage.get('completion_tokens', 0),
+                'total_tokens': token_usage.get('total_tokens', 0),
+            }
+            model = body.get("model", "")
+
+            results[record["custom_id"]] = CompletionResponse(
+                content=body["choices"][0]["message"]["content"] or "",
+                model=model,
+                provider="openai",
+                usage=usage,
+                cost=self.calculate_cost(
+                    usage['input_tokens'], usage['output_tokens'], model
+                ) * BATCH_PRICE_MULTIPLIER,
+                metadata={'batch_id': batch_id},
+            )
+
+        return results
+
+    @cache_llm
     async def complete(
         self,
         prompt: str,
@@ -48,28 +206,24 @@ class OpenAIProvider(BaseProvider):
         Returns:
             CompletionResponse with generated content
         """
-        llm = ChatOpenAI(
-            model=model,
-            api_key=self._api_key,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            **kwargs
-        )
+        llm = self._get_llm(model, temperature, max_tokens, **kwargs)
 
         response = await llm.ainvoke(prompt)
 
-        # Extract content and metadata
-        content = response.content if hasattr(response, 'content') else str(response)
+        # Extract content and metadata (chat models always return an AIMessage)
+        try:
+            content = response.content
+            metadata = response.response_metadata
+        except AttributeError:
+            content, metadata = str(response), EMPTY_METADATA
 
         # Get usage information
-        usage = {}
-        if hasattr(response, 'response_metadata'):
-            token_usage = response.response_metadata.get('token_usage', {})
-            usage = {
-                'input_tokens': token_usage.get('prompt_tokens', 0),
-                'output_tokens': token_usage.get('completion_tokens', 0),
-                'total_tokens': token_usage.get('total_tokens', 0),
-            }
+        token_usage = metadata.get('token_usage') or EMPTY_METADATA
+        usage = {
+            'input_tokens': token_usage.get('prompt_tokens', 0),
+            'output_tokens': token_usage.get('completion_tokens', 0),
+            'total_tokens': token_usage.get('total_tokens', 0),
+        }
 
         # Calculate cost
         cost = self.calculate_cost(
@@ -99,4 +253,4 @@ class OpenAIProvider(BaseProvider):
         Returns:
             Tuple of (input_price, output_price) per 1M tokens in USD
         """
-        return self.PRICING.get(model, (1.0, 3.0))  # Default fallback pricing
+        return self.PRICING.get(model, _FALLBACK_PRICING)
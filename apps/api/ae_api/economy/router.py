@@ -1,15 +1,21 @@
 """Model router for intelligent LLM selection and cost optimization."""
 
-from collections import defaultdict
+from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from typing import TYPE_CHECKING
 
+from cachetools import TTLCache
 from pydantic import BaseModel, Field
+from redis.asyncio import Redis
 
 from ae_api.config import Settings
+from ae_api.economy.classifier import ClassificationResult
+from ae_api.economy.providers.base import BATCH_PRICE_MULTIPLIER
+from ae_api.economy.tokens import count_tokens
 
 if TYPE_CHECKING:
-    from ae_api.economy.classifier import ClassificationResult, SemanticClassifier
+    from ae_api.economy.classifier import SemanticClassifier
 
 
 class ModelTier(str, Enum):
@@ -38,11 +44,71 @@ class RoutingDecision(BaseModel):
     reasoning: str = Field(
         ..., description="Explanation of routing decision"
     )
-    classification: "ClassificationResult | None" = Field(
+    classification: ClassificationResult | None = Field(
         default=None, description="Task classification result"
     )
 
 
+@dataclass(slots=True, frozen=True)
+class RoutingResult:
+    """Routing decision as returned by ModelRouter.route().
+
+    A slotted dataclass for in-process callers; to_api() builds the
+    RoutingDecision response model only when it is sent over HTTP.
+    """
+
+    tier: ModelTier
+    model_id: str
+    provider: str
+    estimated_cost: float
+    reasoning: str
+    classification: ClassificationResult | None = None
+
+    def to_api(self) -> RoutingDecision:
+        """Convert to the RoutingDecision API model (fields are already valid)."""
+        return RoutingDecision.model_construct(
+            tier=self.tier,
+            model_id=self.model_id,
+            provider=self.provider,
+            estimated_cost=self.estimated_cost,
+            reasoning=self.reasoning,
+            classification=self.classification,
+        )
+
+
+# Adds ARGV[1] to a run's spend only if it stays within the ARGV[2] budget, in
+# one atomic round trip. Returns 1 if the spend was recorded, otherwise 0.
+_RESERVE_SCRIPT = """
+local spent = tonumber(redis.call('GET', KEYS[1]) or '0')
+if spent + tonumber(ARGV[1]) > tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('INCRBYFLOAT', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+# Pricing per 1M tokens (input, output) in USD for models missing from PRICING
+_DEFAULT_PRICING = (1.0, 5.0)
+
+
+def _token_prices(pricing: tuple[float, float]) -> tuple[float, float]:
+    """Convert per-1M-token prices to (USD per input token, USD per output token)."""
+    input_price, output_price = pricing
+    return input_price / 1_000_000, output_price / 1_000_000
+
+
+def _build_price_table(
+    pricing: dict[str, dict[str, tuple[float, float]]],
+) -> dict[tuple[str, str], tuple[float, float]]:
+    """Flatten nested provider pricing into per-token prices keyed by (provider, model)."""
+    return {
+        (provider, model_id): _token_prices(prices)
+        for provider, models in pricing.items()
+        for model_id, prices in models.items()
+    }
+
+
 class ModelRouter:
     """Routes tasks to appropriate models based on complexity and cost."""
 
@@ -100,28 +166,67 @@ class ModelRouter:
         },
     }
 
-    def __init__(self, settings: Settings, classifier: "SemanticClassifier"):
+    # PRICING with unit conversions folded in, so estimate_cost is one lookup
+    _TOKEN_PRICES = _build_price_table(PRICING)
+    _DEFAULT_TOKEN_PRICES = _token_prices(_DEFAULT_PRICING)
+
+    USAGE_KEY_PREFIX = "router_spent:"
+    USAGE_TTL = 86400 * 7  # 7 days in seconds
+
+    def __init__(
+        self,
+        settings: Settings,
+        classifier: "SemanticClassifier",
+        redis_client: Redis | None = None,
+    ):
         """Initialize the model router.
 
         Args:
             settings: Application settings
             classifier: Task classifier instance
+            redis_client: Redis client for per-run usage shared across workers;
+                without one, usage is tracked in this process only
         """
         self.settings = settings
         self.classifier = classifier
 
-        # Track budget usage per run
-        self._run_budgets: dict[str, float] = defaultdict(float)
+        # Track budget usage per run. The in-process path never awaits between
+        # reading and updating a run's usage, so it needs no lock.
+        self.redis = redis_client
+        self._reserve_script = (
+            redis_client.register_script(_RESERVE_SCRIPT) if redis_client is not None else None
+        )
+        self._run_budgets: TTLCache = TTLCache(
+            maxsize=settings.budget_cache_size, ttl=settings.budget_cache_ttl
+        )
+
+        # Derived from TIER_CONFIG and settings only, so built once
+        self._tier_resolution: dict[ModelTier, tuple[str, str]] = {}
 
     def get_model_for_tier(self, tier: ModelTier) -> tuple[str, str]:
         """Get the primary model for a tier.
 
+        Resolved once per tier; call invalidate_tier_cache() after changing
+        TIER_CONFIG or the tier model settings.
+
         Args:
             tier: Model tier
 
         Returns:
             Tuple of (provider, model_id)
         """
+        resolution = self._tier_resolution.get(tier)
+        if resolution is None:
+            resolution = self._tier_resolution[tier] = self._resolve_tier(tier)
+        return resolution
+
+    def invalidate_tier_cache(self) -> None:
+        """Forget resolved tier models so they are re-read from config and settings."""
+        self._tier_resolution.clear()
+        self.__dict__.pop("tier_info", None)
+
+    def _resolve_tier(self, tier: ModelTier) -> tuple[str, str]:
+        """Resolve a tier to its (provider, model_id) from config and settings."""
         config = self.TIER_CONFIG.get(tier)
         if not config or not config["models"]:
             raise ValueError(f"No models configured for tier {tier}")
@@ -151,7 +256,8 @@ class ModelRouter:
         self,
         prompt: str,
         tier: ModelTier,
-        estimated_output_tokens: int = 1000
+        estimated_output_tokens: int = 1000,
+        batch: bool = False,
     ) -> float:
         """Estimate the cost of a task.
 
@@ -159,57 +265,82 @@ class ModelRouter:
             prompt: Task prompt
             tier: Model tier to use
             estimated_output_tokens: Estimated output token count
+            batch: Whether the task will be submitted through a Batch API
 
         Returns:
             Estimated cost in USD
         """
         provider, model_id = self.get_model_for_tier(tier)
+        input_per_token, output_per_token = self._TOKEN_PRICES.get(
+            (provider, model_id), self._DEFAULT_TOKEN_PRICES
+        )
+        input_tokens = count_tokens(prompt, model_id)
+        cost = input_tokens * input_per_token + estimated_output_tokens * output_per_token
+        return cost * BATCH_PRICE_MULTIPLIER if batch else cost
 
-        # Get pricing for model
-        pricing = self.PRICING.get(provider, {}).get(model_id)
-        if not pricing:
-            # Default pricing if not found
-            pricing = (1.0, 5.0)
+    async def enforce_budget(self, run_id: str, cost: float) -> bool:
+        """Check if a cost would exceed the run budget.
 
-        input_price, output_price = pricing
+        Advisory only: the usage can change before the cost is recorded. Use
+        reserve_budget() when the cost is about to be spent.
 
-        # Rough token estimation (4 chars per token)
-        estimated_input_tokens = len(prompt) / 4
+        Args:
+            run_id: Unique run identifier
+            cost: Cost to check
 
-        # Calculate cost
-        input_cost = (estimated_input_tokens / 1_000_000) * input_price
-        output_cost = (estimated_output_tokens / 1_000_000) * output_price
+        Returns:
+            True if within budget, False if would exceed
+        """
+        current_usage = await self.get_run_usage(run_id)
+        return current_usage + cost <= self.settings.default_run_budget
 
-        return input_cost + output_cost
+    async def reserve_budget(self, run_id: str, cost: float) -> bool:
+        """Record a cost only if it keeps the run within budget.
 
-    def enforce_budget(self, run_id: str, cost: float) -> bool:
-        """Check if a cost would exceed the run budget.
+        Unlike enforce_budget() followed by record_usage(), the check and the
+        update are atomic, so concurrent callers for one run cannot overspend.
+        Once the real cost is known, record_usage() the difference between it
+        and the reserved cost (or its negation if the call failed).
 
         Args:
             run_id: Unique run identifier
-            cost: Cost to check
+            cost: Cost to reserve
 
         Returns:
-            True if within budget, False if would exceed
+            True if the cost was recorded, False if it would exceed the budget
         """
-        current_usage = self._run_budgets.get(run_id, 0.0)
         budget = self.settings.default_run_budget
-
-        if current_usage + cost > budget:
+        if self._reserve_script is not None:
+            reserved = await self._reserve_script(
+                keys=[f"{self.USAGE_KEY_PREFIX}{run_id}"],
+                args=[cost, budget, self.USAGE_TTL],
+            )
+            return bool(reserved)
+
+        usage = self._run_budgets.get(run_id, 0.0) + cost
+        if usage > budget:
             return False
-
+        self._run_budgets[run_id] = usage
         return True
 
-    def record_usage(self, run_id: str, cost: float) -> None:
+    async def record_usage(self, run_id: str, cost: float) -> None:
         """Record cost usage for a run.
 
         Args:
             run_id: Unique run identifier
             cost: Cost to record
         """
-        self._run_budgets[run_id] += cost
+        if self.redis is not None:
+            key = f"{self.USAGE_KEY_PREFIX}{run_id}"
+            async with self.redis.pipeline() as pipe:
+                pipe.incrbyfloat(key, cost)
+                pipe.expire(key, self.USAGE_TTL)
+                await pipe.execute()
+            return
+
+        self._run_budgets[run_id] = self._run_budgets.get(run_id, 0.0) + cost
 
-    def get_run_usage(self, run_id: str) -> float:
+    async def get_run_usage(self, run_id: str) -> float:
         """Get current usage for a run.
 
         Args:
@@ -218,16 +349,23 @@ class ModelRouter:
         Returns:
             Current cost usage in USD
         """
+        if self.redis is not None:
+            usage = await self.redis.get(f"{self.USAGE_KEY_PREFIX}{run_id}")
+            return float(usage or 0.0)
+
         return self._run_budgets.get(run_id, 0.0)
 
-    def reset_run_budget(self, run_id: str) -> None:
+    async def reset_run_budget(self, run_id: str) -> None:
         """Reset budget tracking for a run.
 
         Args:
             run_id: Unique run identifier
         """
-        if run_id in self._run_budgets:
-            del self._run_budgets[run_id]
+        if self.redis is not None:
+            await self.redis.delete(f"{self.USAGE_KEY_PREFIX}{run_id}")
+            return
+
+        self._run_budgets.pop(run_id, None)
 
     async def route(
         self,
@@ -235,7 +373,7 @@ class ModelRouter:
         context: dict | None = None,
         override_tier: ModelTier | None = None,
         run_id: str | None = None,
-    ) -> RoutingDecision:
+    ) -> RoutingResult:
         """Route a task to the appropriate model.
 
         Args:
@@ -245,7 +383,7 @@ class ModelRouter:
             run_id: Optional run ID for budget tracking
 
         Returns:
-            RoutingDecision with selected model and reasoning
+            RoutingResult with selected model and reasoning
         """
         classification = None
 
@@ -267,9 +405,9 @@ class ModelRouter:
 
         # Check budget if run_id provided
         if run_id:
-            if not self.enforce_budget(run_id, estimated_cost):
+            usage = await self.get_run_usage(run_id)
+            if usage + estimated_cost > self.settings.default_run_budget:
                 # Downgrade to cheaper tier if budget exceeded
-                usage = self.get_run_usage(run_id)
                 budget = self.settings.default_run_budget
                 reasoning += f" [Budget check: ${usage:.4f} used of ${budget:.2f} budget. "
 
@@ -287,7 +425,7 @@ class ModelRouter:
                 provider, model_id = self.get_model_for_tier(tier)
                 estimated_cost = self.estimate_cost(prompt, tier)
 
-        return RoutingDecision(
+        return RoutingResult(
             tier=tier,
             model_id=model_id,
             provider=provider,
@@ -296,17 +434,22 @@ class ModelRouter:
             classification=classification,
         )
 
+    @cached_property
+    def tier_info(self) -> dict[str, dict]:
+        """Information about all tiers, built once until invalidate_tier_cache()."""
+        return {
+            tier.value: {
+                "models": config["models"],
+                "use_cases": config["use_cases"],
+                "default_model": self.get_model_for_tier(tier),
+            }
+            for tier, config in self.TIER_CONFIG.items()
+        }
+
     def get_tier_info(self) -> dict[str, dict]:
         """Get information about all tiers.
 
         Returns:
             Dictionary mapping tier names to their configuration
         """
-        result = {}
-        for tier, config in self.TIER_CONFIG.items():
-            result[tier.value] = {
-                "models": config["models"],
-                "use_cases": config["use_cases"],
-                "default_model": self.get_model_for_tier(tier),
-            }
-        return result
+        return self.tier_info
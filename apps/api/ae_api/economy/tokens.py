@@ -0,0 +1,49 @@
+"""Token counting for cost estimation and streamed usage tracking."""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import tiktoken
+
+# Tokenizer for models tiktoken does not know (Anthropic, Google); close
+# enough for budgeting, unlike a flat characters-per-token ratio on code
+FALLBACK_ENCODING = "cl100k_base"
+
+# Token estimate used when no tokenizer can be loaded
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=16)
+def _get_encoding(model_id: str) -> "tiktoken.Encoding | None":
+    """Get the tiktoken encoding for a model, loaded once per model.
+
+    Returns None when the BPE ranks cannot be loaded (e.g. offline without a
+    tiktoken cache), in which case callers fall back to CHARS_PER_TOKEN.
+    """
+    import tiktoken
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(model_id)
+        except KeyError:
+            return tiktoken.get_encoding(FALLBACK_ENCODING)
+    except Exception:
+        return None
+
+
+def count_tokens(text: str, model_id: str) -> int:
+    """Count the tokens of text for a model.
+
+    Args:
+        text: Prompt or generated text
+        model_id: Model identifier
+
+    Returns:
+        Token count (estimated from length if no tokenizer is available)
+    """
+    encoding = _get_encoding(model_id)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    # encode_ordinary skips the special-token scan; prompts are plain text
+    return len(encoding.encode_ordinary(text))
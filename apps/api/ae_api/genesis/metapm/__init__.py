@@ -13,6 +13,7 @@ from ae_api.genesis.metapm.metagpt_runner import (
 )
 from ae_api.genesis.metapm.roles import (
     ArchitectRole,
+    PlannerRole,
     PMRole,
     ProjectManagerRole,
 )
@@ -21,6 +22,7 @@ __all__ = [
     "PMRole",
     "ArchitectRole",
     "ProjectManagerRole",
+    "PlannerRole",
     "ProductSpec",
     "TechnicalSpec",
     "TaskGraph",
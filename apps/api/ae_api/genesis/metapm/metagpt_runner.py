@@ -5,20 +5,33 @@ to transform a validated niche opportunity into a complete product specification
 technical design, and implementation task graph.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
 import structlog
 from langchain_core.language_models import BaseChatModel
 
+from ae_api.config import get_settings
 from ae_api.genesis.metapm.roles import (
     ArchitectRole,
+    PlannerRole,
     PMRole,
     ProductSpec,
     ProjectManagerRole,
     TaskGraph,
     TechnicalSpec,
+    draft_product_spec,
 )
 from ae_api.genesis.niche_identification import NicheCandidate
 from ae_api.genesis.validator_agent import ValidationReport
 
+if TYPE_CHECKING:
+    from ae_api.economy.providers.openai import OpenAIProvider
+
+# Role name for LangChain message types when submitting raw chat requests
+_OPENAI_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
 logger = structlog.get_logger()
 
 
@@ -42,6 +55,7 @@ class MetaGPTRunner:
         self.pm_role = PMRole(llm=llm)
         self.architect_role = ArchitectRole(llm=llm)
         self.project_manager_role = ProjectManagerRole(llm=llm)
+        self.planner_role = PlannerRole(llm=llm)
 
     async def run(
         self,
@@ -60,37 +74,163 @@ class MetaGPTRunner:
         Returns:
             Tuple of (ProductSpec, TechnicalSpec, TaskGraph)
 
+        Raises:
+            ValueError: If any role fails to produce valid output
+            Exception: If orchestration fails
+        """
+        stages = dict([stage async for stage in self.run_stages(niche, validation_report)])
+        return stages["product_spec"], stages["technical_spec"], stages["task_graph"]
+
+    async def run_single_call(
+        self,
+        niche: NicheCandidate,
+        validation_report: ValidationReport,
+    ) -> tuple[ProductSpec, TechnicalSpec, TaskGraph]:
+        """Execute the MetaGPT workflow as one combined LLM call.
+
+        Cheaper and faster than run(), since the shared niche context is sent
+        once and there is a single round trip. Falls back to the staged roles
+        if the combined response cannot be parsed (e.g. it was truncated at
+        the model's output limit).
+
+        Args:
+            niche: The validated niche opportunity
+            validation_report: Validation results and metrics
+
+        Returns:
+            Tuple of (ProductSpec, TechnicalSpec, TaskGraph)
+        """
+        try:
+            return await self.planner_role.create_full_plan(niche, validation_report)
+        except ValueError as e:
+            logger.warning("single_call_plan_failed", error=str(e), niche_name=niche.name)
+            return await self.run(niche, validation_report)
+
+    async def run_async_batch(
+        self,
+        niche: NicheCandidate,
+        validation_report: ValidationReport,
+        provider: "OpenAIProvider",
+        model: str | None = None,
+        poll_interval: float = 60.0,
+        timeout: float | None = None,
+    ) -> tuple[ProductSpec, TechnicalSpec, TaskGraph]:
+        """Execute the single-call MetaGPT plan through the OpenAI Batch API.
+
+        For offline genesis runs that can wait minutes to hours: the batch is
+        billed at half price and does not count against synchronous rate limits.
+        Only the combined plan is submitted, since the staged roles depend on
+        each other's output and would need one batch round per role.
+
+        Args:
+            niche: The validated niche opportunity
+            validation_report: Validation results and metrics
+            provider: OpenAI provider used to submit and poll the batch
+            model: Model identifier (defaults to the tier1 model)
+            poll_interval: Seconds between batch status checks
+            timeout: Maximum seconds to wait for the batch
+
+        Returns:
+            Tuple of (ProductSpec, TechnicalSpec, TaskGraph)
+
+        Raises:
+            ValueError: If the batch returned no usable plan
+            RuntimeError: If the batch failed, expired, or was cancelled
+            TimeoutError: If the batch did not finish within timeout
+        """
+        messages = self.planner_role.build_messages(niche, validation_report)
+        custom_id = f"metagpt-plan-{niche.name}"
+
+        batch_id = await provider.submit_batch([{
+            "custom_id": custom_id,
+            "body": {
+                "model": model or get_settings().tier1_model,
+                "temperature": 0.5,
+                "messages": [
+                    {"role": _OPENAI_ROLES[message.type], "content": message.content}
+                    for message in messages
+                ],
+            },
+        }])
+        logger.info("metagpt_batch_submitted", batch_id=batch_id, niche_name=niche.name)
+
+        results = await provider.poll_batch(batch_id, poll_interval=poll_interval, timeout=timeout)
+        if custom_id not in results:
+            raise ValueError(f"OpenAI batch {batch_id} returned no plan")
+
+        completion = results[custom_id]
+        logger.info("metagpt_batch_complete", batch_id=batch_id, cost=completion.cost)
+        return self.planner_role.parse_plan(completion.content)
+
+    async def run_stages(
+        self,
+        niche: NicheCandidate,
+        validation_report: ValidationReport,
+    ) -> AsyncIterator[tuple[str, ProductSpec | TechnicalSpec | TaskGraph]]:
+        """Execute the full MetaGPT workflow, yielding each artifact as soon as it is ready.
+
+        Yields ("product_spec", ProductSpec), then ("technical_spec", TechnicalSpec),
+        then ("task_graph", TaskGraph), so callers can forward or persist early
+        stages while later roles are still running. The PM response is streamed
+        and the Architect starts as soon as the fields it reads are complete,
+        overlapping the rest of the PM generation.
+
+        Args:
+            niche: The validated niche opportunity
+            validation_report: Validation results and metrics
+
+        Yields:
+            Tuples of (stage name, stage artifact)
+
         Raises:
             ValueError: If any role fails to produce valid output
             Exception: If orchestration fails
         """
         logger.info("starting_metagpt_workflow", niche_name=niche.name)
 
+        architect_task: asyncio.Task[TechnicalSpec] | None = None
         try:
-            # Phase 1: PM creates product specification
+            # Phase 1: PM creates product specification. The Architect only needs
+            # its opening fields, so phase 2 starts as soon as those are streamed.
             logger.info("phase_1_pm_role", niche_name=niche.name)
-            product_spec = await self.pm_role.create_product_spec(
-                niche=niche,
-                validation_report=validation_report,
-            )
+            parts: list[str] = []
+            async for delta in self.pm_role.stream_product_spec(niche, validation_report):
+                parts.append(delta)
+                if architect_task is None and "}" in delta:
+                    draft = draft_product_spec("".join(parts))
+                    if draft is not None:
+                        logger.info("phase_2_architect_role", product_name=draft.product_name)
+                        architect_task = asyncio.create_task(
+                            self.architect_role.create_technical_spec(
+                                product_spec=draft,
+                                niche=niche,
+                            )
+                        )
+
+            product_spec = self.pm_role.parse_product_spec("".join(parts))
             logger.info(
                 "phase_1_complete",
                 product_name=product_spec.product_name,
                 features=len(product_spec.core_features),
                 stories=len(product_spec.user_stories),
             )
+            yield "product_spec", product_spec
 
             # Phase 2: Architect creates technical specification
-            logger.info("phase_2_architect_role", product_name=product_spec.product_name)
-            technical_spec = await self.architect_role.create_technical_spec(
-                product_spec=product_spec,
-                niche=niche,
-            )
+            if architect_task is None:
+                logger.info("phase_2_architect_role", product_name=product_spec.product_name)
+                technical_spec = await self.architect_role.create_technical_spec(
+                    product_spec=product_spec,
+                    niche=niche,
+                )
+            else:
+                technical_spec = await architect_task
             logger.info(
                 "phase_2_complete",
                 models=len(technical_spec.data_models),
                 apis=len(technical_spec.api_design),
             )
+            yield "technical_spec", technical_spec
 
             # Phase 3: Project Manager creates task graph
             logger.info("phase_3_project_manager_role", product_name=product_spec.product_name)
@@ -111,12 +251,15 @@ class MetaGPTRunner:
                 total_tasks=len(task_graph.tasks),
                 estimated_hours=task_graph.total_estimated_hours,
             )
-
-            return product_spec, technical_spec, task_graph
+            yield "task_graph", task_graph
 
         except Exception as e:
             logger.error("metagpt_workflow_failed", error=str(e), niche_name=niche.name)
             raise
+        finally:
+            # Early architect work is abandoned if the PM fails or the caller stops
+            if architect_task is not None and not architect_task.done():
+                architect_task.cancel()
 
     async def run_pm_only(
         self,
@@ -6,21 +6,149 @@ This module defines the prompts and behaviors for different AI roles:
 - ProjectManager: Breaks down work into executable tasks
 """
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any
 
 import structlog
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.utils.json import parse_partial_json
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
 from ae_api.config import get_settings
+from ae_api.economy.providers.base import get_shared_http_client
 from ae_api.genesis.niche_identification import NicheCandidate
 from ae_api.genesis.validator_agent import ValidationReport
 
 logger = structlog.get_logger()
 
 
+@lru_cache(maxsize=8)
+def _default_chat_model(temperature: float) -> ChatOpenAI:
+    """Get the shared tier1 chat model for a role's sampling temperature.
+
+    Roles built without an explicit LLM share one client (and its HTTP
+    connection pool) per temperature instead of constructing a new one.
+    """
+    settings = get_settings()
+    return ChatOpenAI(
+        model=settings.tier1_model,
+        temperature=temperature,
+        api_key=settings.openai_api_key.get_secret_value() if settings.openai_api_key else None,
+        http_async_client=get_shared_http_client(),
+    )
+
+
+NICHE_CONTEXT_PROMPT = """Niche Opportunity:
+Name: {niche_name}
+Description: {niche_description}
+Pain Points: {pain_points}
+Target Audience: {target_audience}
+Value Proposition: {value_proposition}
+
+Validation Results:
+Validation Score: {validation_score}/100
+Should Pursue: {should_pursue}
+Search Volume: {search_volume}/month
+Estimated ARPU: ${arpu}/month
+B2B Intent Score: {b2b_score}/100
+
+Strengths: {strengths}
+Weaknesses: {weaknesses}
+Recommendations: {recommendations}"""
+
+
+ARCHITECT_SYSTEM_PROMPT = """\
+You are an experienced Software Architect designing a micro-SaaS product.
+
+Your goal is to design a:
+- Modern, scalable architecture
+- Simple but robust tech stack
+- Clear data models
+- RESTful API design
+- Cloud-native deployment strategy
+
+Prioritize:
+- Time to market (use proven, productive technologies)
+- Operational simplicity (managed services over custom infrastructure)
+- Cost efficiency (serverless/pay-per-use where possible)
+- Developer productivity (modern frameworks, good DX)"""
+
+# User stories included in the Architect prompt
+ARCHITECT_STORY_COUNT = 5
+
+ARCHITECT_HUMAN_PROMPT = """Product Specification:
+Product Name: {product_name}
+Vision: {vision}
+Target Users: {target_users}
+
+Core Features:
+{core_features}
+
+User Stories (first 5):
+{user_stories}
+
+Design the technical architecture for this product."""
+
+
+def _niche_context_inputs(
+    niche: NicheCandidate,
+    validation_report: ValidationReport,
+) -> dict[str, Any]:
+    """Build the variables for NICHE_CONTEXT_PROMPT.
+
+    Args:
+        niche: The validated niche opportunity
+        validation_report: Validation results and metrics
+
+    Returns:
+        Prompt variables
+    """
+    return {
+        "niche_name": niche.name,
+        "niche_description": niche.description,
+        "pain_points": "\n- " + "\n- ".join(niche.pain_points),
+        "target_audience": niche.target_audience,
+        "value_proposition": niche.value_proposition,
+        "validation_score": validation_report.validation_score,
+        "should_pursue": validation_report.should_pursue,
+        "search_volume": validation_report.metrics.search_volume,
+        "arpu": validation_report.metrics.estimated_arpu,
+        "b2b_score": validation_report.metrics.b2b_intent_score,
+        "strengths": "\n- " + "\n- ".join(validation_report.strengths),
+        "weaknesses": "\n- " + "\n- ".join(validation_report.weaknesses),
+        "recommendations": "\n- " + "\n- ".join(validation_report.recommendations),
+    }
+
+
+def _parse_json_object(response: Any, role: str) -> dict[str, Any]:
+    """Extract the outermost JSON object from an LLM response.
+
+    Args:
+        response: Chat model response (or anything with a string form)
+        role: Role name used in the error message
+
+    Returns:
+        Parsed JSON object
+
+    Raises:
+        ValueError: If the response contains no JSON object
+    """
+    response_text = response.content if hasattr(response, 'content') else str(response)
+    start_idx = response_text.find('{')
+    end_idx = response_text.rfind('}') + 1
+
+    if start_idx == -1 or end_idx == 0:
+        raise ValueError(f"{role} response did not contain valid JSON")
+
+    return json.loads(response_text[start_idx:end_idx])
+
+
 class UserStory(BaseModel):
     """A single user story following standard format.
 
@@ -123,45 +251,51 @@ class TaskGraph(BaseModel):
     parallel_workstreams: list[list[str]] = Field(default_factory=list)
 
 
-class PMRole:
-    """Product Manager role that creates PRDs and user stories.
-
-    This role takes a validated niche and produces a complete product specification
-    including vision, features, user stories, and success metrics.
-    """
+def draft_product_spec(text: str) -> ProductSpec | None:
+    """Build a draft ProductSpec from a partially streamed PM response.
 
-    def __init__(self, llm: BaseChatModel | None = None):
-        """Initialize the PM role.
+    The Architect only reads the name, vision, target users, core features and
+    the first ARCHITECT_STORY_COUNT user stories, which the PM writes first. A
+    draft is returned once those are complete, with the remaining fields empty.
 
-        Args:
-            llm: Language model to use (defaults to tier1 model)
-        """
-        settings = get_settings()
+    Args:
+        text: PM response text generated so far
 
-        self.llm = llm or ChatOpenAI(
-            model=settings.tier1_model,
-            temperature=0.7,
-            api_key=settings.openai_api_key.get_secret_value() if settings.openai_api_key else None,
+    Returns:
+        Draft ProductSpec, or None if the Architect inputs are not complete yet
+    """
+    start_idx = text.find('{')
+    if start_idx == -1:
+        return None
+
+    data = parse_partial_json(text[start_idx:])
+    if not isinstance(data, dict):
+        return None
+
+    stories = data.get("user_stories")
+    # A story is complete once the next one (or the next field) has started
+    if not isinstance(stories, list) or not (
+        len(stories) > ARCHITECT_STORY_COUNT or "success_metrics" in data
+    ):
+        return None
+
+    try:
+        return ProductSpec.model_construct(
+            product_name=data["product_name"],
+            vision_statement=data["vision_statement"],
+            target_users=data["target_users"],
+            core_features=list(data["core_features"]),
+            user_stories=[UserStory(**story) for story in stories[:ARCHITECT_STORY_COUNT]],
+            success_metrics=[],
+            go_to_market="",
         )
+    except (KeyError, TypeError, ValueError):
+        return None
 
-    async def create_product_spec(
-        self,
-        niche: NicheCandidate,
-        validation_report: ValidationReport,
-    ) -> ProductSpec:
-        """Create a comprehensive product specification.
 
-        Args:
-            niche: The validated niche opportunity
-            validation_report: Validation results and metrics
-
-        Returns:
-            ProductSpec with PRD, user stories, and MMP definition
-        """
-        logger.info("creating_product_spec", niche_name=niche.name)
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an experienced Product Manager creating a PRD (Product Requirements Document).
+PM_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", """\
+You are an experienced Product Manager creating a PRD (Product Requirements Document).
 
 Your goal is to define a Minimal Marketable Product (MMP) - the smallest product that:
 1. Solves the core pain points
@@ -198,72 +332,46 @@ Return ONLY valid JSON matching this structure:
   "success_metrics": ["metric1", "metric2", ...],
   "go_to_market": "GTM strategy description"
 }}"""),
-            ("human", """Niche Opportunity:
-Name: {niche_name}
-Description: {niche_description}
-Pain Points: {pain_points}
-Target Audience: {target_audience}
-Value Proposition: {value_proposition}
+    ("human", NICHE_CONTEXT_PROMPT + """
 
-Validation Results:
-Validation Score: {validation_score}/100
-Should Pursue: {should_pursue}
-Search Volume: {search_volume}/month
-Estimated ARPU: ${arpu}/month
-B2B Intent Score: {b2b_score}/100
+Create a comprehensive product specification for this opportunity."""),
+])
 
-Strengths: {strengths}
-Weaknesses: {weaknesses}
-Recommendations: {recommendations}
 
-Create a comprehensive product specification for this opportunity."""),
-        ])
+class PMRole:
+    """Product Manager role that creates PRDs and user stories.
 
-        chain = prompt | self.llm
-
-        response = await chain.ainvoke({
-            "niche_name": niche.name,
-            "niche_description": niche.description,
-            "pain_points": "\n- " + "\n- ".join(niche.pain_points),
-            "target_audience": niche.target_audience,
-            "value_proposition": niche.value_proposition,
-            "validation_score": validation_report.validation_score,
-            "should_pursue": validation_report.should_pursue,
-            "search_volume": validation_report.metrics.search_volume,
-            "arpu": validation_report.metrics.estimated_arpu,
-            "b2b_score": validation_report.metrics.b2b_intent_score,
-            "strengths": "\n- " + "\n- ".join(validation_report.strengths),
-            "weaknesses": "\n- " + "\n- ".join(validation_report.weaknesses),
-            "recommendations": "\n- " + "\n- ".join(validation_report.recommendations),
-        })
+    This role takes a validated niche and produces a complete product specification
+    including vision, features, user stories, and success metrics.
+    """
 
-        # Parse response
-        import json
+    def __init__(self, llm: BaseChatModel | None = None):
+        """Initialize the PM role.
 
-        response_text = response.content if hasattr(response, 'content') else str(response)
-        start_idx = response_text.find('{')
-        end_idx = response_text.rfind('}') + 1
+        Args:
+            llm: Language model to use (defaults to tier1 model)
+        """
+        self.llm = llm or _default_chat_model(0.7)
+        self._chain = PM_TEMPLATE | self.llm
 
-        if start_idx == -1 or end_idx == 0:
-            raise ValueError("PM response did not contain valid JSON")
+    async def create_product_spec(
+        self,
+        niche: NicheCandidate,
+        validation_report: ValidationReport,
+    ) -> ProductSpec:
+        """Create a comprehensive product specification.
 
-        json_str = response_text[start_idx:end_idx]
-        data = json.loads(json_str)
+        Args:
+            niche: The validated niche opportunity
+            validation_report: Validation results and metrics
 
-        # Convert user stories
-        user_stories = []
-        for story_data in data.get("user_stories", []):
-            user_stories.append(UserStory(**story_data))
+        Returns:
+            ProductSpec with PRD, user stories, and MMP definition
+        """
+        logger.info("creating_product_spec", niche_name=niche.name)
 
-        product_spec = ProductSpec(
-            product_name=data["product_name"],
-            vision_statement=data["vision_statement"],
-            target_users=data["target_users"],
-            core_features=data["core_features"],
-            user_stories=user_stories,
-            success_metrics=data["success_metrics"],
-            go_to_market=data["go_to_market"],
-        )
+        response = await self._chain.ainvoke(_niche_context_inputs(niche, validation_report))
+        product_spec = self.parse_product_spec(response)
 
         logger.info(
             "product_spec_created",
@@ -274,59 +382,61 @@ Create a comprehensive product specification for this opportunity."""),
 
         return product_spec
 
+    async def stream_product_spec(
+        self,
+        niche: NicheCandidate,
+        validation_report: ValidationReport,
+    ) -> AsyncIterator[str]:
+        """Stream the raw product specification response as it is generated.
 
-class ArchitectRole:
-    """Software Architect role that designs technical architecture.
-
-    This role takes a product spec and produces a detailed technical specification
-    including tech stack, architecture, data models, and deployment strategy.
-    """
-
-    def __init__(self, llm: BaseChatModel | None = None):
-        """Initialize the Architect role.
+        Pass the accumulated text to draft_product_spec() to start dependent
+        work early, and to parse_product_spec() once the stream ends.
 
         Args:
-            llm: Language model to use (defaults to tier1 model)
+            niche: The validated niche opportunity
+            validation_report: Validation results and metrics
+
+        Yields:
+            Newly generated text
         """
-        settings = get_settings()
+        logger.info("streaming_product_spec", niche_name=niche.name)
 
-        self.llm = llm or ChatOpenAI(
-            model=settings.tier1_model,
-            temperature=0.5,  # Lower temperature for more consistent architecture
-            api_key=settings.openai_api_key.get_secret_value() if settings.openai_api_key else None,
-        )
+        async for chunk in self._chain.astream(_niche_context_inputs(niche, validation_report)):
+            if isinstance(chunk.content, str) and chunk.content:
+                yield chunk.content
 
-    async def create_technical_spec(
-        self,
-        product_spec: ProductSpec,
-        niche: NicheCandidate,
-    ) -> TechnicalSpec:
-        """Create a comprehensive technical specification.
+    def parse_product_spec(self, response: Any) -> ProductSpec:
+        """Parse a PM response into a ProductSpec.
 
         Args:
-            product_spec: The product specification from PM
-            niche: The original niche candidate
+            response: Chat model response or raw response text
 
         Returns:
-            TechnicalSpec with architecture, stack, and schemas
+            Parsed ProductSpec
+
+        Raises:
+            ValueError: If the response contains no JSON object
         """
-        logger.info("creating_technical_spec", product_name=product_spec.product_name)
+        data = _parse_json_object(response, "PM")
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an experienced Software Architect designing a micro-SaaS product.
+        # Convert user stories
+        user_stories = []
+        for story_data in data.get("user_stories", []):
+            user_stories.append(UserStory(**story_data))
 
-Your goal is to design a:
-- Modern, scalable architecture
-- Simple but robust tech stack
-- Clear data models
-- RESTful API design
-- Cloud-native deployment strategy
+        return ProductSpec(
+            product_name=data["product_name"],
+            vision_statement=data["vision_statement"],
+            target_users=data["target_users"],
+            core_features=data["core_features"],
+            user_stories=user_stories,
+            success_metrics=data["success_metrics"],
+            go_to_market=data["go_to_market"],
+        )
 
-Prioritize:
-- Time to market (use proven, productive technologies)
-- Operational simplicity (managed services over custom infrastructure)
-- Cost efficiency (serverless/pay-per-use where possible)
-- Developer productivity (modern frameworks, good DX)
+
+ARCHITECT_PLATFORM_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", ARCHITECT_SYSTEM_PROMPT + """
 
 For a B2B SaaS, typical stack includes:
 - Frontend: React/Next.js or similar modern framework
@@ -348,6 +458,21 @@ Return ONLY valid JSON matching this structure:
   }},
   "architecture_description": "Detailed description of the architecture",
   "architecture_diagram": "Mermaid diagram syntax",
+  "deployment_strategy": "Description of how to deploy",
+  "infrastructure_requirements": ["requirement1", "requirement2"],
+  "security_considerations": ["consideration1", "consideration2"]
+}}"""),
+    ("human", ARCHITECT_HUMAN_PROMPT),
+])
+
+
+ARCHITECT_INTERFACES_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", ARCHITECT_SYSTEM_PROMPT + """
+
+Design the data models first, then the RESTful endpoints that operate on them.
+
+Return ONLY valid JSON matching this structure:
+{{
   "data_models": [
     {{
       "name": "ModelName",
@@ -363,55 +488,74 @@ Return ONLY valid JSON matching this structure:
       "request": {{}},
       "response": {{}}
     }}
-  ],
-  "deployment_strategy": "Description of how to deploy",
-  "infrastructure_requirements": ["requirement1", "requirement2"],
-  "security_considerations": ["consideration1", "consideration2"]
+  ]
 }}"""),
-            ("human", """Product Specification:
-Product Name: {product_name}
-Vision: {vision}
-Target Users: {target_users}
+    ("human", ARCHITECT_HUMAN_PROMPT),
+])
 
-Core Features:
-{core_features}
 
-User Stories (first 5):
-{user_stories}
+class ArchitectRole:
+    """Software Architect role that designs technical architecture.
 
-Design the technical architecture for this product."""),
-        ])
+    This role takes a product spec and produces a detailed technical specification
+    including tech stack, architecture, data models, and deployment strategy.
+    """
+
+    def __init__(self, llm: BaseChatModel | None = None):
+        """Initialize the Architect role.
+
+        Args:
+            llm: Language model to use (defaults to tier1 model)
+        """
+        # Lower temperature for more consistent architecture
+        self.llm = llm or _default_chat_model(0.5)
+        self._platform_chain = ARCHITECT_PLATFORM_TEMPLATE | self.llm
+        self._interfaces_chain = ARCHITECT_INTERFACES_TEMPLATE | self.llm
+
+    async def create_technical_spec(
+        self,
+        product_spec: ProductSpec,
+        niche: NicheCandidate,
+    ) -> TechnicalSpec:
+        """Create a comprehensive technical specification.
+
+        The platform design (stack, architecture, deployment) and the interface
+        design (data models, API) only depend on the product spec, so they are
+        generated by two concurrent LLM calls and merged. If either call fails
+        the other is cancelled.
+
+        Args:
+            product_spec: The product specification from PM
+            niche: The original niche candidate
 
-        chain = prompt | self.llm
+        Returns:
+            TechnicalSpec with architecture, stack, and schemas
+        """
+        logger.info("creating_technical_spec", product_name=product_spec.product_name)
 
         # Format user stories
         story_summary = "\n".join([
             f"{i+1}. {story.title}: {story.description}"
-            for i, story in enumerate(product_spec.user_stories[:5])
+            for i, story in enumerate(product_spec.user_stories[:ARCHITECT_STORY_COUNT])
         ])
 
-        response = await chain.ainvoke({
+        inputs = {
             "product_name": product_spec.product_name,
             "vision": product_spec.vision_statement,
             "target_users": product_spec.target_users,
             "core_features": "\n- " + "\n- ".join(product_spec.core_features),
             "user_stories": story_summary,
-        })
-
-        # Parse response
-        import json
-
-        response_text = response.content if hasattr(response, 'content') else str(response)
-        start_idx = response_text.find('{')
-        end_idx = response_text.rfind('}') + 1
-
-        if start_idx == -1 or end_idx == 0:
-            raise ValueError("Architect response did not contain valid JSON")
+        }
 
-        json_str = response_text[start_idx:end_idx]
-        data = json.loads(json_str)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                platform = tg.create_task(self._design_platform(inputs))
+                interfaces = tg.create_task(self._design_interfaces(inputs))
+        except ExceptionGroup as eg:
+            # Surface the first failure as-is so callers keep seeing ValueError etc.
+            raise eg.exceptions[0] from eg
 
-        technical_spec = TechnicalSpec(**data)
+        technical_spec = TechnicalSpec(**platform.result(), **interfaces.result())
 
         logger.info(
             "technical_spec_created",
@@ -422,46 +566,45 @@ Design the technical architecture for this product."""),
 
         return technical_spec
 
-
-class ProjectManagerRole:
-    """Project Manager role that creates task graphs.
-
-    This role takes product and technical specs and breaks them down into
-    a dependency graph of concrete, executable tasks.
-    """
-
-    def __init__(self, llm: BaseChatModel | None = None):
-        """Initialize the Project Manager role.
+    async def _design_platform(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        """Generate the stack, architecture, deployment and security sections.
 
         Args:
-            llm: Language model to use (defaults to tier1 model)
-        """
-        settings = get_settings()
+            inputs: Prompt variables describing the product
 
-        self.llm = llm or ChatOpenAI(
-            model=settings.tier1_model,
-            temperature=0.3,  # Lower temperature for consistent task breakdown
-            api_key=settings.openai_api_key.get_secret_value() if settings.openai_api_key else None,
-        )
-
-    async def create_task_graph(
-        self,
-        product_spec: ProductSpec,
-        technical_spec: TechnicalSpec,
-    ) -> TaskGraph:
-        """Create a dependency graph of tasks for implementation.
+        Returns:
+            TechnicalSpec fields other than data_models and api_design
+        """
+        response = await self._platform_chain.ainvoke(inputs)
+        data = _parse_json_object(response, "Architect")
+        return {
+            field: data[field]
+            for field in (
+                "tech_stack",
+                "architecture_description",
+                "architecture_diagram",
+                "deployment_strategy",
+                "infrastructure_requirements",
+                "security_considerations",
+            )
+        }
+
+    async def _design_interfaces(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        """Generate the data models and API design sections.
 
         Args:
-            product_spec: Product specification from PM
-            technical_spec: Technical specification from Architect
+            inputs: Prompt variables describing the product
 
         Returns:
-            TaskGraph with all tasks and dependencies
+            The data_models and api_design TechnicalSpec fields
         """
-        logger.info("creating_task_graph", product_name=product_spec.product_name)
+        response = await self._interfaces_chain.ainvoke(inputs)
+        data = _parse_json_object(response, "Architect")
+        return {"data_models": data["data_models"], "api_design": data["api_design"]}
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an experienced Project Manager breaking down work into tasks.
+
+TASK_GRAPH_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", """You are an experienced Project Manager breaking down work into tasks.
 
 Your goal is to create a complete task graph that:
 1. Covers all aspects of building the MMP
@@ -504,7 +647,7 @@ Return ONLY valid JSON matching this structure:
     ["task-3", "task-4"]
   ]
 }}"""),
-            ("human", """Product: {product_name}
+    ("human", """Product: {product_name}
 
 Core Features:
 {core_features}
@@ -519,9 +662,41 @@ Data Models: {model_count}
 API Endpoints: {api_count}
 
 Break down the implementation into a complete task graph."""),
-        ])
+])
+
+
+class ProjectManagerRole:
+    """Project Manager role that creates task graphs.
+
+    This role takes product and technical specs and breaks them down into
+    a dependency graph of concrete, executable tasks.
+    """
+
+    def __init__(self, llm: BaseChatModel | None = None):
+        """Initialize the Project Manager role.
 
-        chain = prompt | self.llm
+        Args:
+            llm: Language model to use (defaults to tier1 model)
+        """
+        # Lower temperature for consistent task breakdown
+        self.llm = llm or _default_chat_model(0.3)
+        self._chain = TASK_GRAPH_TEMPLATE | self.llm
+
+    async def create_task_graph(
+        self,
+        product_spec: ProductSpec,
+        technical_spec: TechnicalSpec,
+    ) -> TaskGraph:
+        """Create a dependency graph of tasks for implementation.
+
+        Args:
+            product_spec: Product specification from PM
+            technical_spec: Technical specification from Architect
+
+        Returns:
+            TaskGraph with all tasks and dependencies
+        """
+        logger.info("creating_task_graph", product_name=product_spec.product_name)
 
         # Format user stories
         story_summary = "\n".join([
@@ -535,7 +710,7 @@ Break down the implementation into a complete task graph."""),
             for key, value in technical_spec.tech_stack.items()
         ])
 
-        response = await chain.ainvoke({
+        response = await self._chain.ainvoke({
             "product_name": product_spec.product_name,
             "core_features": "\n- " + "\n- ".join(product_spec.core_features),
             "story_count": len(product_spec.user_stories),
@@ -576,3 +751,162 @@ Break down the implementation into a complete task graph."""),
         )
 
         return task_graph
+
+
+PLANNER_TEMPLATE = ChatPromptTemplate.from_messages([
+    ("system", """You are a product team of three: a Product Manager, a Software Architect,
+and a Project Manager. Plan a Minimal Marketable Product (MMP) for a micro-SaaS in three steps,
+each building on the previous one:
+
+1. product_spec: vision, target users, 5-10 core features, 10-15 prioritized user stories
+   ("As a [user], I want [goal], so that [benefit]") with acceptance criteria, success
+   metrics, and a brief go-to-market strategy.
+2. technical_spec: a simple, proven, managed-services-first stack, the architecture
+   (with a Mermaid diagram), data models, RESTful API design, deployment strategy,
+   infrastructure requirements, and security considerations.
+3. task_graph: concrete tasks of 1-2 days each, assigned to backend, frontend, devops, qa,
+   or design, with dependencies, estimates, acceptance criteria, the critical path,
+   and parallel workstreams.
+
+Return ONLY valid JSON matching this structure:
+{{
+  "product_spec": {{
+    "product_name": "Clear, memorable name",
+    "vision_statement": "One sentence vision",
+    "target_users": "Detailed persona description",
+    "core_features": ["feature1", "feature2"],
+    "user_stories": [
+      {{
+        "title": "Story title",
+        "description": "As a X, I want Y, so that Z",
+        "acceptance_criteria": ["criteria1", "criteria2"],
+        "priority": "P0|P1|P2|P3",
+        "estimated_effort": "XS|S|M|L|XL"
+      }}
+    ],
+    "success_metrics": ["metric1", "metric2"],
+    "go_to_market": "GTM strategy description"
+  }},
+  "technical_spec": {{
+    "tech_stack": {{"frontend": "Choice and why", "backend": "Choice and why"}},
+    "architecture_description": "Detailed description of the architecture",
+    "architecture_diagram": "Mermaid diagram syntax",
+    "data_models": [
+      {{"name": "ModelName", "description": "What it represents", "fields": []}}
+    ],
+    "api_design": [
+      {{"method": "GET|POST|PUT|DELETE", "path": "/api/resource", "description": "What it does"}}
+    ],
+    "deployment_strategy": "Description of how to deploy",
+    "infrastructure_requirements": ["requirement1"],
+    "security_considerations": ["consideration1"]
+  }},
+  "task_graph": {{
+    "tasks": [
+      {{
+        "task_id": "unique-id",
+        "title": "Short title",
+        "description": "Detailed description",
+        "assignee_role": "backend|frontend|devops|qa|design",
+        "estimated_hours": 8.0,
+        "dependencies": ["task-id-1"],
+        "acceptance_criteria": ["criteria1"]
+      }}
+    ],
+    "critical_path": ["task-id-1"],
+    "total_estimated_hours": 200.0,
+    "parallel_workstreams": [["task-1", "task-2"]]
+  }}
+}}"""),
+    ("human", NICHE_CONTEXT_PROMPT + """
+
+Plan the product, its architecture, and its implementation tasks for this opportunity."""),
+])
+
+
+class PlannerRole:
+    """Combined role that plans product, architecture, and tasks in one LLM call.
+
+    The staged roles re-send the product spec to the Architect and both specs
+    to the Project Manager. This role writes all three artifacts in a single
+    response under one system prompt, trading some depth per artifact for one
+    round trip and one copy of the shared context.
+    """
+
+    def __init__(self, llm: BaseChatModel | None = None):
+        """Initialize the Planner role.
+
+        Args:
+            llm: Language model to use (defaults to tier1 model)
+        """
+        self.llm = llm or _default_chat_model(0.5)
+
+    async def create_full_plan(
+        self,
+        niche: NicheCandidate,
+        validation_report: ValidationReport,
+    ) -> tuple[ProductSpec, TechnicalSpec, TaskGraph]:
+        """Create the product spec, technical spec, and task graph together.
+
+        Args:
+            niche: The validated niche opportunity
+            validation_report: Validation results and metrics
+
+        Returns:
+            Tuple of (ProductSpec, TechnicalSpec, TaskGraph)
+
+        Raises:
+            ValueError: If the response is missing a section or fails validation
+        """
+        logger.info("creating_full_plan", niche_name=niche.name)
+
+        response = await self.llm.ainvoke(self.build_messages(niche, validation_report))
+        product_spec, technical_spec, task_graph = self.parse_plan(response)
+
+        logger.info(
+            "full_plan_created",
+            product_name=product_spec.product_name,
+            story_count=len(product_spec.user_stories),
+            task_count=len(task_graph.tasks),
+        )
+
+        return product_spec, technical_spec, task_graph
+
+    def build_messages(
+        self,
+        niche: NicheCandidate,
+        validation_report: ValidationReport,
+    ) -> list[BaseMessage]:
+        """Render the planning prompt, e.g. for submission outside LangChain.
+
+        Args:
+            niche: The validated niche opportunity
+            validation_report: Validation results and metrics
+
+        Returns:
+            System and human messages for the combined plan
+        """
+        return PLANNER_TEMPLATE.format_messages(**_niche_context_inputs(niche, validation_report))
+
+    def parse_plan(self, response: Any) -> tuple[ProductSpec, TechnicalSpec, TaskGraph]:
+        """Parse a combined plan response.
+
+        Args:
+            response: Chat model response or raw response text
+
+        Returns:
+            Tuple of (ProductSpec, TechnicalSpec, TaskGraph)
+
+        Raises:
+            ValueError: If the response is missing a section or fails validation
+        """
+        data = _parse_json_object(response, "Planner")
+
+        try:
+            return (
+                ProductSpec.model_validate(data["product_spec"]),
+                TechnicalSpec.model_validate(data["technical_spec"]),
+                TaskGraph.model_validate(data["task_graph"]),
+            )
+        except KeyError as e:
+            raise ValueError(f"Planner response is missing the {e.args[0]} section") from e
@@ -5,6 +5,7 @@ embedding it into a vector store, and using RAG to identify promising micro-SaaS
 """
 
 import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from datetime import datetime
 from typing import Any
 
@@ -20,9 +21,22 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from ae_api.config import get_settings
+from ae_api.economy.providers.base import get_shared_http_client
 
 logger = structlog.get_logger()
 
+# Chunks embedded per provider request and inserted per vector-store transaction
+INGEST_BATCH_SIZE = 500
+
+# Trend documents buffered from an incoming stream before they are chunked and stored
+INGEST_DOCUMENT_BATCH_SIZE = 64
+
+
+async def _aiter_items(items: Iterable[Any]) -> AsyncIterator[Any]:
+    """Adapt a plain iterable to async iteration."""
+    for item in items:
+        yield item
+
 
 class TrendDocument(BaseModel):
     """A document representing a market trend or insight.
@@ -91,6 +105,7 @@ class NicheIdentificationEngine:
             model=settings.tier1_model,
             temperature=0.7,
             api_key=settings.openai_api_key.get_secret_value() if settings.openai_api_key else None,
+            http_async_client=get_shared_http_client(),
         )
 
         self.embeddings = embeddings or OpenAIEmbeddings(
@@ -117,7 +132,7 @@ class NicheIdentificationEngine:
         if self.vectorstore is None:
             settings = get_settings()
             # Convert AsyncEngine connection to sync connection string for PGVector
-            connection_string = str(settings.database_url).replace(
+            connection_string = settings.database_url_str.replace(
                 "postgresql+asyncpg://", "postgresql://"
             )
 
@@ -129,14 +144,18 @@ class NicheIdentificationEngine:
 
         return self.vectorstore
 
-    async def ingest_trends(self, sources: list[TrendDocument]) -> int:
+    async def ingest_trends(
+        self, sources: Iterable[TrendDocument] | AsyncIterable[TrendDocument]
+    ) -> int:
         """Fetch and embed trend data from various sources.
 
         This method takes trend documents, chunks them appropriately, generates
         embeddings, and stores them in the vector database for later retrieval.
+        Documents are consumed incrementally, INGEST_DOCUMENT_BATCH_SIZE at a
+        time, so an async stream can be ingested while it is still being fetched.
 
         Args:
-            sources: List of TrendDocument objects to ingest
+            sources: TrendDocument objects to ingest (a list or an async stream)
 
         Returns:
             Number of document chunks successfully ingested
@@ -144,40 +163,71 @@ class NicheIdentificationEngine:
         Raises:
             Exception: If ingestion fails
         """
-        logger.info("ingesting_trends", source_count=len(sources))
+        logger.info("ingesting_trends")
 
         try:
-            # Convert TrendDocuments to LangChain Documents
-            documents = []
-            for trend_doc in sources:
-                doc = Document(
-                    page_content=trend_doc.content,
-                    metadata={
-                        "source": trend_doc.source,
-                        "timestamp": trend_doc.timestamp.isoformat(),
-                        **trend_doc.metadata,
-                    },
-                )
-                documents.append(doc)
+            total_chunks = 0
+            batch: list[TrendDocument] = []
 
-            # Split documents into chunks
-            chunks = self.text_splitter.split_documents(documents)
-            logger.info("split_documents", chunk_count=len(chunks))
+            stream = sources if isinstance(sources, AsyncIterable) else _aiter_items(sources)
+            async for trend_doc in stream:
+                batch.append(trend_doc)
+                if len(batch) >= INGEST_DOCUMENT_BATCH_SIZE:
+                    total_chunks += await self._ingest_batch(batch)
+                    batch = []
 
-            # Add to vector store
-            vectorstore = await self._get_vectorstore()
-            await asyncio.to_thread(
-                vectorstore.add_documents,
-                chunks,
-            )
+            if batch:
+                total_chunks += await self._ingest_batch(batch)
 
-            logger.info("trends_ingested_successfully", chunk_count=len(chunks))
-            return len(chunks)
+            logger.info("trends_ingested_successfully", chunk_count=total_chunks)
+            return total_chunks
 
         except Exception as e:
             logger.error("trend_ingestion_failed", error=str(e))
             raise
 
+    async def _ingest_batch(self, trend_docs: list[TrendDocument]) -> int:
+        """Chunk, embed and store one batch of trend documents.
+
+        Args:
+            trend_docs: TrendDocument objects to ingest
+
+        Returns:
+            Number of document chunks stored
+        """
+        # Convert TrendDocuments to LangChain Documents
+        documents = [
+            Document(
+                page_content=trend_doc.content,
+                metadata={
+                    "source": trend_doc.source,
+                    "timestamp": trend_doc.timestamp.isoformat(),
+                    **trend_doc.metadata,
+                },
+            )
+            for trend_doc in trend_docs
+        ]
+
+        # Split documents into chunks
+        chunks = self.text_splitter.split_documents(documents)
+        logger.debug("split_documents", document_count=len(documents), chunk_count=len(chunks))
+
+        # Embed and store in batches: one embeddings request and one
+        # bulk insert per batch rather than per document
+        vectorstore = await self._get_vectorstore()
+        for start in range(0, len(chunks), INGEST_BATCH_SIZE):
+            batch = chunks[start : start + INGEST_BATCH_SIZE]
+            texts = [chunk.page_content for chunk in batch]
+            embeddings = await self.embeddings.aembed_documents(texts)
+            await asyncio.to_thread(
+                vectorstore.add_embeddings,
+                texts=texts,
+                embeddings=embeddings,
+                metadatas=[chunk.metadata for chunk in batch],
+            )
+
+        return len(chunks)
+
     async def identify_niches(self, intent: str, count: int = 10) -> list[NicheCandidate]:
         """Generate niche candidates from RAG-retrieved trend data.
 
@@ -4,6 +4,7 @@ This module provides integration with Hacker News (YCombinator) to fetch
 discussions, trending topics, and pain points from the tech community.
 """
 
+import asyncio
 from datetime import datetime
 
 import httpx
@@ -12,6 +13,9 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 from ae_api.genesis.niche_identification import TrendDocument
 from ae_api.genesis.sources.base import TrendSource
 
+# Item requests in flight at once per source instance (the API is rate limited)
+MAX_CONCURRENT_ITEM_FETCHES = 16
+
 
 class HackerNewsSource(TrendSource):
     """Fetch trend data from Hacker News.
@@ -32,6 +36,7 @@ class HackerNewsSource(TrendSource):
         )
         self.base_url = "https://hacker-news.firebaseio.com/v0"
         self.hn_url = "https://news.ycombinator.com"
+        self._item_slots = asyncio.Semaphore(MAX_CONCURRENT_ITEM_FETCHES)
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -71,26 +76,27 @@ class HackerNewsSource(TrendSource):
             # Fetch story IDs
             story_ids = await self._get_story_ids(story_type, limit * 2)
 
-            trends = []
             query_lower = query.lower()
 
-            # Fetch story details and filter by query
-            for story_id in story_ids:
-                if len(trends) >= limit:
-                    break
-
-                story = await self._get_item(story_id)
-                if not story:
-                    continue
-
-                # Filter by query relevance
-                title = story.get("title", "").lower()
-                text = story.get("text", "").lower()
+            # Fetch story details concurrently, then filter by query relevance
+            stories = await self._get_items(story_ids)
+            matching = [
+                story
+                for story in stories
+                if story
+                and (
+                    query_lower in story.get("title", "").lower()
+                    or query_lower in story.get("text", "").lower()
+                )
+            ][:limit]
 
-                if query_lower in title or query_lower in text:
-                    trend_doc = await self._story_to_trend_document(story, include_comments=True)
-                    if trend_doc:
-                        trends.append(trend_doc)
+            trend_docs = await asyncio.gather(
+                *(
+                    self._story_to_trend_document(story, include_comments=True)
+                    for story in matching
+                )
+            )
+            trends = [trend_doc for trend_doc in trend_docs if trend_doc]
 
             self.logger.info("hackernews_trends_fetched", count=len(trends))
             return trends
@@ -224,13 +230,25 @@ class HackerNewsSource(TrendSource):
         """
         try:
             url = f"{self.base_url}/item/{item_id}.json"
-            response = await self.http_client.get(url)
+            async with self._item_slots:
+                response = await self.http_client.get(url)
             response.raise_for_status()
             return response.json()
         except Exception as e:
             self.logger.warning("item_fetch_failed", item_id=item_id, error=str(e))
             return None
 
+    async def _get_items(self, item_ids: list[int]) -> list[dict | None]:
+        """Fetch several items concurrently, bounded by MAX_CONCURRENT_ITEM_FETCHES.
+
+        Args:
+            item_ids: HN item IDs
+
+        Returns:
+            Item data dictionaries (None for failed fetches), in input order
+        """
+        return list(await asyncio.gather(*(self._get_item(item_id) for item_id in item_ids)))
+
     async def _story_to_trend_document(
         self,
         story: dict,
@@ -261,12 +279,11 @@ class HackerNewsSource(TrendSource):
             # Include top comments if requested
             if include_comments and "kids" in story:
                 comment_ids = story["kids"][:max_comments]
-                comments = []
-
-                for comment_id in comment_ids:
-                    comment = await self._get_item(comment_id)
-                    if comment and comment.get("text"):
-                        comments.append(comment["text"])
+                comments = [
+                    comment["text"]
+                    for comment in await self._get_items(comment_ids)
+                    if comment and comment.get("text")
+                ]
 
                 if comments:
                     content_parts.append("\n\nTop Comments:")
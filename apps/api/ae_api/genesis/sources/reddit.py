@@ -4,6 +4,7 @@ This module provides integration with Reddit to fetch discussions, pain points,
 and trending topics from relevant subreddits.
 """
 
+import asyncio
 from datetime import datetime
 
 import httpx
@@ -67,16 +68,21 @@ class RedditSource(TrendSource):
         try:
             trends = []
 
-            # If specific subreddits provided, search each
+            # If specific subreddits provided, search them concurrently
             if subreddits:
-                for subreddit in subreddits:
-                    subreddit_trends = await self._search_subreddit(
-                        subreddit=subreddit,
-                        query=query,
-                        limit=limit // len(subreddits),
-                        sort=sort,
-                        time_filter=time_filter,
+                results = await asyncio.gather(
+                    *(
+                        self._search_subreddit(
+                            subreddit=subreddit,
+                            query=query,
+                            limit=limit // len(subreddits),
+                            sort=sort,
+                            time_filter=time_filter,
+                        )
+                        for subreddit in subreddits
                     )
+                )
+                for subreddit_trends in results:
                     trends.extend(subreddit_trends)
             else:
                 # Search all of Reddit
@@ -9,11 +9,13 @@ This module provides capabilities for validating niche candidates through:
 """
 
 import asyncio
+import hashlib
 import re
 from typing import Any
 
 import httpx
 import structlog
+from cachetools import TTLCache
 from langchain_core.language_models import BaseChatModel
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
@@ -21,10 +23,24 @@ from pydantic import BaseModel, Field
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ae_api.config import get_settings
+from ae_api.economy.providers.base import get_shared_http_client
 from ae_api.genesis.niche_identification import NicheCandidate
 
 logger = structlog.get_logger()
 
+# Upper bound on niches validated at once by a single agent (external API rate limits)
+MAX_CONCURRENT_VALIDATIONS = 8
+
+# Validation reports are reused for identical niches for this long (seconds)
+VALIDATION_CACHE_TTL = 3600
+_validation_cache: TTLCache = TTLCache(maxsize=4096, ttl=VALIDATION_CACHE_TTL)
+_validation_locks: dict[bytes, asyncio.Lock] = {}
+
+
+def _niche_cache_key(niche: NicheCandidate) -> bytes:
+    """Digest of a niche's canonical JSON form, used as the validation cache key."""
+    return hashlib.blake2b(niche.model_dump_json().encode("utf-8"), digest_size=16).digest()
+
 
 class ValidationMetrics(BaseModel):
     """Metrics for validating a niche opportunity.
@@ -87,12 +103,14 @@ class ValidatorAgent:
             model=settings.tier1_model,
             temperature=0.3,  # Lower temperature for more factual analysis
             api_key=settings.openai_api_key.get_secret_value() if settings.openai_api_key else None,
+            http_async_client=get_shared_http_client(),
         )
 
         self.http_client = httpx.AsyncClient(
             timeout=30.0,
             headers={"User-Agent": "AutonomousEnterprise/0.1.0"},
         )
+        self._validation_slots = asyncio.Semaphore(MAX_CONCURRENT_VALIDATIONS)
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -105,6 +123,37 @@ class ValidatorAgent:
     async def validate_niche(self, niche: NicheCandidate) -> ValidationReport:
         """Run full validation on a niche candidate.
 
+        Reports are cached per niche for VALIDATION_CACHE_TTL seconds, and
+        concurrent requests for the same niche wait for a single validation
+        run instead of each starting their own.
+
+        Args:
+            niche: The NicheCandidate to validate
+
+        Returns:
+            ValidationReport with all metrics and analysis
+        """
+        key = _niche_cache_key(niche)
+        report = _validation_cache.get(key)
+        if report is not None:
+            logger.debug("validation_cache_hit", niche_name=niche.name)
+            return report
+
+        lock = _validation_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                report = _validation_cache.get(key)
+                if report is None:
+                    report = await self._run_validation(niche)
+                    _validation_cache[key] = report
+                return report
+        finally:
+            if not lock.locked():
+                _validation_locks.pop(key, None)
+
+    async def _run_validation(self, niche: NicheCandidate) -> ValidationReport:
+        """Run all validation checks for a niche candidate.
+
         This method orchestrates all validation checks and produces a comprehensive
         report with actionable recommendations.
 
@@ -186,6 +235,25 @@ class ValidatorAgent:
             logger.error("validation_failed", error=str(e), niche_name=niche.name)
             raise
 
+    async def validate_niches(self, niches: list[NicheCandidate]) -> list[ValidationReport]:
+        """Validate several niche candidates concurrently.
+
+        At most MAX_CONCURRENT_VALIDATIONS niches are in flight at once; all of
+        them share this agent's LLM and HTTP client.
+
+        Args:
+            niches: NicheCandidates to validate
+
+        Returns:
+            ValidationReports in the same order as the input niches
+        """
+
+        async def _validate(niche: NicheCandidate) -> ValidationReport:
+            async with self._validation_slots:
+                return await self.validate_niche(niche)
+
+        return list(await asyncio.gather(*(_validate(niche) for niche in niches)))
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def check_search_volume(self, keywords: list[str]) -> int:
         """Estimate search volume for keywords.
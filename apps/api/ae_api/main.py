@@ -1,19 +1,55 @@
 """Autonomous Enterprise - FastAPI Control Plane."""
 
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from ae_api.api.errors import register_exception_handlers
 from ae_api.api.v1.router import api_router
 from ae_api.config import get_settings
+from ae_api.db.redis import close_redis_pool
+from ae_api.db.session import warm_up_pool
+from ae_api.economy.providers.base import close_shared_http_client
 from ae_api.observability.otel import setup_telemetry
+from ae_api.orchestration.temporal_client import close_temporal_client, get_client
 
-logger = structlog.get_logger()
 settings = get_settings()
 
+# Drop log calls below the configured level before any event dict is built
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(
+        logging.DEBUG if settings.debug else getattr(logging, settings.log_level)
+    ),
+    cache_logger_on_first_use=True,
+)
+
+logger = structlog.get_logger()
+
+# Upper bound on how long startup waits for each dependency to connect
+WARMUP_TIMEOUT_SECONDS = 10
+
+
+async def _warm_up() -> None:
+    """Pre-open the database pool and Temporal channel before serving traffic.
+
+    Failures are logged rather than raised: both connect lazily on first use,
+    so an unavailable dependency only costs the warm start, not startup.
+    """
+    results = await asyncio.gather(
+        asyncio.wait_for(warm_up_pool(settings.db_pool_warmup), WARMUP_TIMEOUT_SECONDS),
+        asyncio.wait_for(get_client(), WARMUP_TIMEOUT_SECONDS),
+        return_exceptions=True,
+    )
+    for name, result in zip(("database", "temporal"), results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning("Connection warm-up failed", dependency=name, error=repr(result))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -21,9 +57,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Startup
     logger.info("Starting Autonomous Enterprise API", version=settings.app_version)
     setup_telemetry()
+    await _warm_up()
     yield
     # Shutdown
     logger.info("Shutting down Autonomous Enterprise API")
+    await close_redis_pool()
+    await close_temporal_client()
+    await close_shared_http_client()
 
 
 app = FastAPI(
@@ -31,6 +71,7 @@ app = FastAPI(
     version=settings.app_version,
     description="Self-Monetizing AI Agent Swarm - Control Plane API",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
 )
@@ -44,6 +85,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Map service-layer exceptions to HTTP responses
+register_exception_handlers(app)
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
@@ -27,7 +27,8 @@ def genesis_workflow_id_from_intent(intent: str) -> str:
     Returns:
         Workflow ID in format "genesis-{hash}"
     """
-    # Create a stable hash of the intent
+    # Create a stable hash of the intent. The derivation must not change:
+    # Temporal deduplicates Genesis runs against IDs of workflows already started
     intent_hash = hashlib.sha256(intent.encode()).hexdigest()[:16]
     return genesis_workflow_id(intent_hash)
 
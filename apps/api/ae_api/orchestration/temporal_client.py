@@ -1,6 +1,7 @@
 """Temporal client wrapper for Autonomous Enterprise workflows."""
 
 import asyncio
+from functools import lru_cache
 from typing import Any, Optional
 
 from temporalio.client import (
@@ -36,6 +37,7 @@ class TemporalClient:
         """
         self.settings = settings or get_settings()
         self._client: Optional[Client] = None
+        self._connect_lock = asyncio.Lock()
 
     async def connect(self) -> Client:
         """
@@ -50,16 +52,21 @@ class TemporalClient:
         if self._client is not None:
             return self._client
 
-        # Parse TLS config if needed
-        tls_config: Optional[TLSConfig] = None
-        # Add TLS support if certificates are configured in settings
-        # tls_config = TLSConfig(...)
+        # Concurrent first callers share a single connection attempt
+        async with self._connect_lock:
+            if self._client is not None:
+                return self._client
 
-        self._client = await Client.connect(
-            self.settings.temporal_host,
-            namespace=self.settings.temporal_namespace,
-            tls=tls_config,
-        )
+            # Parse TLS config if needed
+            tls_config: Optional[TLSConfig] = None
+            # Add TLS support if certificates are configured in settings
+            # tls_config = TLSConfig(...)
+
+            self._client = await Client.connect(
+                self.settings.temporal_host,
+                namespace=self.settings.temporal_namespace,
+                tls=tls_config,
+            )
 
         return self._client
 
@@ -395,6 +402,33 @@ class TemporalClient:
         return workflows
 
 
+@lru_cache(maxsize=1)
+def _shared_client() -> TemporalClient:
+    """Build the process-wide TemporalClient."""
+    return TemporalClient()
+
+
+async def get_temporal_client() -> TemporalClient:
+    """
+    Get the process-wide Temporal client (FastAPI dependency).
+
+    The underlying gRPC connection is opened on first use and reused by every
+    subsequent request; the Temporal SDK reconnects the channel on its own if
+    the server goes away.
+
+    Returns:
+        Shared TemporalClient instance
+    """
+    return _shared_client()
+
+
+async def close_temporal_client() -> None:
+    """Release the process-wide Temporal client (called on app shutdown)."""
+    if _shared_client.cache_info().currsize:
+        await _shared_client().disconnect()
+        _shared_client.cache_clear()
+
+
 async def get_client() -> TemporalClient:
     """
     Factory function to get a connected Temporal client.
@@ -402,6 +436,6 @@ async def get_client() -> TemporalClient:
     Returns:
         Connected TemporalClient instance
     """
-    client = TemporalClient()
+    client = _shared_client()
     await client.connect()
     return client
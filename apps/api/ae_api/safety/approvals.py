@@ -85,6 +85,17 @@ class ApprovalQueue:
     APPROVAL_KEY_PREFIX = "approval:"
     PENDING_SET_KEY = "approvals:pending"
     APPROVAL_TTL = 86400 * 7  # 7 days in seconds
+    PIPELINE_BATCH_SIZE = 1000  # Max commands queued per pipeline round trip
+
+    # Atomically removes every approval whose expiry score is <= now from the
+    # pending set and returns their ids. The approvals themselves are rewritten
+    # from Python so they keep the pydantic serialization (cjson would mangle
+    # empty arrays and large numbers in the user-supplied context).
+    POP_EXPIRED_SCRIPT = """
+local expired_ids = redis.call('ZRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+return expired_ids
+"""
 
     def __init__(self, redis_client: Redis):
         """
@@ -94,6 +105,8 @@ class ApprovalQueue:
             redis_client: Redis client for storing approval state
         """
         self.redis = redis_client
+        # Script SHA is cached client-side and invoked via EVALSHA
+        self._pop_expired_script = redis_client.register_script(self.POP_EXPIRED_SCRIPT)
 
     async def create_approval(
         self, request: CreateApprovalRequest
@@ -110,20 +123,14 @@ class ApprovalQueue:
         Raises:
             ValueError: If approval already exists
         """
-        logger.info(
+        logger.debug(
             "Creating approval request",
             action_id=request.action_id,
             action_type=request.action_type,
             run_id=request.run_id,
         )
 
-        # Check if approval already exists
         approval_key = f"{self.APPROVAL_KEY_PREFIX}{request.action_id}"
-        exists = await self.redis.exists(approval_key)
-
-        if exists:
-            raise ValueError(f"Approval already exists for action_id: {request.action_id}")
-
         now = time.time()
         expires_at = now + request.timeout_seconds
 
@@ -140,18 +147,27 @@ class ApprovalQueue:
             timeout_seconds=request.timeout_seconds,
         )
 
-        # Store approval in Redis
-        await self.redis.set(
-            approval_key,
-            approval.model_dump_json(),
-            ex=self.APPROVAL_TTL,
-        )
+        # Store approval (only if absent) and index it in the pending set
+        # with its expiration score in a single MULTI/EXEC round trip
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(
+                approval_key,
+                approval.model_dump_json(),
+                ex=self.APPROVAL_TTL,
+                nx=True,
+            )
+            pipe.zadd(
+                self.PENDING_SET_KEY,
+                {request.action_id: expires_at},
+                nx=True,
+            )
+            created, indexed = await pipe.execute()
 
-        # Add to pending set with expiration score
-        await self.redis.zadd(
-            self.PENDING_SET_KEY,
-            {request.action_id: expires_at},
-        )
+        if not created:
+            # Undo the index entry if this call added it for a non-pending approval
+            if indexed:
+                await self.redis.zrem(self.PENDING_SET_KEY, request.action_id)
+            raise ValueError(f"Approval already exists for action_id: {request.action_id}")
 
         logger.info(
             "Approval request created",
@@ -212,7 +228,7 @@ class ApprovalQueue:
         Returns:
             List of pending approval requests
         """
-        logger.info("Listing pending approvals", run_id=run_id, limit=limit)
+        logger.debug("Listing pending approvals", run_id=run_id, limit=limit)
 
         # Get all pending action IDs sorted by expiration time
         pending_ids = await self.redis.zrange(
@@ -225,23 +241,54 @@ class ApprovalQueue:
         if not pending_ids:
             return []
 
-        # Fetch all approvals
-        approvals: list[ApprovalRequest] = []
-        for action_id in pending_ids:
-            try:
-                approval = await self.get_approval(action_id)
+        # Fetch all approvals in pipelined batches (one round trip per batch)
+        approval_jsons: list[str | None] = []
+        for start in range(0, len(pending_ids), self.PIPELINE_BATCH_SIZE):
+            batch = pending_ids[start : start + self.PIPELINE_BATCH_SIZE]
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for action_id in batch:
+                    pipe.get(f"{self.APPROVAL_KEY_PREFIX}{action_id}")
+                approval_jsons.extend(await pipe.execute())
 
-                # Filter by run_id if specified
-                if run_id is None or approval.run_id == run_id:
-                    # Only include if still pending
-                    if approval.status == ApprovalStatus.PENDING:
-                        approvals.append(approval)
+        now = time.time()
+        approvals: list[ApprovalRequest] = []
+        expired: list[ApprovalRequest] = []
+        stale_ids: list[str] = []
 
-            except ValueError:
+        for action_id, approval_json in zip(pending_ids, approval_jsons, strict=True):
+            if approval_json is None:
                 # Approval no longer exists, remove from set
-                await self.redis.zrem(self.PENDING_SET_KEY, action_id)
+                stale_ids.append(action_id)
                 continue
 
+            approval = ApprovalRequest.model_validate_json(approval_json)
+
+            # Check if expired
+            if approval.status == ApprovalStatus.PENDING and now > approval.expires_at:
+                approval.status = ApprovalStatus.EXPIRED
+                expired.append(approval)
+                stale_ids.append(action_id)
+                logger.warning("Approval request expired", action_id=action_id)
+                continue
+
+            # Filter by run_id if specified, only include if still pending
+            if approval.status == ApprovalStatus.PENDING and (
+                run_id is None or approval.run_id == run_id
+            ):
+                approvals.append(approval)
+
+        # Persist expirations and prune the pending set in a single round trip
+        if stale_ids:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for approval in expired:
+                    pipe.set(
+                        f"{self.APPROVAL_KEY_PREFIX}{approval.action_id}",
+                        approval.model_dump_json(),
+                        ex=self.APPROVAL_TTL,
+                    )
+                pipe.zrem(self.PENDING_SET_KEY, *stale_ids)
+                await pipe.execute()
+
         return approvals
 
     async def decide_approval(
@@ -260,7 +307,7 @@ class ApprovalQueue:
         Raises:
             ValueError: If approval doesn't exist or is not pending
         """
-        logger.info(
+        logger.debug(
             "Deciding approval",
             action_id=action_id,
             approved=decision.approved,
@@ -386,7 +433,7 @@ class ApprovalQueue:
         Raises:
             ValueError: If approval doesn't exist or is not pending
         """
-        logger.info("Cancelling approval", action_id=action_id, reason=reason)
+        logger.debug("Cancelling approval", action_id=action_id, reason=reason)
 
         approval = await self.get_approval(action_id)
 
@@ -418,46 +465,47 @@ class ApprovalQueue:
         """
         Clean up expired approval requests from the pending set.
 
+        Expired ids are popped from the pending set by a server-side script in
+        one round trip, so concurrent cleanups never process the same approval.
+        The approvals are then read and rewritten in pipelined batches.
+
         Returns:
             Number of expired approvals cleaned up
         """
         logger.info("Cleaning up expired approvals")
 
-        now = time.time()
-
-        # Get all expired action IDs (score < now)
-        expired_ids = await self.redis.zrangebyscore(
-            self.PENDING_SET_KEY,
-            min=0,
-            max=now,
+        expired_ids = await self._pop_expired_script(
+            keys=[self.PENDING_SET_KEY],
+            args=[time.time()],
         )
 
-        if not expired_ids:
-            return 0
-
-        # Mark each as expired and remove from pending set
         count = 0
-        for action_id in expired_ids:
-            try:
-                approval = await self.get_approval(action_id)
-
+        for start in range(0, len(expired_ids), self.PIPELINE_BATCH_SIZE):
+            batch = expired_ids[start : start + self.PIPELINE_BATCH_SIZE]
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for action_id in batch:
+                    pipe.get(f"{self.APPROVAL_KEY_PREFIX}{action_id}")
+                approval_jsons = await pipe.execute()
+
+            expired: list[ApprovalRequest] = []
+            for approval_json in approval_jsons:
+                if approval_json is None:
+                    continue
+                count += 1
+                approval = ApprovalRequest.model_validate_json(approval_json)
                 if approval.status == ApprovalStatus.PENDING:
                     approval.status = ApprovalStatus.EXPIRED
-                    approval_key = f"{self.APPROVAL_KEY_PREFIX}{action_id}"
-                    await self.redis.set(
-                        approval_key,
-                        approval.model_dump_json(),
-                        ex=self.APPROVAL_TTL,
-                    )
-
-                # Remove from pending set
-                await self.redis.zrem(self.PENDING_SET_KEY, action_id)
-                count += 1
-
-            except ValueError:
-                # Approval no longer exists, just remove from set
-                await self.redis.zrem(self.PENDING_SET_KEY, action_id)
-                continue
+                    expired.append(approval)
+
+            if expired:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for approval in expired:
+                        pipe.set(
+                            f"{self.APPROVAL_KEY_PREFIX}{approval.action_id}",
+                            approval.model_dump_json(),
+                            ex=self.APPROVAL_TTL,
+                        )
+                    await pipe.execute()
 
         logger.info("Expired approvals cleaned up", count=count)
         return count
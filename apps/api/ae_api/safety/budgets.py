@@ -9,6 +9,20 @@ from redis.asyncio import Redis
 
 logger = structlog.get_logger()
 
+# Reads the limit, increments spent and flags an overrun in one atomic round
+# trip. Returns nil when the budget does not exist, otherwise {limit, spent}.
+_SPEND_SCRIPT = """
+local limit = redis.call('GET', KEYS[1])
+if not limit then
+    return nil
+end
+local spent = redis.call('INCRBYFLOAT', KEYS[2], ARGV[1])
+if tonumber(spent) > tonumber(limit) then
+    redis.call('SET', KEYS[3], '1', 'KEEPTTL')
+end
+return {limit, spent}
+"""
+
 
 class BudgetStatus(BaseModel):
     """Status of a budget for a specific run."""
@@ -36,6 +50,7 @@ class BudgetTracker:
             redis_client: Redis client for tracking budget state
         """
         self.redis = redis_client
+        self._spend_script = redis_client.register_script(_SPEND_SCRIPT)
 
     async def create_budget(self, run_id: str, limit: float) -> BudgetStatus:
         """
@@ -56,17 +71,16 @@ class BudgetTracker:
 
         logger.info("Creating budget", run_id=run_id, limit=limit)
 
-        # Set budget limit
         budget_key = f"{self.BUDGET_KEY_PREFIX}{run_id}"
-        await self.redis.set(budget_key, str(limit), ex=self.DEFAULT_TTL)
-
-        # Initialize spent to 0
         spent_key = f"{self.SPENT_KEY_PREFIX}{run_id}"
-        await self.redis.set(spent_key, "0", ex=self.DEFAULT_TTL)
-
-        # Set exceeded flag to false
         exceeded_key = f"{self.EXCEEDED_KEY_PREFIX}{run_id}"
-        await self.redis.set(exceeded_key, "0", ex=self.DEFAULT_TTL)
+
+        # Set limit, zero spent and clear the exceeded flag in one round trip
+        async with self.redis.pipeline() as pipe:
+            pipe.set(budget_key, str(limit), ex=self.DEFAULT_TTL)
+            pipe.set(spent_key, "0", ex=self.DEFAULT_TTL)
+            pipe.set(exceeded_key, "0", ex=self.DEFAULT_TTL)
+            await pipe.execute()
 
         return BudgetStatus(
             run_id=run_id,
@@ -93,29 +107,26 @@ class BudgetTracker:
         if amount < 0:
             raise ValueError(f"Amount must be non-negative, got {amount}")
 
-        logger.info("Recording spend", run_id=run_id, amount=amount)
+        logger.debug("Recording spend", run_id=run_id, amount=amount)
 
-        # Check if budget exists
-        budget_key = f"{self.BUDGET_KEY_PREFIX}{run_id}"
-        limit_str = await self.redis.get(budget_key)
+        # Check the budget exists, increment spent and set the exceeded flag atomically
+        result = await self._spend_script(
+            keys=[
+                f"{self.BUDGET_KEY_PREFIX}{run_id}",
+                f"{self.SPENT_KEY_PREFIX}{run_id}",
+                f"{self.EXCEEDED_KEY_PREFIX}{run_id}",
+            ],
+            args=[amount],
+        )
 
-        if limit_str is None:
+        if result is None:
             raise ValueError(f"Budget not found for run_id: {run_id}")
 
-        limit = float(limit_str)
-
-        # Increment spent amount atomically
-        spent_key = f"{self.SPENT_KEY_PREFIX}{run_id}"
-        spent = float(await self.redis.incrbyfloat(spent_key, amount))
-
-        # Check if budget exceeded
+        limit, spent = float(result[0]), float(result[1])
         exceeded = spent > limit
         remaining = max(0.0, limit - spent)
 
-        # Update exceeded flag if necessary
         if exceeded:
-            exceeded_key = f"{self.EXCEEDED_KEY_PREFIX}{run_id}"
-            await self.redis.set(exceeded_key, "1")
             logger.warning(
                 "Budget exceeded",
                 run_id=run_id,
@@ -186,30 +197,50 @@ class BudgetTracker:
             True if the spend would be within budget
         """
         try:
-            status = await self.get_status(run_id)
+            can_spend, _ = await self.check_and_status(run_id, amount)
+            return can_spend
+
+        except ValueError as e:
+            logger.error("Error checking budget", run_id=run_id, error=str(e))
+            return False
+
+    async def check_and_status(self, run_id: str, amount: float) -> tuple[bool, BudgetStatus]:
+        """
+        Check if a spend amount would exceed the budget, returning the status used.
 
-            # If already exceeded, no more spending allowed
-            if status.exceeded:
-                logger.warning("Budget already exceeded", run_id=run_id)
-                return False
+        Both results come from a single status read, so callers that need the
+        current status alongside the check avoid a second round trip.
 
-            # Check if this spend would exceed budget
-            would_exceed = (status.spent + amount) > status.limit
+        Args:
+            run_id: Unique identifier for the run
+            amount: Amount to check in USD
 
-            if would_exceed:
-                logger.warning(
-                    "Spend would exceed budget",
-                    run_id=run_id,
-                    amount=amount,
-                    spent=status.spent,
-                    limit=status.limit,
-                )
+        Returns:
+            Tuple of (whether the spend would be within budget, current status)
 
-            return not would_exceed
+        Raises:
+            ValueError: If budget doesn't exist
+        """
+        status = await self.get_status(run_id)
 
-        except ValueError as e:
-            logger.error("Error checking budget", run_id=run_id, error=str(e))
-            return False
+        # If already exceeded, no more spending allowed
+        if status.exceeded:
+            logger.warning("Budget already exceeded", run_id=run_id)
+            return False, status
+
+        # Check if this spend would exceed budget
+        would_exceed = (status.spent + amount) > status.limit
+
+        if would_exceed:
+            logger.warning(
+                "Spend would exceed budget",
+                run_id=run_id,
+                amount=amount,
+                spent=status.spent,
+                limit=status.limit,
+            )
+
+        return not would_exceed, status
 
     async def delete_budget(self, run_id: str) -> None:
         """
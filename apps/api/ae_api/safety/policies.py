@@ -93,7 +93,7 @@ class PolicyGate:
         Returns:
             PolicyDecision with allowed status and reasoning
         """
-        logger.info("Checking policy", action=action, context=context)
+        logger.debug("Checking policy", action=action, context=context)
 
         # Check if action type is enabled
         if action == ActionType.EXECUTE_CODE and not self.enable_code_execution:
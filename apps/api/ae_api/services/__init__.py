@@ -1,6 +1,12 @@
 """Services package for Autonomous Enterprise."""
 
 from ae_api.services.artifact_store import Artifact, ArtifactStore
+from ae_api.services.errors import (
+    DeploymentError,
+    DeploymentResponseError,
+    DeploymentTimeoutError,
+    SourcePathNotFoundError,
+)
 from ae_api.services.netlify_service import NetlifyDeployment, NetlifyService
 from ae_api.services.stripe_service import (
     PaymentLink,
@@ -15,9 +21,13 @@ from ae_api.services.vercel_service import VercelDeployment, VercelService
 __all__ = [
     "Artifact",
     "ArtifactStore",
+    "DeploymentError",
+    "DeploymentResponseError",
+    "DeploymentTimeoutError",
     "NetlifyDeployment",
     "NetlifyService",
     "PaymentLink",
+    "SourcePathNotFoundError",
     "StripePrice",
     "StripeProduct",
     "StripeService",
@@ -1,5 +1,6 @@
 """Artifact storage service for project artifacts."""
 
+import asyncio
 import hashlib
 import json
 from datetime import datetime
@@ -11,8 +12,41 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+try:
+    from blake3 import blake3
+except ImportError:  # Optional; falls back to SHA-256 (SHA-NI accelerated via OpenSSL)
+    blake3 = None
+
 logger = structlog.get_logger()
 
+# BLAKE3 checksums are prefixed so existing SHA-256 checksums stay verifiable
+BLAKE3_PREFIX = "b3:"
+
+# Larger payloads are hashed in a worker thread; both hashers release the GIL
+HASH_OFFLOAD_BYTES = 1024 * 1024
+
+
+def _checksum(content: bytes, use_blake3: bool) -> str:
+    """Compute a hex checksum of artifact content.
+
+    Args:
+        content: Artifact content
+        use_blake3: Use BLAKE3 (prefixed) instead of SHA-256
+
+    Returns:
+        Hex digest, prefixed with BLAKE3_PREFIX for BLAKE3
+    """
+    if use_blake3:
+        return BLAKE3_PREFIX + blake3(content, max_threads=blake3.AUTO).hexdigest()
+    return hashlib.sha256(content).hexdigest()
+
+
+async def _checksum_async(content: bytes, use_blake3: bool) -> str:
+    """Compute a checksum without blocking the event loop on large content."""
+    if len(content) < HASH_OFFLOAD_BYTES:
+        return _checksum(content, use_blake3)
+    return await asyncio.to_thread(_checksum, content, use_blake3)
+
 
 class ArtifactType(str, Enum):
     """Artifact type enum."""
@@ -156,7 +190,7 @@ class ArtifactStore:
 
             # Generate artifact ID and path
             artifact_id = str(uuid4())
-            checksum = hashlib.sha256(content).hexdigest()
+            checksum = await _checksum_async(content, use_blake3=blake3 is not None)
             size_bytes = len(content)
 
             # Construct storage path
@@ -234,15 +268,22 @@ class ArtifactStore:
             else:
                 raise ValueError(f"Unknown storage backend: {self.storage_backend}")
 
-            # Verify checksum
-            checksum = hashlib.sha256(content).hexdigest()
-            if checksum != artifact.checksum:
+            # Verify checksum with the algorithm it was stored with
+            use_blake3 = artifact.checksum.startswith(BLAKE3_PREFIX)
+            if use_blake3 and blake3 is None:
                 logger.warning(
-                    "Checksum mismatch",
+                    "Skipping checksum verification; blake3 not installed",
                     artifact_id=artifact_id,
-                    expected=artifact.checksum,
-                    actual=checksum,
                 )
+            else:
+                checksum = await _checksum_async(content, use_blake3)
+                if checksum != artifact.checksum:
+                    logger.warning(
+                        "Checksum mismatch",
+                        artifact_id=artifact_id,
+                        expected=artifact.checksum,
+                        actual=checksum,
+                    )
 
             logger.info("Artifact retrieved", artifact_id=artifact_id)
             return content
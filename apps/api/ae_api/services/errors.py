@@ -0,0 +1,17 @@
+"""Exceptions raised by the deployment services."""
+
+
+class DeploymentError(RuntimeError):
+    """A deployment ended in a failed state on the hosting platform."""
+
+
+class DeploymentTimeoutError(DeploymentError, TimeoutError):
+    """A deployment did not reach a final state within the allowed time."""
+
+
+class DeploymentResponseError(DeploymentError):
+    """A platform API returned a response the service could not parse."""
+
+
+class SourcePathNotFoundError(FileNotFoundError):
+    """The source directory to deploy does not exist."""
@@ -12,6 +12,13 @@ import httpx
 import structlog
 from pydantic import BaseModel, Field
 
+from ae_api.services.errors import (
+    DeploymentError,
+    DeploymentResponseError,
+    DeploymentTimeoutError,
+    SourcePathNotFoundError,
+)
+
 logger = structlog.get_logger()
 
 
@@ -19,11 +26,17 @@ class DeploymentState(str, Enum):
     """Netlify deployment state."""
 
     NEW = "new"
+    ENQUEUED = "enqueued"
     BUILDING = "building"
+    UPLOADING = "uploading"
+    UPLOADED = "uploaded"
+    PREPARING = "preparing"
+    PREPARED = "prepared"
     PROCESSING = "processing"
+    PROCESSED = "processed"
+    RETRYING = "retrying"
     READY = "ready"
     ERROR = "error"
-    UPLOADING = "uploading"
 
 
 class NetlifyDeployment(BaseModel):
@@ -87,6 +100,7 @@ class NetlifyService:
             NetlifyDeployment model
 
         Raises:
+            DeploymentResponseError: If the Netlify response cannot be parsed
             httpx.HTTPError: If deployment fails
         """
         try:
@@ -130,6 +144,8 @@ class NetlifyService:
                 site_name=site_name,
             )
             raise
+        except (KeyError, TypeError, ValueError) as e:
+            raise DeploymentResponseError(f"Unexpected Netlify API response: {e!r}") from e
 
     async def get_deployment(self, deployment_id: str) -> NetlifyDeployment:
         """Get deployment details.
@@ -141,6 +157,7 @@ class NetlifyService:
             NetlifyDeployment model
 
         Raises:
+            DeploymentResponseError: If the Netlify response cannot be parsed
             httpx.HTTPError: If retrieval fails
         """
         try:
@@ -170,6 +187,8 @@ class NetlifyService:
                 deployment_id=deployment_id,
             )
             raise
+        except (KeyError, TypeError, ValueError) as e:
+            raise DeploymentResponseError(f"Unexpected Netlify API response: {e!r}") from e
 
     async def wait_for_deployment(
         self,
@@ -188,7 +207,8 @@ class NetlifyService:
             NetlifyDeployment model
 
         Raises:
-            TimeoutError: If deployment doesn't complete within timeout
+            DeploymentError: If the deployment ends in a failed state
+            DeploymentTimeoutError: If deployment doesn't complete within timeout
         """
         start_time = datetime.now()
         while (datetime.now() - start_time).seconds < timeout:
@@ -199,11 +219,11 @@ class NetlifyService:
                 return deployment
 
             if deployment.state == DeploymentState.ERROR:
-                raise RuntimeError("Deployment failed with error state")
+                raise DeploymentError("Deployment failed with error state")
 
             await asyncio.sleep(poll_interval)
 
-        raise TimeoutError(
+        raise DeploymentTimeoutError(
             f"Deployment {deployment_id} did not complete within {timeout} seconds"
         )
 
@@ -265,6 +285,7 @@ class NetlifyService:
             NetlifySite model
 
         Raises:
+            DeploymentResponseError: If the Netlify response cannot be parsed
             httpx.HTTPError: If retrieval fails
         """
         try:
@@ -286,6 +307,8 @@ class NetlifyService:
         except httpx.HTTPError as e:
             logger.error("Failed to get site", error=str(e), site_id=site_id)
             raise
+        except (KeyError, TypeError, ValueError) as e:
+            raise DeploymentResponseError(f"Unexpected Netlify API response: {e!r}") from e
 
     async def create_site(
         self,
@@ -304,6 +327,7 @@ class NetlifyService:
             NetlifySite model
 
         Raises:
+            DeploymentResponseError: If the Netlify response cannot be parsed
             httpx.HTTPError: If site creation fails
         """
         try:
@@ -338,6 +362,8 @@ class NetlifyService:
         except httpx.HTTPError as e:
             logger.error("Failed to create site", error=str(e), name=name)
             raise
+        except (KeyError, TypeError, ValueError) as e:
+            raise DeploymentResponseError(f"Unexpected Netlify API response: {e!r}") from e
 
     async def delete_site(self, site_id: str) -> None:
         """Delete a Netlify site.
@@ -403,6 +429,8 @@ class NetlifyService:
         except httpx.HTTPError as e:
             logger.error("Failed to ensure site", error=str(e), name=name)
             raise
+        except (KeyError, TypeError, ValueError) as e:
+            raise DeploymentResponseError(f"Unexpected Netlify API response: {e!r}") from e
 
     async def _upload_files(
         self, site_id: str, deploy_id: str, source_path: str
@@ -421,7 +449,7 @@ class NetlifyService:
             source = Path(source_path)
 
             if not source.exists():
-                raise FileNotFoundError(f"Source path does not exist: {source_path}")
+                raise SourcePathNotFoundError(f"Source path does not exist: {source_path}")
 
             # Create zip file
             zip_buffer = BytesIO()
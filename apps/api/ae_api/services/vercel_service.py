@@ -13,6 +13,13 @@ import httpx
 import structlog
 from pydantic import BaseModel, Field
 
+from ae_api.services.errors import (
+    DeploymentError,
+    DeploymentResponseError,
+    DeploymentTimeoutError,
+    SourcePathNotFoundError,
+)
+
 logger = structlog.get_logger()
 
 
@@ -90,6 +97,7 @@ class VercelService:
             VercelDeployment model
 
         Raises:
+            DeploymentResponseError: If the Vercel response cannot be parsed
             httpx.HTTPError: If deployment fails
         """
         try:
@@ -146,6 +154,8 @@ class VercelService:
                 project_name=project_name,
             )
             raise
+        except (KeyError, TypeError, ValueError) as e:
+            raise DeploymentResponseError(f"Unexpected Vercel API response: {e!r}") from e
 
     async def get_deployment(self, deployment_id: str) -> VercelDeployment:
         """Get deployment details.
@@ -157,6 +167,7 @@ class VercelService:
             VercelDeployment model
 
         Raises:
+            DeploymentResponseError: If the Vercel response cannot be parsed
             httpx.HTTPError: If retrieval fails
         """
         try:
@@ -186,6 +197,8 @@ class VercelService:
                 deployment_id=deployment_id,
             )
             raise
+        except (KeyError, TypeError, ValueError) as e:
+            raise DeploymentResponseError(f"Unexpected Vercel API response: {e!r}") from e
 
     async def wait_for_deployment(
         self,
@@ -204,7 +217,8 @@ class VercelService:
             VercelDeployment model
 
         Raises:
-            TimeoutError: If deployment doesn't complete within timeout
+            DeploymentError: If the deployment ends in a failed state
+            DeploymentTimeoutError: If deployment doesn't complete within timeout
         """
         start_time = datetime.now()
         while (datetime.now() - start_time).seconds < timeout:
@@ -215,11 +229,11 @@ class VercelService:
                 return deployment
 
             if deployment.state in [DeploymentState.ERROR, DeploymentState.CANCELED]:
-                raise RuntimeError(f"Deployment failed with state: {deployment.state}")
+                raise DeploymentError(f"Deployment failed with state: {deployment.state}")
 
             await asyncio.sleep(poll_interval)
 
-        raise TimeoutError(
+        raise DeploymentTimeoutError(
             f"Deployment {deployment_id} did not complete within {timeout} seconds"
         )
 
@@ -282,6 +296,7 @@ class VercelService:
             List of domain names
 
         Raises:
+            DeploymentResponseError: If the Vercel response cannot be parsed
             httpx.HTTPError: If retrieval fails
         """
         try:
@@ -304,6 +319,8 @@ class VercelService:
                 "Failed to get domains", error=str(e), project_id=project_id
             )
             raise
+        except (KeyError, TypeError, ValueError) as e:
+            raise DeploymentResponseError(f"Unexpected Vercel API response: {e!r}") from e
 
     async def create_project(
         self,
@@ -326,6 +343,7 @@ class VercelService:
             VercelProject model
 
         Raises:
+            DeploymentResponseError: If the Vercel response cannot be parsed
             httpx.HTTPError: If project creation fails
         """
         try:
@@ -364,6 +382,8 @@ class VercelService:
         except httpx.HTTPError as e:
             logger.error("Failed to create project", error=str(e), name=name)
             raise
+        except (KeyError, TypeError, ValueError) as e:
+            raise DeploymentResponseError(f"Unexpected Vercel API response: {e!r}") from e
 
     async def _prepare_files(self, source_path: str) -> list[dict[str, str]]:
         """Prepare files for deployment.
@@ -378,7 +398,7 @@ class VercelService:
         source = Path(source_path)
 
         if not source.exists():
-            raise FileNotFoundError(f"Source path does not exist: {source_path}")
+            raise SourcePathNotFoundError(f"Source path does not exist: {source_path}")
 
         # Walk through directory and prepare files
         for file_path in source.rglob("*"):
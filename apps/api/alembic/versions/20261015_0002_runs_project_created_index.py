@@ -0,0 +1,24 @@
+"""Add composite index for listing runs by project.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_runs_project_id_created_at", "runs", ["project_id", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_runs_project_id_created_at", table_name="runs")
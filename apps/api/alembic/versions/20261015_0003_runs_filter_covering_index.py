@@ -0,0 +1,33 @@
+"""Add covering index for filtered run listings.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_runs_filter",
+            "runs",
+            ["project_id", "status", "run_type", "created_at", "id"],
+            postgresql_include=["workflow_id", "tokens_used", "cost_incurred", "updated_at"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_runs_filter", table_name="runs", postgresql_concurrently=True)
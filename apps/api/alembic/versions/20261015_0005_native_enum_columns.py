@@ -0,0 +1,83 @@
+"""Store status and type columns as native Postgres enums.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type name, values)
+ENUM_COLUMNS = [
+    (
+        "projects",
+        "status",
+        "project_status",
+        (
+            "ideation", "validation", "development", "deployment",
+            "monetizing", "paused", "failed",
+        ),
+    ),
+    (
+        "runs",
+        "status",
+        "run_status",
+        (
+            "pending", "running", "completed", "failed", "cancelling",
+            "cancelled", "cancel_failed", "paused",
+        ),
+    ),
+    (
+        "runs",
+        "run_type",
+        "run_type",
+        ("genesis", "build", "test", "deploy", "monetize"),
+    ),
+    (
+        "artifacts",
+        "artifact_type",
+        "artifact_type",
+        (
+            "prd", "architecture", "task_graph", "source_code", "test_results",
+            "build_log", "deployment_log", "spec",
+        ),
+    ),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table, column, type_name, values in ENUM_COLUMNS:
+        enum_type = postgresql.ENUM(*values, name=type_name)
+        enum_type.create(bind, checkfirst=True)
+        # Rewrites the column and rebuilds its indexes (including ix_runs_filter)
+        op.alter_column(
+            table,
+            column,
+            type_=enum_type,
+            existing_nullable=False,
+            postgresql_using=f"{column}::{type_name}",
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table, column, type_name, _values in reversed(ENUM_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(50),
+            existing_nullable=False,
+            postgresql_using=f"{column}::text",
+        )
+        postgresql.ENUM(name=type_name).drop(bind, checkfirst=True)
@@ -0,0 +1,47 @@
+"""Replace single-column project_id indexes with composite ones.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_artifacts_project_type_version",
+            "artifacts",
+            ["project_id", "artifact_type", "version"],
+            postgresql_concurrently=True,
+        )
+        # Both are leading-column prefixes of composite indexes now
+        op.drop_index(
+            "ix_artifacts_project_id", table_name="artifacts", postgresql_concurrently=True
+        )
+        op.drop_index("ix_runs_project_id", table_name="runs", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_runs_project_id", "runs", ["project_id"], postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_artifacts_project_id", "artifacts", ["project_id"], postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_artifacts_project_type_version",
+            table_name="artifacts",
+            postgresql_concurrently=True,
+        )
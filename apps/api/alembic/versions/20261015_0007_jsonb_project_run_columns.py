@@ -0,0 +1,48 @@
+"""Store project and run JSON columns as JSONB.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = [
+    ("projects", "tech_stack"),
+    ("projects", "architecture"),
+    ("runs", "input_data"),
+    ("runs", "output_data"),
+    ("runs", "model_routing"),
+]
+
+
+def upgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSON(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using=f"{column}::json",
+        )
@@ -0,0 +1,40 @@
+"""Add server-side defaults for status, counter and budget columns.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, server default); metadata-only changes, no table rewrite
+SERVER_DEFAULTS = [
+    ("projects", "status", sa.text("'ideation'")),
+    ("projects", "budget_limit", sa.text("10.0")),
+    ("projects", "budget_spent", sa.text("0")),
+    ("runs", "status", sa.text("'pending'")),
+    ("runs", "tokens_used", sa.text("0")),
+    ("runs", "cost_incurred", sa.text("0")),
+    ("artifacts", "version", sa.text("1")),
+    ("artifacts", "mime_type", sa.text("'text/plain'")),
+    ("artifacts", "size_bytes", sa.text("0")),
+]
+
+
+def upgrade() -> None:
+    for table, column, default in SERVER_DEFAULTS:
+        op.alter_column(table, column, server_default=default)
+
+
+def downgrade() -> None:
+    for table, column, _default in SERVER_DEFAULTS:
+        op.alter_column(table, column, server_default=None)
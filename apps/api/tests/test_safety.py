@@ -186,6 +186,23 @@ class TestBudgetTracker:
         # Cleanup
         await tracker.delete_budget("test-run-4")
 
+    @pytest.mark.asyncio
+    async def test_check_and_status(self, tracker):
+        """Test combined spend check and status read."""
+        await tracker.create_budget("test-run-7", 10.0)
+        await tracker.spend("test-run-7", 7.0)
+
+        can_spend, status = await tracker.check_and_status("test-run-7", 5.0)
+        assert can_spend is False
+        assert status.spent == 7.0
+        assert status.remaining == 3.0
+
+        with pytest.raises(ValueError, match="not found"):
+            await tracker.check_and_status("nonexistent-run", 1.0)
+
+        # Cleanup
+        await tracker.delete_budget("test-run-7")
+
     @pytest.mark.asyncio
     async def test_invalid_budget_limit(self, tracker):
         """Test that invalid budget limits are rejected."""